@@ -106,6 +106,11 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Write a timeline of the startup to CONFIG/startup_timeline.json",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -204,6 +209,7 @@ def main() -> int:
         recovery_mode=args.recovery_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        profile_startup=args.profile_startup,
         safe_mode=safe_mode,
     )
 
@@ -88,6 +88,11 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.startup_timeline import (
+    CATEGORY_STAGE,
+    async_setup_timeline,
+    timeline_span,
+)
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
@@ -277,6 +282,9 @@ async def async_setup_hass(
         if runtime_config.debug or hass.loop.get_debug():
             hass.config.debug = True
 
+        if runtime_config.profile_startup:
+            async_setup_timeline(hass)
+
         hass.config.safe_mode = runtime_config.safe_mode
         hass.config.skip_pip = runtime_config.skip_pip
         hass.config.skip_pip_packages = runtime_config.skip_pip_packages
@@ -456,7 +464,8 @@ async def async_from_config_dict(
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
-    await async_load_base_functionality(hass)
+    with timeline_span(hass, "base functionality", CATEGORY_STAGE):
+        await async_load_base_functionality(hass)
 
     # Set up core.
     _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
@@ -1022,7 +1031,8 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            with timeline_span(hass, name, CATEGORY_STAGE):
+                await async_setup_multi_components(hass, domain_group, config)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1034,7 +1044,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                with timeline_span(hass, "stage 1", CATEGORY_STAGE):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1050,7 +1061,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                with timeline_span(hass, "stage 2", CATEGORY_STAGE):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1061,7 +1073,8 @@ async def _async_set_up_integrations(
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+            with timeline_span(hass, "wrap up", CATEGORY_STAGE):
+                await hass.async_block_till_done()
     except TimeoutError:
         _LOGGER.warning(
             "Setup timed out for bootstrap waiting on %s - moving forward",
@@ -76,6 +76,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_enabled,
     trace_get,
     trace_path,
 )
@@ -673,12 +674,13 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
             automation_trace.set_trigger_description(trigger_description)
 
             # Add initial variables as the trigger step
-            if "trigger" in variables and "idx" in variables["trigger"]:
-                trigger_path = f"trigger/{variables['trigger']['idx']}"
-            else:
-                trigger_path = "trigger"
-            trace_element = TraceElement(variables, trigger_path)
-            trace_append_element(trace_element)
+            if trace_enabled():
+                if "trigger" in variables and "idx" in variables["trigger"]:
+                    trigger_path = f"trigger/{variables['trigger']['idx']}"
+                else:
+                    trigger_path = "trigger"
+                trace_element = TraceElement(variables, trigger_path)
+                trace_append_element(trace_element)
 
             if (
                 not skip_condition
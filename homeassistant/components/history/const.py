@@ -5,3 +5,12 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Smallest bucket used when downsampling history
+MIN_BUCKET_SECONDS = 1
+
+# Number of messages pending on the connection after which streamed history
+# waits for the client to catch up before the next chunk is fetched
+STREAM_MAX_PENDING_MESSAGES = 4
+# Seconds between checks if the client caught up with the streamed history
+STREAM_PENDING_CHECK_INTERVAL = 0.1
@@ -7,6 +7,7 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
+import threading
 from typing import Any, cast
 
 import voluptuous as vol
@@ -35,10 +36,16 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.async_ import create_eager_task, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    MAX_PENDING_HISTORY_STATES,
+    MIN_BUCKET_SECONDS,
+    STREAM_MAX_PENDING_MESSAGES,
+    STREAM_PENDING_CHECK_INTERVAL,
+)
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -93,23 +100,127 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_get_downsampled_states(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    bucket_seconds: float,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+) -> bytes:
+    """Fetch downsampled history and convert it to json in the executor."""
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            history.get_downsampled_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                bucket_seconds,
+                include_start_time_state,
+                significant_changes_only,
+            ),
+        )
+    )
+
+
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    cancel: threading.Event,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Fetch history significant_states and send them in chunks from the executor.
+
+    Each chunk is converted to json in the executor and the next chunk
+    is only fetched once fewer than STREAM_MAX_PENDING_MESSAGES messages
+    are waiting to be sent to the client, so the memory used does not
+    depend on the time period or on how fast the client reads.
+
+    A single database session and query are used for the whole stream,
+    so a slow client keeps the session open until it has received the
+    last chunk or unsubscribes.
+    """
+    for states in history.stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    ):
+        if cancel.is_set():
+            return
+        run_callback_threadsafe(
+            hass.loop,
+            connection.send_message,
+            json_bytes(messages.event_message(msg_id, {"states": states})),
+        ).result()
+        # Wait for a slow client to catch up; the cancel event is also set
+        # when the client unsubscribes or the connection is closed
+        while connection.pending_messages() >= STREAM_MAX_PENDING_MESSAGES:
+            if cancel.wait(STREAM_PENDING_CHECK_INTERVAL):
+                return
+
+
+@callback
+def _async_send_empty_history(
+    connection: ActiveConnection, msg_id: int, stream: bool
+) -> None:
+    """Send an empty history response."""
+    connection.send_result(msg_id, {})
+    if stream:
+        connection.send_event(msg_id, {"states": {}, "complete": True})
+
+
+def _validate_history_mode(msg: dict[str, Any]) -> dict[str, Any]:
+    """Validate history is not both streamed and reduced to buckets."""
+    if msg["stream"] and ("buckets" in msg or "resolution" in msg):
+        raise vol.Invalid("stream cannot be used with buckets or resolution")
+    return msg
+
+
 @websocket_api.websocket_command(
-    {
-        vol.Required("type"): "history/history_during_period",
-        vol.Required("start_time"): str,
-        vol.Optional("end_time"): str,
-        vol.Required("entity_ids"): [str],
-        vol.Optional("include_start_time_state", default=True): bool,
-        vol.Optional("significant_changes_only", default=True): bool,
-        vol.Optional("minimal_response", default=False): bool,
-        vol.Optional("no_attributes", default=False): bool,
-    }
+    vol.All(
+        vol.Schema(
+            {
+                vol.Required("type"): "history/history_during_period",
+                vol.Required("start_time"): str,
+                vol.Optional("end_time"): str,
+                vol.Required("entity_ids"): [str],
+                vol.Optional("include_start_time_state", default=True): bool,
+                vol.Optional("significant_changes_only", default=True): bool,
+                vol.Optional("minimal_response", default=False): bool,
+                vol.Optional("no_attributes", default=False): bool,
+                vol.Optional("stream", default=False): bool,
+                vol.Exclusive("buckets", "buckets"): vol.All(int, vol.Range(min=1)),
+                vol.Exclusive("resolution", "buckets"): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, min_included=False)
+                ),
+            }
+        ),
+        _validate_history_mode,
+    )
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle history during period websocket command."""
+    msg_id: int = msg["id"]
+    stream: bool = msg["stream"]
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
 
@@ -129,7 +240,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg_id, stream)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -152,17 +263,69 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg_id, stream)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if "buckets" in msg or "resolution" in msg:
+        if (bucket_seconds := msg.get("resolution")) is None:
+            bucket_seconds = (
+                (end_time or dt_util.utcnow()) - start_time
+            ).total_seconds() / msg["buckets"]
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_get_downsampled_states,
+                hass,
+                msg_id,
+                start_time,
+                end_time,
+                entity_ids,
+                max(bucket_seconds, MIN_BUCKET_SECONDS),
+                include_start_time_state,
+                significant_changes_only,
+            )
+        )
+        return
+
+    if stream:
+        cancel = threading.Event()
+        connection.subscriptions[msg_id] = cancel.set
+        connection.send_result(msg_id)
+        try:
+            await get_instance(hass).async_add_executor_job(
+                _ws_stream_significant_states,
+                hass,
+                connection,
+                msg_id,
+                cancel,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        except Exception:
+            _LOGGER.exception("Error streaming the history of %s", entity_ids)
+            if connection.subscriptions.pop(msg_id, None) is not None:
+                connection.send_error(
+                    msg_id,
+                    websocket_api.ERR_UNKNOWN_ERROR,
+                    "Error streaming the history",
+                )
+            return
+        if connection.subscriptions.pop(msg_id, None) is not None:
+            connection.send_event(msg_id, {"states": {}, "complete": True})
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
             hass,
-            msg["id"],
+            msg_id,
             start_time,
             end_time,
             entity_ids,
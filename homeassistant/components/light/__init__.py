@@ -643,16 +643,20 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
         else:
             await light.async_turn_on(**filter_turn_on_params(light, params))
 
-    async def async_handle_light_off_service(
-        light: LightEntity, call: ServiceCall
-    ) -> None:
-        """Handle turning off a light."""
+    def light_off_params(light: LightEntity, call: ServiceCall) -> dict[str, Any]:
+        """Return the keyword arguments to turn off a light."""
         params = dict(call.data["params"])
 
         if ATTR_TRANSITION not in params:
             profiles.apply_default(light.entity_id, True, params)
 
-        await light.async_turn_off(**filter_turn_off_params(light, params))
+        return filter_turn_off_params(light, params)
+
+    async def async_handle_light_off_service(
+        light: LightEntity, call: ServiceCall
+    ) -> None:
+        """Handle turning off a light."""
+        await light.async_turn_off(**light_off_params(light, call))
 
     async def async_handle_toggle_service(
         light: LightEntity, call: ServiceCall
@@ -675,6 +679,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
         SERVICE_TURN_OFF,
         vol.All(cv.make_entity_service_schema(LIGHT_TURN_OFF_SCHEMA), preprocess_data),
         async_handle_light_off_service,
+        entity_params=light_off_params,
     )
 
     component.async_register_entity_service(
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable, Iterator
 import contextlib
 from dataclasses import dataclass
 from functools import lru_cache, partial
@@ -267,12 +267,121 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _SubscriptionTrieNode:
+    """A single topic level in the subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: dict[Subscription, None] = {}
+
+
+class SubscriptionTrie:
+    """Prefix tree of wildcard subscriptions keyed by topic level.
+
+    Matching a topic walks the trie one level at a time, following the
+    literal level, the `+` child and any terminal `#` child, so the cost
+    depends on the depth of the topic instead of the number of subscriptions.
+    Matches are returned in the order the subscriptions were added.
+    """
+
+    __slots__ = ("_root", "_order", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+        self._order: dict[Subscription, int] = {}
+        self._sequence = 0
+
+    def __contains__(self, subscription: Subscription) -> bool:
+        """Return if the subscription is tracked."""
+        return subscription in self._order
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions in insertion order."""
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        """Return the number of tracked subscriptions."""
+        return len(self._order)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        if subscription in self._order:
+            return
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions[subscription] = None
+        self._order[subscription] = self._sequence
+        self._sequence += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie.
+
+        Raises KeyError if the subscription is not tracked.
+        """
+        del self._order[subscription]
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.subscriptions[subscription]
+        # Prune the levels that no longer lead to any subscription
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.subscriptions:
+                break
+            del parent.children[level]
+
+    def has_topic_filter(self, topic: str) -> bool:
+        """Return if there is a subscription for exactly this topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching the topic.
+
+        Topics starting with `$` are not matched by a wildcard
+        on the first level, in line with the MQTT specification.
+        """
+        levels = topic.split("/")
+        depth = len(levels)
+        normal = not topic.startswith("$")
+        matches: list[Subscription] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            wildcards_allowed = normal or idx > 0
+            if wildcards_allowed and (multi := children.get("#")) is not None:
+                matches.extend(multi.subscriptions)
+            if idx == depth:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[idx])) is not None:
+                stack.append((child, idx + 1))
+            if wildcards_allowed and (single := children.get("+")) is not None:
+                stack.append((single, idx + 1))
+        if len(matches) > 1:
+            matches.sort(key=self._order.__getitem__)
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -376,9 +485,9 @@ class MQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        # To ensure the wildcard subscriptions order is preserved, we use a dict
-        # with `None` values instead of a set.
-        self._wildcard_subscriptions: dict[Subscription, None] = {}
+        # The wildcard subscriptions are kept in a topic trie which
+        # preserves the order in which the subscriptions were added.
+        self._wildcard_subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -626,8 +735,9 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions
+            or self._wildcard_subscriptions.has_topic_filter(topic)
         )
 
     async def async_publish(
@@ -759,7 +869,7 @@ class MQTT:
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
-            self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -777,7 +887,7 @@ class MQTT:
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
             else:
-                del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscriptions.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -848,9 +958,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1062,13 +1171,8 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions.matches(topic))
         return subscriptions
 
     @callback
@@ -1264,13 +1368,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
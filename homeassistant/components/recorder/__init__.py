@@ -38,6 +38,7 @@ from . import (
 )
 from .const import (  # noqa: F401
     CONF_DB_INTEGRITY_CHECK,
+    DEFAULT_PURGE_MAX_SLICE_LATENCY,
     DOMAIN,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_METHODS,
@@ -61,11 +62,14 @@ DEFAULT_COMMIT_INTERVAL = 5
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
+CONF_BULK_STATE_WRITES = "bulk_state_writes"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
+CONF_PURGE_MAX_SLICE_LATENCY = "purge_max_slice_latency"
+CONF_PARTITION_TABLES = "partition_tables"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
 
@@ -107,6 +111,10 @@ CONFIG_SCHEMA = vol.Schema(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
+                    vol.Optional(
+                        CONF_PURGE_MAX_SLICE_LATENCY,
+                        default=DEFAULT_PURGE_MAX_SLICE_LATENCY,
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
@@ -120,6 +128,8 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_BULK_STATE_WRITES, default=False): cv.boolean,
+                    vol.Optional(CONF_PARTITION_TABLES, default=False): cv.boolean,
                 }
             ),
         )
@@ -170,6 +180,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        bulk_state_writes=conf[CONF_BULK_STATE_WRITES],
+        purge_max_slice_latency=conf[CONF_PURGE_MAX_SLICE_LATENCY],
+        partition_tables=conf[CONF_PARTITION_TABLES],
     )
     get_instance.cache_clear()
     instance.async_initialize()
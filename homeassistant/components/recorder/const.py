@@ -30,6 +30,10 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
+# The default maximum time in seconds a purge slice may hold the recorder
+# thread, the next slice is queued after the same time has passed
+DEFAULT_PURGE_MAX_SLICE_LATENCY = 1.0
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
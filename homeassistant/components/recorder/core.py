@@ -39,6 +39,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -52,6 +53,7 @@ from homeassistant.util.event_type import EventType
 from . import migration, statistics
 from .const import (
     DB_WORKER_PREFIX,
+    DEFAULT_PURGE_MAX_SLICE_LATENCY,
     DOMAIN,
     KEEPALIVE_TIME,
     LAST_REPORTED_SCHEMA_VERSION,
@@ -79,12 +81,15 @@ from .db_schema import (
 )
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
+from .partition import create_upcoming_partitions
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
+from .table_managers.states_bulk import BulkStatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -164,6 +169,9 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_state_writes: bool = False,
+        purge_max_slice_latency: float = DEFAULT_PURGE_MAX_SLICE_LATENCY,
+        partition_tables: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -199,13 +207,18 @@ class Recorder(threading.Thread):
         # by is_entity_recorder and the sensor recorder.
         self.entity_filter = entity_filter
         self.exclude_event_types = exclude_event_types
+        self.bulk_state_writes = bulk_state_writes
+        self.purge_max_slice_latency = purge_max_slice_latency
+        self.partition_tables = partition_tables
 
         self.schema_version = 0
         self._commits_without_expire = 0
+        self.purge_progress = PurgeProgress()
         self._event_session_has_pending_writes = False
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
+        self.bulk_states_manager = BulkStatesManager(self)
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
@@ -227,6 +240,7 @@ class Recorder(threading.Thread):
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
+        self._queue_later_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
         self.enabled = True
 
@@ -269,6 +283,31 @@ class Recorder(threading.Thread):
         """Add a task to the recorder queue."""
         self._queue.put(task)
 
+    def queue_task_later(self, task: RecorderTask, delay: float) -> None:
+        """Add a task to the recorder queue after delay seconds.
+
+        This is called from the recorder thread.
+        """
+        self.hass.loop.call_soon_threadsafe(self._async_queue_task_later, task, delay)
+
+    @callback
+    def _async_queue_task_later(self, task: RecorderTask, delay: float) -> None:
+        """Schedule adding a task to the recorder queue."""
+        if self.hass.is_stopping:
+            # Home Assistant is shutting down
+            return
+
+        @callback
+        def _async_queue_task(_now: datetime) -> None:
+            self._queue_later_listener = None
+            self.queue_task(task)
+
+        if self._queue_later_listener:
+            self._queue_later_listener()
+        self._queue_later_listener = async_call_later(
+            self.hass, delay, _async_queue_task
+        )
+
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
         self.enabled = enable
@@ -418,6 +457,9 @@ class Recorder(threading.Thread):
         if self._periodic_listener:
             self._periodic_listener()
             self._periodic_listener = None
+        if self._queue_later_listener:
+            self._queue_later_listener()
+            self._queue_later_listener = None
 
     async def _async_close(self, event: Event) -> None:
         """Empty the queue if its still present at close."""
@@ -1077,6 +1119,16 @@ class Recorder(threading.Thread):
         """Process a state_changed event into the session."""
         state_attributes_manager = self.state_attributes_manager
         states_meta_manager = self.states_meta_manager
+        if self.bulk_state_writes and states_meta_manager.active:
+            # States are buffered and written with executemany at commit
+            if shared_attrs_bytes := state_attributes_manager.serialize_from_event(
+                event
+            ):
+                self.bulk_states_manager.add_event(event, shared_attrs_bytes)
+                self._event_session_has_pending_writes = True
+            else:
+                self.bulk_states_manager.discard_event(event)
+            return
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
@@ -1199,6 +1251,7 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        self.bulk_states_manager.flush(session)
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1249,6 +1302,7 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self.states_manager.reset()
+        self.bulk_states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
@@ -1428,10 +1482,13 @@ class Recorder(threading.Thread):
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
+        if self.partition_tables:
+            migration.partition_tables(self, self.get_session)
         with session_scope(session=self.get_session()) as session:
             end_incomplete_runs(session, self.recorder_runs_manager.recording_start)
             self.recorder_runs_manager.start(session)
             self.states_manager.load_from_db(session)
+            create_upcoming_partitions(self, session)
 
         self._open_event_session()
 
@@ -2,36 +2,99 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
+import homeassistant.util.dt as dt_util
 
 from ..filters import Filters
-from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS, STREAM_CHUNK_STATES
+from .downsample import downsample_entity_states
 from .modern import (
+    get_downsampled_states as _modern_get_downsampled_states,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    stream_significant_states as _modern_stream_significant_states,
 )
 
 # These are the APIs of this package
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "get_downsampled_states",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "stream_significant_states",
 ]
 
 
+def get_downsampled_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    bucket_seconds: float,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the significant states during a time period reduced to buckets."""
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        start_time_ts = start_time.timestamp()
+        end_time_ts = (end_time or dt_util.utcnow()).timestamp()
+        return {
+            entity_id: downsample_entity_states(
+                (
+                    (
+                        state[COMPRESSED_STATE_STATE],
+                        state[COMPRESSED_STATE_LAST_UPDATED],
+                    )
+                    for state in cast(list[dict[str, Any]], entity_states)
+                ),
+                start_time_ts,
+                end_time_ts,
+                bucket_seconds,
+            )
+            for entity_id, entity_states in _legacy_get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                False,
+                True,
+                True,
+            ).items()
+            if entity_states
+        }
+    return _modern_get_downsampled_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        bucket_seconds,
+        include_start_time_state,
+        significant_changes_only,
+    )
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -152,6 +215,56 @@ def get_significant_states_with_session(
     )
 
 
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_STATES,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Yield the significant states during a time period in chunks."""
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        # The legacy schema does not support streaming so
+        # all states are returned in a single chunk
+        if states := {
+            entity_id: entity_states
+            for entity_id, entity_states in _legacy_get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            ).items()
+            if entity_states
+        }:
+            yield cast(dict[str, list[dict[str, Any]]], states)
+        return
+    yield from _modern_stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        chunk_size,
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -19,3 +19,11 @@ NEED_ATTRIBUTE_DOMAINS = {
     "thermostat",
     "water_heater",
 }
+
+# Number of states converted before a chunk is yielded when streaming
+STREAM_CHUNK_STATES = 5000
+
+# Keys of the numeric aggregates in a downsampled state
+DOWNSAMPLED_MIN = "min"
+DOWNSAMPLED_MAX = "max"
+DOWNSAMPLED_MEAN = "mean"
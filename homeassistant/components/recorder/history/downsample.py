@@ -0,0 +1,133 @@
+"""Reduce history states to fixed size time buckets."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import math
+from typing import Any
+
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+
+from .const import DOWNSAMPLED_MAX, DOWNSAMPLED_MEAN, DOWNSAMPLED_MIN
+
+
+def _numeric_value(state: str | None) -> float | None:
+    """Return the value of a numeric state or None."""
+    if state is None:
+        return None
+    try:
+        value = float(state)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+class _Bucket:
+    """Aggregate the states of one bucket."""
+
+    __slots__ = (
+        "accumulated",
+        "maximum",
+        "minimum",
+        "seconds",
+        "start_ts",
+        "state",
+        "value",
+        "value_ts",
+    )
+
+    def __init__(self, start_ts: float, value: float | None) -> None:
+        """Initialize a bucket with the numeric value in effect at its start."""
+        self.start_ts = start_ts
+        self.state: str | None = None
+        self.value = value
+        self.value_ts = start_ts
+        self.accumulated = 0.0
+        self.seconds = 0.0
+        self.minimum = self.maximum = value
+
+    def _hold_value_until(self, timestamp: float) -> None:
+        """Weight the current value by how long it was held."""
+        if self.value is not None and (duration := timestamp - self.value_ts) > 0:
+            self.accumulated += self.value * duration
+            self.seconds += duration
+
+    def add_state(self, state: str | None, timestamp: float) -> None:
+        """Add a state which changed at timestamp."""
+        self._hold_value_until(timestamp)
+        self.state = state
+        self.value = value = _numeric_value(state)
+        self.value_ts = timestamp
+        if value is None:
+            return
+        if self.minimum is None or self.maximum is None:
+            self.minimum = self.maximum = value
+        else:
+            self.minimum = min(self.minimum, value)
+            self.maximum = max(self.maximum, value)
+
+    def as_compressed_state(self, end_ts: float) -> dict[str, Any]:
+        """Return the bucket as a compressed state, ending at end_ts."""
+        self._hold_value_until(end_ts)
+        comp_state: dict[str, Any] = {
+            COMPRESSED_STATE_STATE: self.state,
+            COMPRESSED_STATE_LAST_UPDATED: self.start_ts,
+        }
+        if self.minimum is None or self.maximum is None:
+            return comp_state
+        if self.seconds:
+            mean = self.accumulated / self.seconds
+        else:
+            # The numeric states changed at the end of the time period,
+            # so they were not held for any time
+            mean = self.maximum if self.value is None else self.value
+        comp_state[DOWNSAMPLED_MIN] = self.minimum
+        comp_state[DOWNSAMPLED_MAX] = self.maximum
+        comp_state[DOWNSAMPLED_MEAN] = mean
+        return comp_state
+
+
+def downsample_entity_states(
+    states: Iterable[tuple[str | None, float]],
+    start_time_ts: float,
+    end_time_ts: float,
+    bucket_seconds: float,
+) -> list[dict[str, Any]]:
+    """Reduce the states of one entity to one compressed state per bucket.
+
+    The states are (state, last_updated_ts) pairs sorted by
+    last_updated_ts. States before start_time_ts, such as the start
+    time state, are counted in the first bucket.
+
+    Each bucket that has states returns the last state with the start
+    of the bucket as last_updated. If the entity had a numeric state
+    during the bucket, the min, max and mean of the numeric states are
+    added too, including the state carried over from the previous
+    bucket. Like the mean of the statistics, the mean is weighted by
+    how long each state was held; time with a non-numeric state, such
+    as unavailable, is not counted.
+    """
+    result: list[dict[str, Any]] = []
+    bucket: _Bucket | None = None
+    bucket_idx = -1
+    for state, last_updated_ts in states:
+        if (
+            idx := max(int((last_updated_ts - start_time_ts) // bucket_seconds), 0)
+        ) != bucket_idx:
+            value: float | None = None
+            if bucket is not None:
+                result.append(
+                    bucket.as_compressed_state(bucket.start_ts + bucket_seconds)
+                )
+                value = bucket.value
+            bucket_idx = idx
+            bucket = _Bucket(start_time_ts + idx * bucket_seconds, value)
+        assert bucket is not None
+        bucket.add_state(state, max(last_updated_ts, start_time_ts))
+    if bucket is not None:
+        result.append(
+            bucket.as_compressed_state(
+                min(bucket.start_ts + bucket_seconds, end_time_ts)
+            )
+        )
+    return result
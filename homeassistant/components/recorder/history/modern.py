@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -21,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -47,7 +48,9 @@ from .const import (
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
     STATE_KEY,
+    STREAM_CHUNK_STATES,
 )
+from .downsample import downsample_entity_states
 
 _FIELD_MAP = {
     "metadata_id": 0,
@@ -204,34 +207,21 @@ def _significant_states_stmt(
     ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
 
 
-def get_significant_states_with_session(
+def _significant_states_query(
     hass: HomeAssistant,
     session: Session,
     start_time: datetime,
-    end_time: datetime | None = None,
-    entity_ids: list[str] | None = None,
-    filters: Filters | None = None,
-    include_start_time_state: bool = True,
-    significant_changes_only: bool = True,
-    minimal_response: bool = False,
-    no_attributes: bool = False,
-    compressed_state_format: bool = False,
-) -> dict[str, list[State | dict[str, Any]]]:
-    """Return states changes during UTC period start_time - end_time.
-
-    entity_ids is an optional iterable of entities to include in the results.
-
-    filters is an optional SQLAlchemy filter which will be applied to the database
-    queries unless entity_ids is given, in which case its ignored.
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Return the significant states statement for the entities.
 
-    Significant states are all states where there is a state change,
-    as well as all states from certain domains (for instance
-    thermostat so that we get current temperature in our graphs).
+    Also returns the entity_id to metadata_id map and the start time
+    timestamp if the start time state is included.
     """
-    if filters is not None:
-        raise NotImplementedError("Filters are no longer supported")
-    if not entity_ids:
-        raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -240,7 +230,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -278,9 +268,58 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
+    return (
+        stmt,
+        entity_id_to_metadata_id,
+        start_time_ts if include_start_time_state else None,
+    )
+
+
+def get_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Return states changes during UTC period start_time - end_time.
+
+    entity_ids is an optional iterable of entities to include in the results.
+
+    filters is an optional SQLAlchemy filter which will be applied to the database
+    queries unless entity_ids is given, in which case its ignored.
+
+    Significant states are all states where there is a state change,
+    as well as all states from certain domains (for instance
+    thermostat so that we get current temperature in our graphs).
+    """
+    if filters is not None:
+        raise NotImplementedError("Filters are no longer supported")
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = query
     return _sorted_states_to_dict(
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
+        start_time_ts,
         entity_ids,
         entity_id_to_metadata_id,
         minimal_response,
@@ -289,6 +328,206 @@ def get_significant_states_with_session(
     )
 
 
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_STATES,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Wrap stream_significant_states_with_session with an sql session."""
+    with session_scope(hass=hass, read_only=True) as session:
+        yield from stream_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            chunk_size,
+        )
+
+
+def stream_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_STATES,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Yield the significant states during a time period in chunks.
+
+    This returns the same compressed states as
+    get_significant_states_with_session, but the rows are fetched
+    from the database with yield_per and at most chunk_size states
+    are converted before they are yielded, so memory use does not
+    grow with the length of the time period.
+
+    Each chunk maps entity_ids to the next states for that entity.
+    The query stays open on the session until the generator is
+    exhausted or closed.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return
+    stmt, entity_id_to_metadata_id, start_time_ts = query
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    rows = session.connection().execute(
+        stmt, execution_options={"yield_per": chunk_size}
+    )
+    chunk: dict[str, list[dict[str, Any]]] = {}
+    chunk_len = 0
+    for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        # With minimal response only the first state has attributes
+        # and states that did not change are skipped, see
+        # _sorted_states_to_dict
+        minimal = (
+            minimal_response
+            and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+        )
+        prev_state: str | None = None
+        first = True
+        for row in group:
+            state = row[state_idx]
+            if first or not minimal:
+                comp_state = row_to_compressed_state(
+                    row,
+                    attr_cache,
+                    start_time_ts,
+                    entity_id,
+                    state,
+                    row[last_updated_ts_idx],
+                    no_attributes if minimal else False,
+                )
+                first = False
+            elif state == prev_state:
+                continue
+            else:
+                comp_state = {
+                    COMPRESSED_STATE_STATE: state,
+                    COMPRESSED_STATE_LAST_UPDATED: row[last_updated_ts_idx],
+                }
+            prev_state = state
+            if (ent_states := chunk.get(entity_id)) is None:
+                ent_states = chunk[entity_id] = []
+            ent_states.append(comp_state)
+            chunk_len += 1
+            if chunk_len >= chunk_size:
+                yield chunk
+                chunk = {}
+                chunk_len = 0
+    if chunk:
+        yield chunk
+
+
+def get_downsampled_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    bucket_seconds: float,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, list[dict[str, Any]]]:
+    """Wrap get_downsampled_states_with_session with an sql session."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return get_downsampled_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            bucket_seconds,
+            include_start_time_state,
+            significant_changes_only,
+        )
+
+
+def get_downsampled_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    bucket_seconds: float,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the significant states reduced to buckets of bucket_seconds.
+
+    The rows are read without attributes with yield_per and reduced as
+    they are fetched, so only one compressed state per bucket is created.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            True,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, _ = query
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    start_time_ts = start_time.timestamp()
+    end_time_ts = (end_time or dt_util.utcnow()).timestamp()
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    rows = session.connection().execute(
+        stmt, execution_options={"yield_per": STREAM_CHUNK_STATES}
+    )
+    return {
+        metadata_id_to_entity_id[metadata_id]: downsample_entity_states(
+            (
+                (row[state_idx], row[last_updated_ts_idx] or start_time_ts)
+                for row in group
+            ),
+            start_time_ts,
+            end_time_ts,
+            bucket_seconds,
+        )
+        for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"]))
+    }
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -6,7 +6,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable
 import contextlib
 from dataclasses import dataclass, replace as dataclass_replace
-from datetime import timedelta
+from datetime import UTC, datetime, time as dt_time, timedelta
 import logging
 from time import time
 from typing import TYPE_CHECKING, Any, cast, final
@@ -30,6 +30,7 @@ from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
@@ -82,6 +83,7 @@ from .db_schema import (
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
+from .partition import PARTITIONED_TABLES, create_upcoming_partitions, is_partitioned
 from .queries import (
     batch_cleanup_entity_ids,
     delete_duplicate_short_term_statistics_row,
@@ -2398,6 +2400,88 @@ def initialize_database(session_maker: Callable[[], Session]) -> bool:
         return False
 
 
+def _partition_table_statements(
+    table: Table, column: str, first_upper_bound: float
+) -> list[str]:
+    """Return the statements that partition a table by range of column.
+
+    The rows are copied to a new table with an initial partition for
+    the rows before first_upper_bound. The primary key has to include
+    the partition column and the identity of id is replaced by a
+    sequence, which PostgreSQL does not support on partitioned tables.
+    """
+    name = table.name
+    old = f"{name}_unpartitioned"
+    seq = f"{name}_partitioned_id_seq"
+    statements = [
+        f'ALTER TABLE "{name}" RENAME TO "{old}"',
+        f'ALTER INDEX "{name}_pkey" RENAME TO "{old}_pkey"',
+        f'CREATE SEQUENCE "{seq}" AS bigint',
+        f'CREATE TABLE "{name}" (LIKE "{old}" INCLUDING DEFAULTS, '
+        f"PRIMARY KEY (id, {column})) PARTITION BY RANGE ({column})",
+        f"ALTER TABLE \"{name}\" ALTER COLUMN id SET DEFAULT nextval('{seq}')",
+        f'ALTER SEQUENCE "{seq}" OWNED BY "{name}".id',
+        f'CREATE TABLE "{name}_initial" PARTITION OF "{name}" '
+        f"FOR VALUES FROM (MINVALUE) TO ({first_upper_bound!r})",
+        f'INSERT INTO "{name}" SELECT * FROM "{old}"',  # noqa: S608
+        f"SELECT setval('{seq}', "  # noqa: S608
+        f'(SELECT COALESCE(MAX(id), 0) + 1 FROM "{name}"), false)',
+        f'DROP TABLE "{old}"',
+    ]
+    # The indexes are created once the rows are copied
+    statements.extend(
+        f"CREATE {'UNIQUE ' if index.unique else ''}INDEX \"{index.name}\" "
+        f'ON "{name}" ({", ".join(col.name for col in index.columns)})'
+        for index in sorted(table.indexes, key=lambda index: str(index.name))
+    )
+    statements.extend(
+        f'ALTER TABLE "{name}" ADD FOREIGN KEY ({fk.parent.name}) '
+        f'REFERENCES "{fk.column.table.name}" ({fk.column.name})'
+        + (f" ON DELETE {fk.ondelete}" if fk.ondelete else "")
+        for fk in table.foreign_keys
+    )
+    return statements
+
+
+def partition_tables(instance: Recorder, session_maker: Callable[[], Session]) -> None:
+    """Partition the tables whose partitions are managed by the recorder.
+
+    This is only done if the partition_tables option is set and only
+    on PostgreSQL, tables that are already partitioned are left alone.
+    Each table is partitioned in a single transaction, if it fails the
+    table is left as it was.
+    """
+    if instance.dialect_name != SupportedDialect.POSTGRESQL:
+        _LOGGER.warning("Partitioning tables is only supported with PostgreSQL")
+        return
+    # The initial partition holds the existing rows up to the next midnight
+    first_upper_bound = datetime.combine(
+        (dt_util.utcnow() + timedelta(days=1)).date(), dt_time(), UTC
+    ).timestamp()
+    for name, column in PARTITIONED_TABLES.items():
+        with session_scope(session=session_maker(), read_only=True) as session:
+            if is_partitioned(session, name):
+                continue
+        _LOGGER.warning(
+            "The database is about to partition table %s. %s",
+            name,
+            MIGRATION_NOTE_WHILE,
+        )
+        statements = _partition_table_statements(
+            Base.metadata.tables[name], column, first_upper_bound
+        )
+        try:
+            with session_scope(session=session_maker()) as session:
+                for statement in statements:
+                    session.execute(text(statement))
+        except SQLAlchemyError:
+            _LOGGER.exception("Error partitioning table %s", name)
+            continue
+        _LOGGER.warning("Partitioning table %s done", name)
+    with session_scope(session=session_maker()) as session:
+        create_upcoming_partitions(instance, session)
+
+
 @dataclass(slots=True)
 class MigrationTask(RecorderTask):
     """Base class for migration tasks."""
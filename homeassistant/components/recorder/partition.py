@@ -0,0 +1,189 @@
+"""Manage time range partitions of recorder tables."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, time, timedelta
+import logging
+import re
+from typing import TYPE_CHECKING, NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.session import Session
+
+import homeassistant.util.dt as dt_util
+
+from .const import SupportedDialect
+from .db_schema import TABLE_STATISTICS_SHORT_TERM
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+# Tables whose range partitions are managed by the recorder and the
+# timestamp column they are partitioned by.
+#
+# Tables are only partitioned when the partition_tables option is set,
+# see migration.partition_tables, so on a default install no table is
+# partitioned and nothing is done. Only PostgreSQL is supported as MySQL
+# and MariaDB cannot partition by a DOUBLE column and do not allow
+# foreign keys on partitioned tables. The states and events tables are
+# not included as the old_state_id self reference of states cannot be
+# kept on a partitioned table and dropping a partition would leave the
+# shared attributes and event data rows behind that the purge only
+# finds through the rows it deletes.
+#
+# The recorder creates the daily partitions when it starts and the
+# purge drops the partitions that only hold expired rows.
+PARTITIONED_TABLES = {TABLE_STATISTICS_SHORT_TERM: "start_ts"}
+
+# The number of daily partitions that are created ahead of time
+PARTITION_DAYS_AHEAD = 7
+
+_FIND_PARTITIONS = text(
+    "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+    "FROM pg_inherits "
+    "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+    "WHERE parent.relname = :table AND pg_table_is_visible(parent.oid)"
+)
+_IS_PARTITIONED = text(
+    "SELECT relkind = 'p' FROM pg_class "
+    "WHERE relname = :table AND pg_table_is_visible(oid)"
+)
+_RANGE_BOUND_RE = re.compile(
+    r"FOR VALUES FROM \('?([^')]+)'?\) TO \('?([^')]+)'?\)", re.IGNORECASE
+)
+
+
+class Partition(NamedTuple):
+    """A range partition of a table."""
+
+    name: str
+    lower_bound: float
+    upper_bound: float
+
+
+def _parse_bound(value: str) -> float:
+    """Parse a partition bound, MINVALUE and MAXVALUE are unbounded."""
+    if value.upper() == "MINVALUE":
+        return float("-inf")
+    if value.upper() == "MAXVALUE":
+        return float("inf")
+    return float(value)
+
+
+def _supports_partitions(instance: Recorder) -> bool:
+    """Return if the database supports managing partitions."""
+    return (
+        instance.engine is not None
+        and instance.engine.dialect.name == SupportedDialect.POSTGRESQL
+    )
+
+
+def is_partitioned(session: Session, table: str) -> bool:
+    """Return if a PostgreSQL table is partitioned."""
+    return bool(session.execute(_IS_PARTITIONED, {"table": table}).scalar())
+
+
+def get_partitions(session: Session, table: str) -> list[Partition]:
+    """Return the range partitions of a table ordered by their bounds.
+
+    The default partition is not returned and an empty list is returned
+    if the table is not partitioned.
+    """
+    partitions: list[Partition] = []
+    for name, bound in session.execute(_FIND_PARTITIONS, {"table": table}).all():
+        if not (match := _RANGE_BOUND_RE.match(bound)):
+            continue
+        partitions.append(
+            Partition(name, _parse_bound(match.group(1)), _parse_bound(match.group(2)))
+        )
+    partitions.sort(key=lambda partition: partition.lower_bound)
+    return partitions
+
+
+def create_partitions(
+    instance: Recorder, session: Session, table: str, until: datetime
+) -> int:
+    """Create daily partitions of a partitioned table up to until.
+
+    Partitions end at midnight UTC and continue from the upper bound of
+    the last partition, a table without range partitions is left alone.
+
+    Returns the number of partitions created.
+    """
+    if not _supports_partitions(instance) or not (
+        partitions := get_partitions(session, table)
+    ):
+        return 0
+    created = 0
+    upper_bound = partitions[-1].upper_bound
+    until_ts = until.timestamp()
+    while upper_bound < until_ts:
+        start = dt_util.utc_from_timestamp(upper_bound)
+        end = datetime.combine((start + timedelta(days=1)).date(), time(), UTC)
+        name = f"{table}_p{start.strftime('%Y%m%d%H%M')}"
+        try:
+            with session.begin_nested():
+                session.execute(
+                    text(
+                        f'CREATE TABLE "{name}" PARTITION OF "{table}" '
+                        f"FOR VALUES FROM ({upper_bound!r}) TO ({end.timestamp()!r})"
+                    )
+                )
+        except SQLAlchemyError:
+            # A default partition holding rows in the range prevents
+            # the partition from being created
+            _LOGGER.exception("Error creating partition %s of %s", name, table)
+            break
+        _LOGGER.debug("Created partition %s of %s", name, table)
+        upper_bound = end.timestamp()
+        created += 1
+    return created
+
+
+def drop_partitions(
+    instance: Recorder, session: Session, table: str, purge_before: datetime
+) -> int:
+    """Drop the partitions that only hold rows before purge_before.
+
+    Errors are logged and stop dropping partitions, the rows are then
+    left to the purge.
+
+    Returns the number of rows in the dropped partitions.
+    """
+    if not _supports_partitions(instance):
+        return 0
+    purge_before_ts = purge_before.timestamp()
+    try:
+        with session.begin_nested():
+            partitions = get_partitions(session, table)
+    except SQLAlchemyError:
+        _LOGGER.exception("Error finding the partitions of %s", table)
+        return 0
+    dropped_rows = 0
+    for partition in partitions:
+        if partition.upper_bound > purge_before_ts:
+            break
+        name = partition.name
+        try:
+            with session.begin_nested():
+                rows = session.execute(
+                    text(f'SELECT COUNT(*) FROM "{name}"')  # noqa: S608
+                ).scalar_one()
+                session.execute(text(f'DROP TABLE "{name}"'))
+        except SQLAlchemyError:
+            _LOGGER.exception("Error dropping partition %s of %s", name, table)
+            break
+        _LOGGER.debug("Dropped partition %s of %s with %s rows", name, table, rows)
+        dropped_rows += rows
+    return dropped_rows
+
+
+def create_upcoming_partitions(instance: Recorder, session: Session) -> None:
+    """Create the partitions needed for the upcoming days."""
+    until = dt_util.utcnow() + timedelta(days=PARTITION_DAYS_AHEAD)
+    for table in PARTITIONED_TABLES:
+        create_partitions(instance, session, table, until)
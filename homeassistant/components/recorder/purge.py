@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 import time
@@ -12,8 +13,19 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
-from .db_schema import Events, States, StatesMeta
+from .db_schema import (
+    TABLE_EVENT_DATA,
+    TABLE_EVENTS,
+    TABLE_STATE_ATTRIBUTES,
+    TABLE_STATES,
+    TABLE_STATISTICS_RUNS,
+    TABLE_STATISTICS_SHORT_TERM,
+    Events,
+    States,
+    StatesMeta,
+)
 from .models import DatabaseEngine
+from .partition import drop_partitions
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
@@ -53,6 +65,57 @@ DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
 
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of the purge of old data.
+
+    A purge runs as a series of slices on the recorder thread,
+    started is the time.time() the first slice of the running purge
+    started and is None when no purge is running.
+    """
+
+    started: float | None = None
+    slices: int = 0
+    busy_seconds: float = 0.0
+    rows: dict[str, int] = field(default_factory=dict)
+    last_finished: float | None = None
+
+    def add_rows(self, table: str, count: int) -> None:
+        """Add the number of rows purged from a table."""
+        if count:
+            self.rows[table] = self.rows.get(table, 0) + count
+
+    def start_slice(self) -> None:
+        """Start a slice of the purge."""
+        if self.started is None:
+            self.started = time.time()
+            self.slices = 0
+            self.busy_seconds = 0.0
+            self.rows = {}
+
+    def finish_slice(self, busy_seconds: float, finished: bool) -> None:
+        """Finish a slice of the purge."""
+        self.slices += 1
+        self.busy_seconds += busy_seconds
+        if finished:
+            self.started = None
+            self.last_finished = time.time()
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """Return the number of rows purged per second the purge was busy."""
+        if not self.busy_seconds:
+            return None
+        return sum(self.rows.values()) / self.busy_seconds
+
+    @property
+    def lag(self) -> float:
+        """Return the number of seconds the running purge has been running."""
+        if self.started is None:
+            return 0.0
+        return time.time() - self.started
+
+
 @retryable_database_job("purge")
 def purge_old_data(
     instance: Recorder,
@@ -61,11 +124,16 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    time_budget: float | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    If time_budget is set, no new batches are started once it has been
+    used up so the recorder thread can get back to committing events.
     """
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
@@ -85,13 +153,26 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+            has_more_states_to_purge = _purge_states_and_attributes_ids(
+                instance, session, states_batch_size, purge_before, deadline
             )
+            # The events only get a batch past the deadline once all
+            # states are purged, so the slice still makes progress
+            has_more_to_purge |= has_more_states_to_purge
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance,
+                session,
+                events_batch_size,
+                purge_before,
+                deadline,
+                0 if has_more_states_to_purge else 1,
             )
 
+        # Whole partitions can be dropped instead of deleting their rows
+        if dropped_rows := drop_partitions(
+            instance, session, TABLE_STATISTICS_SHORT_TERM, purge_before
+        ):
+            instance.purge_progress.add_rows(TABLE_STATISTICS_SHORT_TERM, dropped_rows)
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
         )
@@ -100,9 +181,15 @@ def purge_old_data(
         )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
+            instance.purge_progress.add_rows(
+                TABLE_STATISTICS_RUNS, len(statistics_runs)
+            )
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+            instance.purge_progress.add_rows(
+                TABLE_STATISTICS_SHORT_TERM, len(short_term_statistics)
+            )
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
@@ -146,10 +233,18 @@ def _purge_legacy_format(
     ) = _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
         session, purge_before, instance.max_bind_vars
     )
+    progress = instance.purge_progress
     _purge_state_ids(instance, session, state_ids)
-    _purge_unused_attributes_ids(instance, session, attributes_ids)
+    progress.add_rows(TABLE_STATES, len(state_ids))
+    progress.add_rows(
+        TABLE_STATE_ATTRIBUTES,
+        _purge_unused_attributes_ids(instance, session, attributes_ids),
+    )
     _purge_event_ids(session, event_ids)
-    _purge_unused_data_ids(instance, session, data_ids)
+    progress.add_rows(TABLE_EVENTS, len(event_ids))
+    progress.add_rows(
+        TABLE_EVENT_DATA, _purge_unused_data_ids(instance, session, data_ids)
+    )
 
     # The database may still have some rows that have an event_id but are not
     # linked to any event. These rows are not linked to any event because the
@@ -163,7 +258,11 @@ def _purge_legacy_format(
         session, purge_before, instance.max_bind_vars
     )
     _purge_state_ids(instance, session, detached_state_ids)
-    _purge_unused_attributes_ids(instance, session, detached_attributes_ids)
+    progress.add_rows(TABLE_STATES, len(detached_state_ids))
+    progress.add_rows(
+        TABLE_STATE_ATTRIBUTES,
+        _purge_unused_attributes_ids(instance, session, detached_attributes_ids),
+    )
     return bool(
         event_ids
         or state_ids
@@ -179,11 +278,15 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
+    Stops early once the monotonic deadline has passed.
+
     Returns true if there are more states to purge.
     """
+    progress = instance.purge_progress
     database_engine = instance.database_engine
     assert database_engine is not None
     has_remaining_state_ids_to_purge = True
@@ -193,7 +296,9 @@ def _purge_states_and_attributes_ids(
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
-    for _ in range(states_batch_size):
+    for batch in range(states_batch_size):
+        if batch and deadline is not None and time.monotonic() > deadline:
+            break
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
             session, purge_before, max_bind_vars
         )
@@ -201,9 +306,13 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.add_rows(TABLE_STATES, len(state_ids))
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    progress.add_rows(
+        TABLE_STATE_ATTRIBUTES,
+        _purge_unused_attributes_ids(instance, session, attributes_ids_batch),
+    )
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -216,11 +325,17 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float | None = None,
+    min_batches: int = 1,
 ) -> bool:
-    """Purge states and linked attributes id in a batch.
+    """Purge events and linked data ids in a batch.
 
-    Returns true if there are more states to purge.
+    Stops early once min_batches have run and the monotonic
+    deadline has passed.
+
+    Returns true if there are more events to purge.
     """
+    progress = instance.purge_progress
     has_remaining_event_ids_to_purge = True
     # There are more events relative to data_ids so
     # we purge enough event_ids to try to generate a full
@@ -228,7 +343,13 @@ def _purge_events_and_data_ids(
     # max_bind_vars
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
-    for _ in range(events_batch_size):
+    for batch in range(events_batch_size):
+        if (
+            batch >= min_batches
+            and deadline is not None
+            and time.monotonic() > deadline
+        ):
+            break
         event_ids, data_ids = _select_event_data_ids_to_purge(
             session, purge_before, max_bind_vars
         )
@@ -236,9 +357,12 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.add_rows(TABLE_EVENTS, len(event_ids))
         data_ids_batch = data_ids_batch | data_ids
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    progress.add_rows(
+        TABLE_EVENT_DATA, _purge_unused_data_ids(instance, session, data_ids_batch)
+    )
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -320,14 +444,15 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
-) -> None:
-    """Purge unused attributes ids."""
+) -> int:
+    """Purge unused attributes ids and return the number purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_attribute_ids_set := _select_unused_attributes_ids(
         instance, session, attributes_ids_batch, database_engine
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    return len(unused_attribute_ids_set)
 
 
 def _select_unused_event_data_ids(
@@ -358,13 +483,15 @@ def _select_unused_event_data_ids(
 
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int]
-) -> None:
+) -> int:
+    """Purge unused event data ids and return the number purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, data_ids_batch, database_engine
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    return len(unused_data_ids_set)
 
 
 def _select_statistics_runs_to_purge(
@@ -55,6 +55,17 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_purge_info(instance: Recorder) -> dict[str, Any]:
+    """Get purge throughput and lag."""
+    purge_info: dict[str, Any] = {}
+    progress = instance.purge_progress
+    if (rows_per_second := progress.rows_per_second) is not None:
+        purge_info["purge_rows_per_second"] = round(rows_per_second)
+        purge_info["purge_lag"] = round(progress.lag)
+    return purge_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -62,6 +73,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     recorder_runs_manager = instance.recorder_runs_manager
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
+    purge_info = _async_get_purge_info(instance)
     db_stats: dict[str, Any] = {}
 
     if instance.async_db_ready.done():
@@ -72,4 +84,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | purge_info
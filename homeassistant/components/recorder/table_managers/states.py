@@ -19,6 +19,7 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_state_ids: dict[str, int] = {}
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
         self._oldest_ts: float | None = None
@@ -61,6 +62,18 @@ class StatesManager:
         if self._oldest_ts is None:
             self._oldest_ts = state.last_updated_ts
 
+    def add_pending_state_id(
+        self, entity_id: str, state_id: int, last_updated_ts: float | None
+    ) -> None:
+        """Add the state_id of a state that was inserted but not yet committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_state_ids[entity_id] = state_id
+        if self._oldest_ts is None:
+            self._oldest_ts = last_updated_ts
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -79,7 +92,9 @@ class StatesManager:
         """
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
+        self._last_committed_id.update(self._pending_state_ids)
         self._pending.clear()
+        self._pending_state_ids.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -90,6 +105,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_state_ids.clear()
         self._oldest_ts = None
 
     def load_from_db(self, session: Session) -> None:
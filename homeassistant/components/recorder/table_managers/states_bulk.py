@@ -0,0 +1,324 @@
+"""Support writing States with bulk executemany statements."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, EventStateChangedData
+
+from ..db_schema import StateAttributes, States, StatesMeta
+from ..models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+if TYPE_CHECKING:
+    from ..core import Recorder
+
+
+class PendingStateRow:
+    """A state row buffered until the next commit.
+
+    The column values that are known when the event is processed are
+    kept in a tuple in the order of STATE_ROW_COLUMNS. The foreign keys
+    are resolved in batches when the buffer is flushed.
+    """
+
+    __slots__ = (
+        "attributes",
+        "entity_id",
+        "last_reported_ts",
+        "metadata",
+        "old_state",
+        "old_state_id",
+        "removed",
+        "shared_attrs",
+        "state_id",
+        "values",
+    )
+
+    def __init__(
+        self,
+        entity_id: str,
+        values: tuple[Any, ...],
+        last_reported_ts: float | None,
+        removed: bool,
+        shared_attrs: str,
+    ) -> None:
+        """Initialize the pending state row."""
+        self.entity_id = entity_id
+        self.values = values
+        self.last_reported_ts = last_reported_ts
+        self.removed = removed
+        self.shared_attrs = shared_attrs
+        self.metadata: int | StatesMeta | None = None
+        self.attributes: int | StateAttributes | None = None
+        self.old_state_id: int | None = None
+        self.old_state: PendingStateRow | States | None = None
+        self.state_id: int | None = None
+
+    @property
+    def last_updated_ts(self) -> float:
+        """Return the last_updated_ts of the row."""
+        return cast(float, self.values[LAST_UPDATED_TS_INDEX])
+
+
+STATE_ROW_COLUMNS = (
+    "state",
+    "last_updated_ts",
+    "last_changed_ts",
+    "context_id_bin",
+    "context_user_id_bin",
+    "context_parent_id_bin",
+    "origin_idx",
+)
+LAST_UPDATED_TS_INDEX = STATE_ROW_COLUMNS.index("last_updated_ts")
+
+
+class BulkStatesManager:
+    """Buffer state rows and write them with one statement per table.
+
+    This is an alternative to adding a States object to the session
+    for every state_changed event. The ORM unit of work is only used
+    for the rare new StatesMeta and StateAttributes rows.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the bulk states manager."""
+        self.recorder = recorder
+        self._rows: list[PendingStateRow] = []
+        self._pending: dict[str, PendingStateRow] = {}
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return len(self._rows)
+
+    def add_event(
+        self, event: Event[EventStateChangedData], shared_attrs_bytes: bytes
+    ) -> None:
+        """Buffer a state_changed event.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        recorder = self.recorder
+        states_manager = recorder.states_manager
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        old_state = event.data["old_state"]
+        context = event.context
+        if new_state is None:
+            state_value = None
+            last_updated_ts = event.time_fired_timestamp
+            last_changed_ts = None
+            last_reported_ts = None
+        else:
+            state_value = new_state.state
+            last_updated_ts = new_state.last_updated_timestamp
+            last_changed_ts = (
+                None
+                if new_state.last_updated == new_state.last_changed
+                else new_state.last_changed_timestamp
+            )
+            last_reported_ts = (
+                None
+                if new_state.last_updated == new_state.last_reported
+                else new_state.last_reported_timestamp
+            )
+        shared_attrs = shared_attrs_bytes.decode("utf-8")
+        row = PendingStateRow(
+            entity_id,
+            (
+                state_value,
+                last_updated_ts,
+                last_changed_ts,
+                ulid_to_bytes_or_none(context.id),
+                uuid_hex_to_bytes_or_none(context.user_id),
+                ulid_to_bytes_or_none(context.parent_id),
+                event.origin.idx,
+            ),
+            last_reported_ts,
+            new_state is None,
+            shared_attrs,
+        )
+
+        if pending_row := self._pending.pop(entity_id, None):
+            row.old_state = pending_row
+            if old_state:
+                pending_row.last_reported_ts = old_state.last_reported_timestamp
+        elif pending_state := states_manager.pop_pending(entity_id):
+            # A States object added to the session before bulk
+            # writes became active for this session
+            row.old_state = pending_state
+            if old_state:
+                pending_state.last_reported_ts = old_state.last_reported_timestamp
+        elif old_state_id := states_manager.pop_committed(entity_id):
+            row.old_state_id = old_state_id
+            if old_state:
+                states_manager.update_pending_last_reported(
+                    old_state_id, old_state.last_reported_timestamp
+                )
+        if new_state is not None:
+            self._pending[entity_id] = row
+
+        states_meta_manager = recorder.states_meta_manager
+        row.metadata = states_meta_manager.get_pending(
+            entity_id
+        ) or states_meta_manager.get_from_cache(entity_id)
+        state_attributes_manager = recorder.state_attributes_manager
+        row.attributes = state_attributes_manager.get_pending(
+            shared_attrs
+        ) or state_attributes_manager.get_from_cache(shared_attrs)
+        self._rows.append(row)
+
+    def discard_event(self, event: Event[EventStateChangedData]) -> None:
+        """Drop the old state of an event that could not be buffered.
+
+        Like the ORM path, the next state of the entity is written
+        without an old_state_id when the attributes of an event could
+        not be serialized.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        entity_id = event.data["entity_id"]
+        self._pending.pop(entity_id, None)
+        states_manager = self.recorder.states_manager
+        states_manager.pop_pending(entity_id)
+        states_manager.pop_committed(entity_id)
+
+    def flush(self, session: Session) -> None:
+        """Write the buffered rows to the session.
+
+        Any metadata_id or attributes_id that is not in the cache is
+        resolved with one query per table before the states are
+        inserted with a single executemany.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (rows := self._rows):
+            return
+        self._resolve_metadata_ids(session)
+        self._resolve_attributes_ids(session)
+        # Assign ids to new StatesMeta, StateAttributes and
+        # any States that were added to the session directly
+        session.flush()
+
+        rows = [row for row in rows if row.metadata is not None]
+        params: list[dict[str, Any]] = []
+        for row in rows:
+            param = dict(zip(STATE_ROW_COLUMNS, row.values, strict=True))
+            param["last_reported_ts"] = row.last_reported_ts
+            metadata = row.metadata
+            param["metadata_id"] = (
+                metadata if type(metadata) is int else metadata.metadata_id  # type: ignore[union-attr]
+            )
+            attributes = row.attributes
+            param["attributes_id"] = (
+                attributes
+                if attributes is None or type(attributes) is int
+                else attributes.attributes_id  # type: ignore[union-attr]
+            )
+            old_state = row.old_state
+            param["old_state_id"] = (
+                old_state.state_id if type(old_state) is States else row.old_state_id
+            )
+            params.append(param)
+
+        if not params:
+            self._clear()
+            return
+
+        if session.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+            state_ids = session.scalars(
+                insert(States).returning(States.state_id, sort_by_parameter_order=True),
+                params,
+            ).all()
+        else:
+            db_states = [States(**param) for param in params]
+            session.add_all(db_states)
+            session.flush()
+            state_ids = [db_state.state_id for db_state in db_states]
+
+        for row, state_id in zip(rows, state_ids, strict=True):
+            row.state_id = state_id
+        if old_state_links := [
+            {"state_id": row.state_id, "old_state_id": old_state.state_id}
+            for row in rows
+            if type(old_state := row.old_state) is PendingStateRow
+            and old_state.state_id is not None
+        ]:
+            session.execute(update(States), old_state_links)
+
+        states_manager = self.recorder.states_manager
+        for entity_id, row in self._pending.items():
+            if row.state_id is not None:
+                states_manager.add_pending_state_id(
+                    entity_id, row.state_id, row.last_updated_ts
+                )
+        self._clear()
+
+    def _resolve_metadata_ids(self, session: Session) -> None:
+        """Resolve missing metadata_ids in a single batch."""
+        if not (missing := [row for row in self._rows if row.metadata is None]):
+            return
+        states_meta_manager = self.recorder.states_meta_manager
+        metadata_ids = states_meta_manager.get_many(
+            {row.entity_id for row in missing}, session, True
+        )
+        for row in missing:
+            entity_id = row.entity_id
+            if metadata_id := metadata_ids[entity_id]:
+                row.metadata = metadata_id
+            elif pending_states_meta := states_meta_manager.get_pending(entity_id):
+                row.metadata = pending_states_meta
+            elif not row.removed:
+                states_meta = StatesMeta(entity_id=entity_id)
+                states_meta_manager.add_pending(states_meta)
+                session.add(states_meta)
+                row.metadata = states_meta
+            # If the entity was removed and never had a metadata_id
+            # allocated, the row is dropped as it either never existed
+            # or was just renamed.
+
+    def _resolve_attributes_ids(self, session: Session) -> None:
+        """Resolve missing attributes_ids in a single batch."""
+        if not (missing := [row for row in self._rows if row.attributes is None]):
+            return
+        state_attributes_manager = self.recorder.state_attributes_manager
+        hashes = {
+            row.shared_attrs: StateAttributes.hash_shared_attrs_bytes(
+                row.shared_attrs.encode("utf-8")
+            )
+            for row in missing
+        }
+        attributes_ids = state_attributes_manager.get_many(hashes.items(), session)
+        for row in missing:
+            shared_attrs = row.shared_attrs
+            if attributes_id := attributes_ids.get(shared_attrs):
+                row.attributes = attributes_id
+            elif pending_attributes := state_attributes_manager.get_pending(
+                shared_attrs
+            ):
+                row.attributes = pending_attributes
+            else:
+                state_attributes = StateAttributes(
+                    shared_attrs=shared_attrs, hash=hashes[shared_attrs]
+                )
+                state_attributes_manager.add_pending(state_attributes)
+                session.add(state_attributes)
+                row.attributes = state_attributes
+
+    def _clear(self) -> None:
+        """Clear the buffered rows."""
+        self._rows = []
+        self._pending.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._clear()
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.typing import UndefinedType
@@ -116,19 +117,38 @@ class PurgeTask(RecorderTask):
     apply_filter: bool
 
     def run(self, instance: Recorder) -> None:
-        """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        """Purge the database.
+
+        Each run is a slice that gives the thread back once the max
+        slice latency is used up. The next slice is queued behind the
+        events that came in meanwhile, or after the same latency has
+        passed if the slice used it up, so a long purge holds the
+        thread no more than half of the time.
+        """
+        progress = instance.purge_progress
+        progress.start_slice()
+        start = time.monotonic()
+        finished = purge.purge_old_data(
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            time_budget=instance.purge_max_slice_latency,
+        )
+        busy_seconds = time.monotonic() - start
+        progress.finish_slice(busy_seconds, finished)
+        if finished:
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
             periodic_db_cleanups(instance)
             return
         # Schedule a new purge task if this one didn't finish
-        instance.queue_task(
-            PurgeTask(self.purge_before, self.repack, self.apply_filter)
-        )
+        task = PurgeTask(self.purge_before, self.repack, self.apply_filter)
+        if busy_seconds < instance.purge_max_slice_latency:
+            instance.queue_task(task)
+        else:
+            instance.queue_task_later(task, instance.purge_max_slice_latency)
 
 
 @dataclass(slots=True)
@@ -57,6 +57,7 @@ from .models import (
     UnsupportedDialect,
     process_timestamp,
 )
+from .partition import create_upcoming_partitions
 
 if TYPE_CHECKING:
     from sqlite3.dbapi2 import Cursor as SQLiteCursor
@@ -794,6 +795,10 @@ def periodic_db_cleanups(instance: Recorder) -> None:
         with instance.engine.connect() as connection:
             connection.execute(text("PRAGMA wal_checkpoint(TRUNCATE);"))
             connection.execute(text("PRAGMA OPTIMIZE;"))
+    elif instance.engine.dialect.name == SupportedDialect.POSTGRESQL:
+        # Make sure there are partitions for the rows of the upcoming days
+        with session_scope(session=instance.get_session()) as session:
+            create_upcoming_partitions(instance, session)
 
 
 @contextmanager
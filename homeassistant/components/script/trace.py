@@ -7,9 +7,9 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
-    async_store_trace,
+    async_finish_trace,
+    async_start_trace,
 )
 from homeassistant.core import Context, HomeAssistant
 
@@ -33,7 +33,7 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    stored = async_start_trace(hass, trace, trace_config)
 
     try:
         yield trace
@@ -44,3 +44,4 @@ def trace_script(
     finally:
         if item_id:
             trace.finished()
+        async_finish_trace(hass, trace, trace_config, stored)
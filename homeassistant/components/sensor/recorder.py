@@ -9,7 +9,7 @@ import datetime
 import itertools
 import logging
 import math
-from typing import Any
+from typing import Any, NamedTuple
 
 from sqlalchemy.orm.session import Session
 
@@ -19,6 +19,7 @@ from homeassistant.components.recorder import (
     history,
     statistics,
 )
+from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
@@ -26,12 +27,20 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -78,6 +87,238 @@ WARN_UNSUPPORTED_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unsupported_u
 WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Running statistics of measurement sensors fed by state changes
+STATISTICS_ACCUMULATOR: HassKey[StatisticsAccumulator] = HassKey(
+    f"{DOMAIN}_statistics_accumulator"
+)
+
+SHORT_TERM_PERIOD_SECONDS = StatisticsShortTerm.duration.total_seconds()
+# Number of periods kept for each sensor if statistics are not compiled
+MAX_ACCUMULATED_PERIODS = 12
+
+
+class AccumulatedStatistics(NamedTuple):
+    """Statistics of a measurement sensor during a 5-minute period."""
+
+    unit: str | None
+    min: float
+    max: float
+    mean: float
+
+
+def _float_or_none(state: str) -> float | None:
+    """Return the state as a finite float or None."""
+    try:
+        fstate = float(state)
+    except ValueError:
+        return None
+    return fstate if math.isfinite(fstate) else None
+
+
+class _SensorAccumulator:
+    """Running time weighted statistics of a measurement sensor.
+
+    This gives the same results as _time_weighted_average and min/max
+    over the significant states of the sensor, without querying the
+    database. States that are not numeric are skipped like they are
+    when the statistics are compiled from history, so the previous
+    numeric state keeps counting towards the mean.
+    """
+
+    __slots__ = (
+        "accumulated",
+        "complete_from",
+        "first_ts",
+        "is_numeric",
+        "max",
+        "min",
+        "period_start",
+        "periods",
+        "since",
+        "unit",
+        "value",
+    )
+
+    def __init__(self, state: State, period_start: float) -> None:
+        """Initialize from the current state of the sensor."""
+        since = state.last_updated_timestamp
+        value = _float_or_none(state.state)
+        self.is_numeric = value is not None
+        self.value = value
+        self.unit: str | None = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        self.since = since
+        # The statistics are only complete for the current period if
+        # the state did not change since it started
+        self.complete_from = (
+            period_start
+            if since < period_start
+            else period_start + SHORT_TERM_PERIOD_SECONDS
+        )
+        self.periods: dict[float, AccumulatedStatistics | None] = {}
+        self._start_period(period_start)
+
+    def _start_period(self, period_start: float) -> None:
+        """Start a new period, carrying over the current numeric state."""
+        self.period_start = period_start
+        self.accumulated = 0.0
+        if not self.is_numeric:
+            self.value = None
+        if (value := self.value) is None:
+            self.first_ts: float | None = None
+            return
+        self.since = self.first_ts = max(self.since, period_start)
+        self.min = self.max = value
+
+    def _close_period(self) -> None:
+        """Store the statistics of the current period."""
+        end = self.period_start + SHORT_TERM_PERIOD_SECONDS
+        stats: AccumulatedStatistics | None = None
+        if (value := self.value) is not None and (first_ts := self.first_ts):
+            accumulated = self.accumulated + value * (end - self.since)
+            duration = end - first_ts
+            stats = AccumulatedStatistics(
+                self.unit,
+                self.min,
+                self.max,
+                accumulated / duration if duration else 0.0,
+            )
+        periods = self.periods
+        periods[self.period_start] = stats
+        if len(periods) > MAX_ACCUMULATED_PERIODS:
+            del periods[next(iter(periods))]
+
+    def advance(self, timestamp: float) -> None:
+        """Close the periods that ended before timestamp."""
+        while timestamp >= self.period_start + SHORT_TERM_PERIOD_SECONDS:
+            self._close_period()
+            self._start_period(self.period_start + SHORT_TERM_PERIOD_SECONDS)
+
+    def add_state(self, new_state: State, significant: bool) -> bool:
+        """Add a state change.
+
+        Returns False if the statistics can no longer be accumulated
+        and must be compiled from history.
+        """
+        timestamp = new_state.last_updated_timestamp
+        if timestamp < self.since:
+            return False
+        self.advance(timestamp)
+        if (value := _float_or_none(new_state.state)) is None:
+            if significant:
+                self.is_numeric = False
+            return True
+        unit = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if unit != self.unit:
+            if self.value is not None or self.first_ts is not None:
+                return False
+            self.unit = unit
+        if not significant:
+            return True
+        self.is_numeric = True
+        if (old_value := self.value) is not None:
+            self.accumulated += old_value * (timestamp - self.since)
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+        else:
+            self.first_ts = timestamp
+            self.min = self.max = value
+        self.value = value
+        self.since = timestamp
+        return True
+
+    def pop_period(self, start: float) -> AccumulatedStatistics | None:
+        """Remove the statistics up to start and return them for start."""
+        periods = self.periods
+        stats = periods.get(start) if start >= self.complete_from else None
+        for period_start in [key for key in periods if key <= start]:
+            del periods[period_start]
+        return stats
+
+
+class StatisticsAccumulator:
+    """Accumulate statistics of measurement sensors from state changes.
+
+    Sensors are tracked from the first time statistics are compiled
+    after they have been added, so the periods before that, and any
+    period where a sensor can not be accumulated, are compiled from
+    history instead.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulator."""
+        self.hass = hass
+        self._sensors: dict[str, _SensorAccumulator] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Listen for state changes."""
+        self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change to the sensor statistics."""
+        data = event.data
+        if (sensor := self._sensors.get(data["entity_id"])) is None:
+            return
+        if (
+            (new_state := data["new_state"]) is None
+            or new_state.attributes.get(ATTR_STATE_CLASS)
+            != SensorStateClass.MEASUREMENT
+            or not sensor.add_state(
+                new_state,
+                (old_state := data["old_state"]) is None
+                or old_state.state != new_state.state,
+            )
+        ):
+            del self._sensors[data["entity_id"]]
+
+    @callback
+    def async_pop_period(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> dict[str, AccumulatedStatistics]:
+        """Return the statistics of the period and track new sensors."""
+        start_ts = start.timestamp()
+        end_ts = end.timestamp()
+        result: dict[str, AccumulatedStatistics] = {}
+        sensors = self._sensors
+        for entity_id, sensor in sensors.items():
+            sensor.advance(end_ts)
+            if stats := sensor.pop_period(start_ts):
+                result[entity_id] = stats
+        now_ts = dt_util.utcnow().timestamp()
+        period_start = now_ts - now_ts % SHORT_TERM_PERIOD_SECONDS
+        for state in self.hass.states.async_all(DOMAIN):
+            if (
+                state.entity_id not in sensors
+                and state.attributes.get(ATTR_STATE_CLASS)
+                == SensorStateClass.MEASUREMENT
+            ):
+                sensors[state.entity_id] = _SensorAccumulator(state, period_start)
+        return result
+
+
+@callback
+def _async_pop_accumulated_statistics(
+    hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
+) -> dict[str, AccumulatedStatistics]:
+    """Return the accumulated statistics for the period."""
+    if (accumulator := hass.data.get(STATISTICS_ACCUMULATOR)) is None:
+        accumulator = hass.data[STATISTICS_ACCUMULATOR] = StatisticsAccumulator(hass)
+        accumulator.async_setup()
+    return accumulator.async_pop_period(start, end)
+
+
+def _get_accumulated_statistics(
+    hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
+) -> dict[str, AccumulatedStatistics]:
+    """Return the accumulated statistics for the period from the event loop."""
+    try:
+        return run_callback_threadsafe(
+            hass.loop, _async_pop_accumulated_statistics, hass, start, end
+        ).result()
+    except RuntimeError:
+        # The event loop is shutting down, compile from history
+        return {}
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -413,6 +654,29 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    instance = get_instance(hass)
+    # Use the statistics accumulated from state changes for measurement
+    # sensors that already have statistics in the same unit, all other
+    # sensors are compiled from history. A new sensor is compiled from
+    # history so its unit is validated by _normalize_states.
+    accumulated: dict[str, AccumulatedStatistics] = {}
+    accumulated_metadatas: dict[str, tuple[int, StatisticMetaData]] = {}
+    if all_accumulated := _get_accumulated_statistics(hass, start, end):
+        accumulated_metadatas = statistics.get_metadata_with_session(
+            instance,
+            session,
+            statistic_ids={
+                i.entity_id
+                for i in sensor_states
+                if i.entity_id in all_accumulated
+                and "sum" not in wanted_statistics[i.entity_id]
+            },
+        )
+        accumulated = {
+            entity_id: all_accumulated[entity_id]
+            for entity_id, (_, metadata) in accumulated_metadatas.items()
+            if metadata["unit_of_measurement"] == all_accumulated[entity_id].unit
+        }
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
@@ -431,6 +695,7 @@ def compile_statistics(  # noqa: C901
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in accumulated
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -445,6 +710,8 @@ def compile_statistics(  # noqa: C901
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in accumulated:
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -457,13 +724,32 @@ def compile_statistics(  # noqa: C901
     # since it will result in cache misses for statistic_ids
     # that are not in the metadata table and we are not working
     # with them anyway.
-    old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+    old_metadatas = accumulated_metadatas | statistics.get_metadata_with_session(
+        instance, session, statistic_ids=set(entities_with_float_states)
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    to_process: list[
+        tuple[
+            str,
+            str | None,
+            str,
+            list[tuple[float, State]],
+            AccumulatedStatistics | None,
+        ]
+    ] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if accumulated_stats := accumulated.get(entity_id):
+            to_process.append(
+                (
+                    entity_id,
+                    accumulated_stats.unit,
+                    _state.attributes[ATTR_STATE_CLASS],
+                    [],
+                    accumulated_stats,
+                )
+            )
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -475,7 +761,9 @@ def compile_statistics(  # noqa: C901
         if not valid_float_states:
             continue
         state_class: str = _state.attributes[ATTR_STATE_CLASS]
-        to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
+        to_process.append(
+            (entity_id, statistics_unit, state_class, valid_float_states, None)
+        )
         if "sum" in wanted_statistics[entity_id]:
             to_query.add(entity_id)
 
@@ -487,6 +775,7 @@ def compile_statistics(  # noqa: C901
         statistics_unit,
         state_class,
         valid_float_states,
+        accumulated_stats,
     ) in to_process:
         # Check metadata
         if old_metadata := old_metadatas.get(entity_id):
@@ -525,17 +814,22 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+        if accumulated_stats:
+            stat["max"] = accumulated_stats.max
+            stat["min"] = accumulated_stats.min
+            stat["mean"] = accumulated_stats.mean
+        else:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
 
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
@@ -15,14 +15,21 @@ from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
 from . import websocket_api
+from .budget import TraceBudget
 from .const import (
+    CONF_SAMPLE_RATE,
     CONF_STORED_TRACES,
+    CONF_TRACE_POLICY,
     DATA_TRACE,
+    DATA_TRACE_BUDGET,
+    DATA_TRACE_RUNS,
     DATA_TRACE_STORE,
+    DEFAULT_SAMPLE_RATE,
     DEFAULT_STORED_TRACES,
+    TracePolicy,
 )
 from .models import ActionTrace
-from .util import async_store_trace
+from .util import async_finish_trace, async_start_trace, async_store_trace
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +39,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_POLICY, default=TracePolicy.FULL): vol.Coerce(TracePolicy),
+    vol.Optional(CONF_SAMPLE_RATE, default=DEFAULT_SAMPLE_RATE): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -41,6 +52,9 @@ __all__ = [
     "CONF_STORED_TRACES",
     "TRACE_CONFIG_SCHEMA",
     "ActionTrace",
+    "TracePolicy",
+    "async_finish_trace",
+    "async_start_trace",
     "async_store_trace",
 ]
 
@@ -48,6 +62,8 @@ __all__ = [
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_RUNS] = {}
+    hass.data[DATA_TRACE_BUDGET] = TraceBudget(hass)
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
@@ -0,0 +1,185 @@
+"""Keep the memory used by finished script and automation traces bounded."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import logging
+import os
+import shutil
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util.limited_size_dict import LimitedSizeDict
+
+from .const import (
+    DATA_TRACE,
+    MAX_SPILLED_TRACES_SIZE,
+    MAX_TRACE_MEMORY,
+    RECENT_TRACES,
+    SPILLED_TRACES_DIR,
+)
+from .models import BaseTrace, CompactTrace, SpilledTrace
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TraceBudget:
+    """Keep the memory used by finished traces within a budget.
+
+    The most recently finished traces are kept as they are, older traces are
+    encoded compactly. When the encoded traces exceed the memory budget, the
+    oldest are spilled to a ring of files on disk, which are read back when
+    the trace is requested.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the trace budget."""
+        self.hass = hass
+        self.path = hass.config.path(STORAGE_DIR, SPILLED_TRACES_DIR)
+        self.memory_size = 0
+        self.disk_size = 0
+        self._recent: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self._compact: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self._spilled: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self._spill_lock = asyncio.Lock()
+        self._spill_dir_ready = False
+
+    @callback
+    def _async_get(self, key: str, run_id: str) -> BaseTrace | None:
+        """Return a stored trace, if it has not been replaced by newer traces."""
+        if (traces := self.hass.data[DATA_TRACE].get(key)) is None:
+            return None
+        return traces.get(run_id)
+
+    @callback
+    def _async_replace(self, trace: BaseTrace, new_trace: BaseTrace | None) -> None:
+        """Replace or remove a stored trace, keeping its position."""
+        traces = self.hass.data[DATA_TRACE][trace.key]
+        if new_trace is None:
+            del traces[trace.run_id]
+        else:
+            traces[trace.run_id] = new_trace
+
+    @callback
+    def async_add(self, trace: BaseTrace) -> None:
+        """Add a finished trace."""
+        self._recent[(trace.key, trace.run_id)] = None
+        while len(self._recent) > RECENT_TRACES:
+            (key, run_id), _ = self._recent.popitem(last=False)
+            if (old_trace := self._async_get(key, run_id)) is not None:
+                self._async_compact(old_trace)
+
+    @callback
+    def async_add_restored(self, trace: BaseTrace) -> None:
+        """Add a restored trace as the oldest trace.
+
+        Restored traces finished before the traces of this run, so they are
+        encoded compactly right away and are the first to be spilled.
+        """
+        self._async_compact(trace, oldest=True)
+
+    @callback
+    def async_remove(self, trace: BaseTrace) -> None:
+        """Remove a trace which is no longer stored."""
+        trace_id = (trace.key, trace.run_id)
+        self._recent.pop(trace_id, None)
+        if (size := self._compact.pop(trace_id, None)) is not None:
+            self.memory_size -= size
+        if (size := self._spilled.pop(trace_id, None)) is not None:
+            self.disk_size -= size
+            self.hass.async_add_executor_job(
+                self._remove_traces, [os.path.join(self.path, f"{trace.run_id}.json")]
+            )
+
+    @callback
+    def _async_compact(self, trace: BaseTrace, oldest: bool = False) -> None:
+        """Encode a trace compactly and spill traces if over the budget."""
+        compact_trace = CompactTrace(trace)
+        self._async_replace(trace, compact_trace)
+        trace_id = (trace.key, trace.run_id)
+        size = self._compact[trace_id] = len(compact_trace.data)
+        if oldest:
+            self._compact.move_to_end(trace_id, last=False)
+        self.memory_size += size
+
+        while self.memory_size > MAX_TRACE_MEMORY:
+            (key, run_id), size = self._compact.popitem(last=False)
+            self.memory_size -= size
+            if isinstance(old_trace := self._async_get(key, run_id), CompactTrace):
+                self.hass.async_create_background_task(
+                    self._async_spill(old_trace), "trace spill"
+                )
+
+    async def _async_spill(self, trace: CompactTrace) -> None:
+        """Spill a trace to disk and remove the oldest spilled traces."""
+        path = os.path.join(self.path, f"{trace.run_id}.json")
+        async with self._spill_lock:
+            try:
+                await self.hass.async_add_executor_job(
+                    self._write_trace, path, trace.data
+                )
+            except OSError as err:
+                _LOGGER.error("Error spilling trace %s to disk: %s", trace.key, err)
+                if self._async_get(trace.key, trace.run_id) is trace:
+                    self._async_replace(trace, None)
+                return
+
+            if self._async_get(trace.key, trace.run_id) is not trace:
+                # The trace was removed while it was written
+                await self.hass.async_add_executor_job(self._remove_traces, [path])
+                return
+            self._async_replace(trace, SpilledTrace(trace, path))
+            size = self._spilled[(trace.key, trace.run_id)] = len(trace.data)
+            self.disk_size += size
+
+            removed_paths = []
+            while self.disk_size > MAX_SPILLED_TRACES_SIZE:
+                (key, run_id), size = self._spilled.popitem(last=False)
+                self.disk_size -= size
+                if isinstance(old_trace := self._async_get(key, run_id), SpilledTrace):
+                    self._async_replace(old_trace, None)
+                removed_paths.append(os.path.join(self.path, f"{run_id}.json"))
+            if removed_paths:
+                await self.hass.async_add_executor_job(
+                    self._remove_traces, removed_paths
+                )
+
+    def _write_trace(self, path: str, data: bytes) -> None:
+        """Write a spilled trace."""
+        if not self._spill_dir_ready:
+            # Remove the traces spilled before Home Assistant was restarted,
+            # they were saved with the other traces when it was stopped
+            shutil.rmtree(self.path, ignore_errors=True)
+            os.makedirs(self.path)
+            self._spill_dir_ready = True
+        with open(path, "wb") as fdesc:
+            fdesc.write(data)
+
+    def _remove_traces(self, paths: list[str]) -> None:
+        """Remove spilled traces."""
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError as err:
+                _LOGGER.warning("Error removing spilled trace %s: %s", path, err)
+
+
+class BudgetedTraces(LimitedSizeDict[str, BaseTrace]):
+    """The stored traces of a key, which are removed from the trace budget.
+
+    Traces evicted when the size limit is exceeded no longer count towards
+    the memory and disk used by the traces.
+    """
+
+    def __init__(self, budget: TraceBudget, *args: Any, **kwds: Any) -> None:
+        """Initialize the stored traces."""
+        self._budget = budget
+        super().__init__(*args, **kwds)
+
+    def popitem(self, last: bool = True) -> tuple[str, BaseTrace]:
+        """Remove and return a trace, and remove it from the budget."""
+        run_id, trace = super().popitem(last)
+        self._budget.async_remove(trace)
+        return run_id, trace
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from enum import StrEnum
 from typing import TYPE_CHECKING
 
 from homeassistant.util.hass_dict import HassKey
@@ -9,11 +10,34 @@ from homeassistant.util.hass_dict import HassKey
 if TYPE_CHECKING:
     from homeassistant.helpers.storage import Store
 
+    from .budget import TraceBudget
     from .models import TraceData
 
 
+CONF_SAMPLE_RATE = "sample_rate"
 CONF_STORED_TRACES = "stored_traces"
+CONF_TRACE_POLICY = "policy"
 DATA_TRACE: HassKey[TraceData] = HassKey("trace")
+DATA_TRACE_BUDGET: HassKey[TraceBudget] = HassKey("trace_budget")
+DATA_TRACE_RUNS: HassKey[dict[str, int]] = HassKey("trace_runs")
 DATA_TRACE_STORE: HassKey[Store[dict[str, list]]] = HassKey("trace_store")
 DATA_TRACES_RESTORED: HassKey[bool] = HassKey("trace_traces_restored")
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+DEFAULT_SAMPLE_RATE = 10  # Trace one of every 10 runs when sampling
+RECENT_TRACES = 20  # Finished traces which are kept without encoding them
+MAX_TRACE_MEMORY = 32 * 2**20  # Max size of the encoded traces kept in memory
+MAX_SPILLED_TRACES_SIZE = 256 * 2**20  # Max size of the traces spilled to disk
+SPILLED_TRACES_DIR = "trace.spilled_traces"
+
+
+class TracePolicy(StrEnum):
+    """Policy for which runs of a script or automation are traced."""
+
+    # Trace every run
+    FULL = "full"
+    # Trace every run, but only store the traces of failed runs
+    ERRORS = "errors"
+    # Trace one of every sample_rate runs
+    SAMPLED = "sampled"
+    # Don't trace runs
+    OFF = "off"
@@ -5,9 +5,13 @@ from __future__ import annotations
 import abc
 from collections import deque
 import datetime as dt
-from typing import Any
+from functools import partial
+from typing import Any, cast
+
+import orjson
 
 from homeassistant.core import Context
+from homeassistant.helpers.json import ExtendedJSONEncoder, json_encoder_default
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -16,11 +20,79 @@ from homeassistant.helpers.trace import (
     trace_set_child_id,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads_object
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 import homeassistant.util.uuid as uuid_util
 
 type TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
 
+_EXTENDED_JSON_ENCODER = ExtendedJSONEncoder()
+
+
+def _json_encoder_default(obj: Any) -> Any:
+    """Convert objects, fall back to repr(obj) like ExtendedJSONEncoder."""
+    try:
+        return json_encoder_default(obj)
+    except TypeError:
+        return _EXTENDED_JSON_ENCODER.default(obj)
+
+
+_json_bytes = partial(
+    orjson.dumps, option=orjson.OPT_NON_STR_KEYS, default=_json_encoder_default
+)
+
+
+def encode_trace(extended_dict: dict[str, Any]) -> bytes:
+    """Encode the extended dictionary version of a trace compactly.
+
+    The changed variables of the trace elements are replaced by indexes in
+    a list of the encoded variable values, which is shared by all elements
+    of the trace to store values assigned to several variables only once.
+    """
+    variables: list[orjson.Fragment] = []
+    variable_indexes: dict[bytes, int] = {}
+
+    def _share_variable(value: Any) -> int:
+        encoded = _json_bytes(value)
+        if (index := variable_indexes.get(encoded)) is None:
+            index = variable_indexes[encoded] = len(variables)
+            variables.append(orjson.Fragment(encoded))
+        return index
+
+    trace = {
+        path: [
+            {
+                **element,
+                "changed_variables": {
+                    key: _share_variable(value)
+                    for key, value in element["changed_variables"].items()
+                },
+            }
+            if "changed_variables" in element
+            else element
+            for element in elements
+        ]
+        for path, elements in extended_dict["trace"].items()
+    }
+    return _json_bytes(
+        {"extended_dict": {**extended_dict, "trace": trace}, "variables": variables}
+    )
+
+
+def decode_trace(data: bytes) -> dict[str, Any]:
+    """Decode a trace encoded by encode_trace."""
+    decoded = json_loads_object(data)
+    extended_dict = cast(dict[str, Any], decoded["extended_dict"])
+    variables = cast(list[Any], decoded["variables"])
+    for elements in extended_dict["trace"].values():
+        for element in elements:
+            if "changed_variables" in element:
+                element["changed_variables"] = {
+                    key: variables[index]
+                    for key, index in element["changed_variables"].items()
+                }
+    return extended_dict
+
 
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
@@ -79,6 +151,11 @@ class ActionTrace(BaseTrace):
         """Set action trace."""
         self._trace = trace
 
+    @property
+    def error(self) -> Exception | None:
+        """Return the error of the run."""
+        return self._error
+
     def set_error(self, ex: Exception) -> None:
         """Set error."""
         self._error = ex
@@ -172,3 +249,47 @@ class RestoredTrace(BaseTrace):
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this RestoredTrace."""
         return self._short_dict  # type: ignore[no-any-return]
+
+
+class CompactTrace(BaseTrace):
+    """Container for a finished script or automation trace encoded compactly."""
+
+    def __init__(self, trace: BaseTrace) -> None:
+        """Encode a finished trace."""
+        self.context = trace.context
+        self.key = trace.key
+        self.run_id = trace.run_id
+        self._short_dict = trace.as_short_dict()
+        self.data = encode_trace(trace.as_extended_dict())
+
+    def as_extended_dict(self) -> dict[str, Any]:
+        """Return an extended dictionary version of this CompactTrace."""
+        return decode_trace(self.data)
+
+    def as_short_dict(self) -> dict[str, Any]:
+        """Return a brief dictionary version of this CompactTrace."""
+        return self._short_dict
+
+
+class SpilledTrace(BaseTrace):
+    """Container for a script or automation trace spilled to disk."""
+
+    def __init__(self, trace: CompactTrace, path: str) -> None:
+        """Container for a trace written to path."""
+        self.context = trace.context
+        self.key = trace.key
+        self.run_id = trace.run_id
+        self._short_dict = trace.as_short_dict()
+        self.path = path
+
+    def as_extended_dict(self) -> dict[str, Any]:
+        """Return an extended dictionary version of this SpilledTrace.
+
+        The trace is read from disk, this must be run in the executor.
+        """
+        with open(self.path, "rb") as fdesc:
+            return decode_trace(fdesc.read())
+
+    def as_short_dict(self) -> dict[str, Any]:
+        """Return a brief dictionary version of this SpilledTrace."""
+        return self._short_dict
@@ -8,10 +8,23 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.trace import trace_set_enabled
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
-from .const import DATA_TRACE, DATA_TRACE_STORE, DATA_TRACES_RESTORED
-from .models import ActionTrace, BaseTrace, RestoredTrace, TraceData
+from .budget import BudgetedTraces
+from .const import (
+    CONF_SAMPLE_RATE,
+    CONF_STORED_TRACES,
+    CONF_TRACE_POLICY,
+    DATA_TRACE,
+    DATA_TRACE_BUDGET,
+    DATA_TRACE_RUNS,
+    DATA_TRACE_STORE,
+    DATA_TRACES_RESTORED,
+    TracePolicy,
+)
+from .models import ActionTrace, BaseTrace, RestoredTrace, SpilledTrace, TraceData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,7 +36,10 @@ async def async_get_trace(
     # Restore saved traces if not done
     await async_restore_traces(hass)
 
-    return hass.data[DATA_TRACE][key][run_id].as_extended_dict()
+    trace = hass.data[DATA_TRACE][key][run_id]
+    if isinstance(trace, SpilledTrace):
+        return await hass.async_add_executor_job(trace.as_extended_dict)
+    return trace.as_extended_dict()
 
 
 async def async_list_contexts(
@@ -85,18 +101,59 @@ def async_store_trace(
     if key := trace.key:
         traces = hass.data[DATA_TRACE]
         if key not in traces:
-            traces[key] = LimitedSizeDict(size_limit=stored_traces)
+            traces[key] = BudgetedTraces(
+                hass.data[DATA_TRACE_BUDGET], size_limit=stored_traces
+            )
         else:
             traces[key].size_limit = stored_traces
         traces[key][trace.run_id] = trace
 
 
+def async_start_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> bool:
+    """Start tracing a run according to the trace policy.
+
+    The steps of the run are only traced if the policy selects the run, runs
+    which are not traced skip building the trace altogether. Returns if the
+    trace is stored when the run starts, else it's up to async_finish_trace
+    to store it if the run fails.
+    """
+    policy = trace_config[CONF_TRACE_POLICY]
+    if policy == TracePolicy.SAMPLED:
+        runs = hass.data[DATA_TRACE_RUNS]
+        run = runs[trace.key] = runs.get(trace.key, -1) + 1
+        traced = run % trace_config[CONF_SAMPLE_RATE] == 0
+    else:
+        traced = policy != TracePolicy.OFF
+    trace_set_enabled(traced)
+
+    if not traced or policy == TracePolicy.ERRORS:
+        return False
+    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    return True
+
+
+def async_finish_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType, stored: bool
+) -> None:
+    """Finish tracing a run.
+
+    The trace of a failed run is stored if it was not stored when it started.
+    """
+    if not stored:
+        if trace.error is None:
+            return
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    hass.data[DATA_TRACE_BUDGET].async_add(trace)
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
     traces = hass.data[DATA_TRACE]
     if key not in traces:
-        traces[key] = LimitedSizeDict()
+        traces[key] = BudgetedTraces(hass.data[DATA_TRACE_BUDGET])
     traces[key][trace.run_id] = trace
     traces[key].move_to_end(trace.run_id, last=False)
 
@@ -132,3 +189,4 @@ async def async_restore_traces(hass: HomeAssistant) -> None:
                 _LOGGER.exception("Failed to restore trace")
                 continue
             _async_store_restored_trace(hass, trace)
+            hass.data[DATA_TRACE_BUDGET].async_add_restored(trace)
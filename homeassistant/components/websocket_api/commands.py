@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
+from datetime import datetime
 from functools import lru_cache, partial
 import json
 import logging
@@ -11,14 +12,18 @@ from typing import Any, cast
 import voluptuous as vol
 
 from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -34,7 +39,13 @@ from homeassistant.exceptions import (
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -43,6 +54,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_call_later,
     async_track_template_result,
 )
 from homeassistant.helpers.json import (
@@ -60,6 +72,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +80,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+DATA_SUBSCRIBE_ENTITIES_HUB: HassKey[_EntitySubscriptionHub] = HassKey(
+    f"{const.DOMAIN}.subscribe_entities_hub"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -367,31 +383,226 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+class _StateDiffCoalescer:
+    """Merge the state diffs of a subscription while the client is behind.
+
+    Only the state before the first pending change and the latest state are
+    kept for each entity so the pending data is bounded by the number of
+    entities instead of the number of state changes.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_msg_id",
+        "_pending_messages",
+        "_send_message",
+        "_states",
+        "_unsub",
+    )
+
+    def __init__(
+        self, hass: HomeAssistant, connection: ActiveConnection, msg_id: int
+    ) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._msg_id = msg_id
+        self._pending_messages = connection.pending_messages
+        self._send_message = connection.send_message
+        self._states: dict[str, tuple[State | None, State | None]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_coalesce(self, event: Event[EventStateChangedData]) -> bool:
+        """Merge the event if the client is behind and return if it was merged."""
+        if (
+            not self._states
+            and self._pending_messages() < const.PENDING_MSG_COALESCE_STATES
+        ):
+            return False
+        data = event.data
+        entity_id = data["entity_id"]
+        if (pending := self._states.get(entity_id)) is None:
+            self._states[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            self._states[entity_id] = (pending[0], data["new_state"])
+        if self._unsub is None:
+            self._unsub = async_call_later(
+                self._hass, const.COALESCE_STATES_INTERVAL, self._async_flush
+            )
+        return True
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        """Send the merged state diffs once the client caught up."""
+        if self._pending_messages() >= const.PENDING_MSG_COALESCE_STATES:
+            self._unsub = async_call_later(
+                self._hass, const.COALESCE_STATES_INTERVAL, self._async_flush
+            )
+            return
+        self._unsub = None
+        states = self._states
+        self._states = {}
+        self._send_message(messages.coalesced_state_diff_message(self._msg_id, states))
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the merged state diffs."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._states.clear()
+
+
+class _EntitySubscriptionGroup:
+    """Subscriptions to entity changes sharing the same filter."""
+
+    __slots__ = ("entity_filter", "entity_ids", "filter_cache", "subscriptions")
+
+    def __init__(
+        self,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+    ) -> None:
+        """Initialize the group."""
+        self.entity_ids = entity_ids
+        self.entity_filter = entity_filter
+        self.filter_cache: dict[str, bool] = {}
+        self.subscriptions: dict[
+            tuple[ActiveConnection, int],
+            tuple[
+                Callable[[str | bytes | dict[str, Any]], None],
+                User,
+                bytes,
+                _StateDiffCoalescer | None,
+            ],
+        ] = {}
+
+    @callback
+    def async_allowed(self, entity_id: str) -> bool:
+        """Return if the entity passes the filter of the group."""
+        if (allowed := self.filter_cache.get(entity_id)) is None:
+            allowed = self.filter_cache[entity_id] = (
+                not self.entity_ids or entity_id in self.entity_ids
+            ) and (not self.entity_filter or self.entity_filter(entity_id))
+        return allowed
+
+
+class _EntitySubscriptionHub:
+    """Forward entity changes to subscribe_entities subscriptions.
+
+    A single state changed listener is shared by all subscriptions. The
+    diff message is serialized once per event and subscriptions with the
+    same filter are grouped so the filter runs once per event for the group.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._groups: dict[Hashable, _EntitySubscriptionGroup] = {}
+        self._user_cache: dict[str, tuple[AbstractPermissions, dict[str, bool]]] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_subscribe(
+        self,
+        connection: ActiveConnection,
+        msg_id: int,
+        filter_key: Hashable,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        coalesce_states: bool,
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to entity changes."""
+        if (group := self._groups.get(filter_key)) is None:
+            group = self._groups[filter_key] = _EntitySubscriptionGroup(
+                entity_ids, entity_filter
+            )
+        key = (connection, msg_id)
+        coalescer = (
+            _StateDiffCoalescer(self._hass, connection, msg_id)
+            if coalesce_states
+            else None
+        )
+        group.subscriptions[key] = (
+            connection.send_message,
+            connection.user,
+            str(msg_id).encode(),
+            coalescer,
+        )
+        if not self._unsubs:
+            bus = self._hass.bus
+            self._unsubs = [
+                bus.async_listen(
+                    EVENT_STATE_CHANGED, self._async_forward_entity_changes
+                ),
+                # Permissions can depend on the device and area of the entity
+                bus.async_listen(
+                    er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_clear_user_cache
+                ),
+                bus.async_listen(
+                    dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_clear_user_cache
+                ),
+            ]
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Remove the subscription."""
+            del group.subscriptions[key]
+            if coalescer is not None:
+                coalescer.async_cancel()
+            if not group.subscriptions:
+                del self._groups[filter_key]
+            if not self._groups:
+                self._user_cache.clear()
+                for unsub in self._unsubs:
+                    unsub()
+                self._unsubs = []
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_clear_user_cache(self, event: Event[Any]) -> None:
+        """Clear the cached user permissions."""
+        self._user_cache.clear()
+
+    @callback
+    def _async_user_allowed(self, user: User, entity_id: str) -> bool:
+        """Return if the user can read the entity."""
+        if user.is_admin:
+            return True
+        # The permissions object is replaced when the user changes
+        # so the cached results are dropped with it.
+        permissions = user.permissions
+        cached = self._user_cache.get(user.id)
+        if cached is None or cached[0] is not permissions:
+            cached = self._user_cache[user.id] = (permissions, {})
+        allowed_entities = cached[1]
+        if (allowed := allowed_entities.get(entity_id)) is None:
+            allowed = allowed_entities[entity_id] = permissions.access_all_entities(
+                POLICY_READ
+            ) or permissions.check_entity(entity_id, POLICY_READ)
+        return allowed
+
+    @callback
+    def _async_forward_entity_changes(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Forward entity state changed events to websocket."""
+        entity_id = event.data["entity_id"]
+        message_prefix: bytes | None = None
+        for group in list(self._groups.values()):
+            if not group.async_allowed(entity_id):
+                continue
+            for send_message, user, message_id_as_bytes, coalescer in list(
+                group.subscriptions.values()
+            ):
+                if not self._async_user_allowed(user, entity_id):
+                    continue
+                if coalescer is not None and coalescer.async_coalesce(event):
+                    continue
+                if message_prefix is None:
+                    message_prefix = messages.state_diff_message_prefix(event)
+                send_message(b"".join((message_prefix, message_id_as_bytes, b"}")))
 
 
 @callback
@@ -399,6 +610,7 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_states", default=False): bool,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -415,17 +627,23 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
+    if (hub := hass.data.get(DATA_SUBSCRIBE_ENTITIES_HUB)) is None:
+        hub = hass.data[DATA_SUBSCRIBE_ENTITIES_HUB] = _EntitySubscriptionHub(hass)
+    filter_key = (
+        frozenset(entity_ids) if entity_ids else None,
+        json.dumps(
+            {key: msg[key] for key in (CONF_INCLUDE, CONF_EXCLUDE) if key in msg},
+            sort_keys=True,
         ),
     )
+    connection.subscriptions[msg_id] = hub.async_subscribe(
+        connection,
+        msg_id,
+        filter_key,
+        entity_ids,
+        entity_filter,
+        msg["coalesce_states"],
+    )
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -36,6 +36,11 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+def _no_pending_messages() -> int:
+    """Return that no messages are pending."""
+    return 0
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -48,6 +53,7 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "pending_messages",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -70,6 +76,8 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        # Return the number of messages waiting to be sent to the client
+        self.pending_messages: Callable[[], int] = _no_pending_messages
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
@@ -34,6 +34,13 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages after which the state diffs of subscribe_entities
+# subscriptions with coalesce_states are merged per entity until the client
+# catches up. Must stay below PENDING_MSG_PEAK.
+PENDING_MSG_COALESCE_STATES: Final = 512
+# Seconds between checks if the client caught up with the pending messages
+COALESCE_STATES_INTERVAL: Final = 0.5
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -15,7 +15,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -154,14 +154,21 @@ def cached_state_diff_message(
     """
     return b"".join(
         (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
+            state_diff_message_prefix(event),
             message_id_as_bytes,
             b"}",
         )
     )
 
 
+def state_diff_message_prefix(event: Event[EventStateChangedData]) -> bytes:
+    """Return the serialized state diff message up to the message id.
+
+    The message is completed by appending the message id and a closing brace.
+    """
+    return b"".join((_partial_cached_state_diff_message(event)[:-1], b',"id":'))
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
@@ -177,6 +184,36 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def coalesced_state_diff_message(
+    iden: int, states: dict[str, tuple[State | None, State | None]]
+) -> bytes:
+    """Return an event message merging the changes of multiple entities.
+
+    The states map the entity_id to the state before the first change and
+    the state after the last change that are merged.
+    """
+    additions: dict[str, CompressedState] = {}
+    changes: dict[str, dict[str, dict[str, Any]]] = {}
+    removals: list[str] = []
+    for entity_id, (old_state, new_state) in states.items():
+        if new_state is None:
+            # Entities added and removed again are not known by the client
+            if old_state is not None:
+                removals.append(entity_id)
+        elif old_state is None:
+            additions[entity_id] = new_state.as_compressed_state
+        else:
+            changes[entity_id] = _state_diff(old_state, new_state)
+    event: dict[str, Any] = {}
+    if additions:
+        event[ENTITY_EVENT_ADD] = additions
+    if changes:
+        event[ENTITY_EVENT_CHANGE] = changes
+    if removals:
+        event[ENTITY_EVENT_REMOVE] = removals
+    return message_to_json_bytes(event_message(iden, event))
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -199,6 +236,13 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the minimal version of the change from old_state to new_state."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -235,7 +279,7 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
@@ -23,8 +23,10 @@ import datetime
 import enum
 import functools
 import inspect
+from itertools import chain
 import logging
 import re
+import sys
 import threading
 import time
 from time import monotonic
@@ -33,6 +35,7 @@ from typing import (
     Any,
     Final,
     Generic,
+    NamedTuple,
     NotRequired,
     Self,
     TypedDict,
@@ -207,7 +210,8 @@ def split_entity_id(entity_id: str) -> tuple[str, str]:
     domain, _, object_id = entity_id.partition(".")
     if not domain or not object_id:
         raise ValueError(f"Invalid entity ID {entity_id}")
-    return domain, object_id
+    # All entities of a domain share the same domain string
+    return sys.intern(domain), object_id
 
 
 _OBJECT_ID = r"(?!_)[\da-z_]+(?<!_)"
@@ -1446,8 +1450,25 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
-# Empty list, used by EventBus.async_fire_internal
-EMPTY_LIST: list[Any] = []
+@dataclass(slots=True)
+class _KeyedListeners(Generic[_DataT]):
+    """Listeners for an event type indexed by a key derived from the event data.
+
+    The buckets are replaced instead of mutated so they can be
+    dispatched without making a copy on every fire.
+    """
+
+    key_getter: Callable[[_DataT], str | None]
+    dispatch_soon: bool
+    match_all: bool
+    buckets: dict[
+        str, tuple[HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None], ...]
+    ]
+    remove_listener: CALLBACK_TYPE | None = None
+
+
+# Empty tuple, used by EventBus.async_fire_internal
+EMPTY_LISTENERS: tuple[Any, ...] = ()
 
 
 @functools.lru_cache
@@ -1460,15 +1481,27 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: defaultdict[
-            EventType[Any] | str, list[_FilterableJobType[Any]]
-        ] = defaultdict(list)
-        self._match_all_listeners: list[_FilterableJobType[Any]] = []
+        # The listener tuples are replaced instead of mutated when a
+        # listener is added or removed so they can be dispatched without
+        # making a copy on every fire.
+        self._listeners: dict[
+            EventType[Any] | str, tuple[_FilterableJobType[Any], ...]
+        ] = {}
+        self._match_all_listeners: tuple[_FilterableJobType[Any], ...] = ()
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._keyed_listeners: dict[
+            EventType[Any] | str, tuple[_KeyedListeners[Any], ...]
+        ] = {}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1482,6 +1515,8 @@ class EventBus:
     def async_listeners(self) -> dict[EventType[Any] | str, int]:
         """Return dictionary with events and the number of listeners.
 
+        Each index of keyed listeners is counted as a single listener.
+
         This method must be run in the event loop.
         """
         return {key: len(listeners) for key, listeners in self._listeners.items()}
@@ -1549,14 +1584,17 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
-        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
-            match_all_listeners = self._match_all_listeners
-        else:
-            match_all_listeners = EMPTY_LIST
+        listeners: Iterable[_FilterableJobType[Any]] = self._listeners.get(
+            event_type, EMPTY_LISTENERS
+        )
+        if (
+            event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL
+            and self._match_all_listeners
+        ):
+            listeners = chain(listeners, self._match_all_listeners)
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
+        for job, event_filter in listeners:
             if event_filter is not None:
                 try:
                     if event_data is None or not event_filter(event_data):
@@ -1579,6 +1617,162 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    @callback
+    def _async_keyed_filter(
+        self, keyed: _KeyedListeners[_DataT], event_data: _DataT
+    ) -> bool:
+        """Return if an event has keyed listeners."""
+        try:
+            key = keyed.key_getter(event_data)
+        except Exception:
+            _LOGGER.exception("Error in event key getter")
+            return False
+        if key is None:
+            return False
+        buckets = keyed.buckets
+        return key in buckets or (keyed.match_all and MATCH_ALL in buckets)
+
+    @callback
+    def _async_dispatch_keyed_event(
+        self, keyed: _KeyedListeners[_DataT], event: Event[_DataT]
+    ) -> None:
+        """Dispatch an event which passed the filter of a keyed index."""
+        # The filter already ran the key getter without an error
+        key = cast(str, keyed.key_getter(event.data))
+        if keyed.dispatch_soon:
+            self._hass.loop.call_soon(
+                self._async_dispatch_keyed_listeners, keyed, key, event
+            )
+        else:
+            self._async_dispatch_keyed_listeners(keyed, key, event)
+
+    @callback
+    def _async_dispatch_keyed_listeners(
+        self, keyed: _KeyedListeners[_DataT], key: str, event: Event[_DataT]
+    ) -> None:
+        """Dispatch an event to the keyed listeners matching a key."""
+        buckets = keyed.buckets
+        jobs = buckets.get(key, EMPTY_LISTENERS)
+        if keyed.match_all and key != MATCH_ALL and MATCH_ALL in buckets:
+            jobs = (*jobs, *buckets[MATCH_ALL])
+        for job in jobs:
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s", key, job
+                )
+
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        key_getter: Callable[[_DataT], str | None],
+        keys: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        job_type: HassJobType | None = None,
+        dispatch_soon: bool = False,
+        match_all: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type indexed by a key.
+
+        The key_getter, which must be a callable decorated with @callback,
+        returns the key of an event from its data, or None if the event
+        should not be dispatched to any keyed listener. All listeners that
+        share the same key_getter, dispatch_soon and match_all for an event
+        type use a single index, so an event is dispatched with one key
+        lookup instead of running a filter for every listener.
+
+        The index is added to the listeners of the event type when its
+        first listener is added, and runs in that position like any other
+        listener. The keyed listeners of an index run in the order they
+        were added.
+
+        If match_all is set, listeners keyed by ``MATCH_ALL`` receive every
+        event with a key, after the listeners of the key.
+
+        If dispatch_soon is set, the listeners are run in the next
+        iteration of the event loop.
+
+        This method must be run in the event loop.
+        """
+        if not is_callback_check_partial(key_getter):
+            raise HomeAssistantError(f"Key getter {key_getter} is not a callback")
+        if isinstance(keys, str):
+            keys = (keys,)
+        else:
+            keys = tuple(keys)
+
+        keyed_listeners = self._keyed_listeners.get(event_type, EMPTY_LISTENERS)
+        for keyed in keyed_listeners:
+            if (
+                keyed.key_getter == key_getter
+                and keyed.dispatch_soon == dispatch_soon
+                and keyed.match_all == match_all
+            ):
+                break
+        else:
+            keyed = _KeyedListeners(key_getter, dispatch_soon, match_all, {})
+            self._keyed_listeners[event_type] = (*keyed_listeners, keyed)
+            keyed.remove_listener = self._async_listen_filterable_job(
+                event_type,
+                (
+                    HassJob(
+                        functools.partial(self._async_dispatch_keyed_event, keyed),
+                        f"listen {event_type} by key",
+                        job_type=HassJobType.Callback,
+                    ),
+                    functools.partial(self._async_keyed_filter, keyed),
+                ),
+            )
+
+        job = HassJob(listener, f"listen {event_type} by key {keys}", job_type=job_type)
+        buckets = keyed.buckets
+        for key in keys:
+            buckets[key] = (*buckets.get(key, EMPTY_LISTENERS), job)
+
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, keyed, keys, job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        keyed: _KeyedListeners[_DataT],
+        keys: tuple[str, ...],
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        buckets = keyed.buckets
+        try:
+            for key in keys:
+                jobs = list(buckets[key])
+                jobs.remove(job)
+                if jobs:
+                    buckets[key] = tuple(jobs)
+                else:
+                    del buckets[key]
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown keyed listener %s", job)
+            return
+
+        if buckets:
+            return
+        # delete the index if no keys are left
+        if keyed.remove_listener is not None:
+            keyed.remove_listener()
+        keyed_listeners = tuple(
+            other for other in self._keyed_listeners[event_type] if other is not keyed
+        )
+        if keyed_listeners:
+            self._keyed_listeners[event_type] = keyed_listeners
+        else:
+            del self._keyed_listeners[event_type]
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1649,7 +1843,10 @@ class EventBus:
         filterable_job: _FilterableJobType[_DataT],
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
-        self._listeners[event_type].append(filterable_job)
+        listeners = (*self._listeners.get(event_type, EMPTY_LISTENERS), filterable_job)
+        self._listeners[event_type] = listeners
+        if event_type == MATCH_ALL:
+            self._match_all_listeners = listeners
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
@@ -1730,11 +1927,18 @@ class EventBus:
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(filterable_job)
+            listeners = list(self._listeners[event_type])
+            listeners.remove(filterable_job)
 
-            # delete event_type list if empty
-            if not self._listeners[event_type] and event_type != MATCH_ALL:
-                self._listeners.pop(event_type)
+            if event_type == MATCH_ALL:
+                self._listeners[MATCH_ALL] = self._match_all_listeners = tuple(
+                    listeners
+                )
+            elif listeners:
+                self._listeners[event_type] = tuple(listeners)
+            else:
+                # delete event_type listeners if empty
+                del self._listeners[event_type]
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -1782,6 +1986,8 @@ class State:
         "_cache",
     )
 
+    _cache: dict[str, Any]
+
     def __init__(
         self,
         entity_id: str,
@@ -1796,7 +2002,6 @@ class State:
         last_updated_timestamp: float | None = None,
     ) -> None:
         """Initialize a new state."""
-        self._cache: dict[str, Any] = {}
         state = str(state)
 
         if validate_entity_id and not valid_entity_id(entity_id):
@@ -1823,19 +2028,36 @@ class State:
         self.state_info = state_info
         self.domain, self.object_id = split_entity_id(self.entity_id)
         # The recorder or the websocket_api will always call the timestamps,
-        # so we will set the timestamp values here to avoid the overhead of
+        # so we will set the timestamp value here to avoid the overhead of
         # the function call in the property we know will always be called.
         last_updated = self.last_updated
         if not last_updated_timestamp:
             last_updated_timestamp = last_updated.timestamp()
         self.last_updated_timestamp = last_updated_timestamp
-        if self.last_changed == last_updated:
-            self._cache["last_changed_timestamp"] = last_updated_timestamp
-        # If last_reported is the same as last_updated async_set will pass
-        # the same datetime object for both values so we can use an identity
-        # check here.
-        if self.last_reported is last_updated:
-            self._cache["last_reported_timestamp"] = last_updated_timestamp
+        # Share the datetime object so the last_changed and last_reported
+        # timestamps can be taken from last_updated_timestamp without
+        # storing them in the cache of every state.
+        if self.last_changed is not last_updated and self.last_changed == last_updated:
+            self.last_changed = last_updated
+
+    if not TYPE_CHECKING:
+        # Defined only at runtime so type checkers still flag unknown attributes
+
+        def __getattr__(self, name: str) -> Any:
+            """Allocate the cache of the cached properties when first used.
+
+            Unless a websocket client is subscribed to the states, most
+            states never use a cached property and never need the dict.
+            """
+            if name != "_cache":
+                raise AttributeError(
+                    f"'{type(self).__name__}' object has no attribute '{name}'",
+                    name=name,
+                    obj=self,
+                )
+            cache: dict[str, Any] = {}
+            self._cache = cache
+            return cache
 
     @under_cached_property
     def name(self) -> str:
@@ -1844,14 +2066,31 @@ class State:
             "_", " "
         )
 
-    @under_cached_property
+    @property
     def last_changed_timestamp(self) -> float:
         """Timestamp of last change."""
-        return self.last_changed.timestamp()
+        if self.last_changed is self.last_updated:
+            return self.last_updated_timestamp
+        return self._last_changed_timestamp
 
     @under_cached_property
+    def _last_changed_timestamp(self) -> float:
+        """Timestamp of last change when it differs from last update."""
+        return self.last_changed.timestamp()
+
+    @property
     def last_reported_timestamp(self) -> float:
         """Timestamp of last report."""
+        # If last_reported is the same as last_updated async_set will pass
+        # the same datetime object for both values so we can use an identity
+        # check here.
+        if self.last_reported is self.last_updated:
+            return self.last_updated_timestamp
+        return self._last_reported_timestamp
+
+    @under_cached_property
+    def _last_reported_timestamp(self) -> float:
+        """Timestamp of last report when it differs from last update."""
         return self.last_reported.timestamp()
 
     @under_cached_property
@@ -1910,10 +2149,21 @@ class State:
             as_dict["context"] = ReadOnlyDict(context)
         return ReadOnlyDict(as_dict)
 
+    @under_cached_property
+    def attributes_json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the attributes.
+
+        The fragment is passed on to the next state of the entity
+        when the attributes do not change.
+        """
+        return json_fragment(json_bytes(self.attributes))
+
     @under_cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
-        return json_bytes(self._as_dict)
+        return json_bytes(
+            {**self._as_dict, "attributes": self.attributes_json_fragment}
+        )
 
     @under_cached_property
     def json_fragment(self) -> json_fragment:
@@ -1956,7 +2206,14 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        return json_bytes(
+            {
+                self.entity_id: {
+                    **self.as_compressed_state,
+                    COMPRESSED_STATE_ATTRIBUTES: self.attributes_json_fragment,
+                }
+            }
+        )[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2064,6 +2321,17 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+class StateUpdate(NamedTuple):
+    """A state update for StateMachine.async_set_many."""
+
+    entity_id: str
+    state: str
+    attributes: Mapping[str, Any] | None = None
+    force_update: bool = False
+    context: Context | None = None
+    state_info: StateInfo | None = None
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
@@ -2283,6 +2551,48 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        updates: Iterable[StateUpdate],
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities in one batch.
+
+        All updates share the same timestamp, and the updates without
+        a context of their own share the same context. A state_changed
+        (or state_reported) event is fired for each update in order.
+
+        The entity_ids must be lower case and the states must be strings.
+
+        This method must be run in the event loop.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        set_internal = self.async_set_internal
+        for (
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            update_context,
+            state_info,
+        ) in updates:
+            set_internal(
+                entity_id,
+                new_state,
+                attributes or {},
+                force_update,
+                update_context or context,
+                state_info,
+                timestamp,
+                now,
+            )
+
     @callback
     def async_set_internal(
         self,
@@ -2293,6 +2603,7 @@ class StateMachine:
         context: Context | None,
         state_info: StateInfo | None,
         timestamp: float,
+        now: datetime.datetime | None = None,
     ) -> None:
         """Set the state of an entity, add entity if it does not exist.
 
@@ -2301,6 +2612,8 @@ class StateMachine:
         breaking changes to this function in the future and it
         should not be used in integrations.
 
+        If now is passed, it must be the datetime of the timestamp.
+
         This method must be run in the event loop.
         """
         # Most cases the key will be in the dict
@@ -2331,7 +2644,8 @@ class StateMachine:
         # timestamp implementation:
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
+        if now is None:
+            now = dt_util.utc_from_timestamp(timestamp)
 
         if context is None:
             context = Context(id=ulid_at_time(timestamp))
@@ -2340,7 +2654,7 @@ class StateMachine:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
             old_state.last_reported = now  # type: ignore[union-attr]
-            old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
+            old_state._cache["_last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
             # Avoid creating an EventStateReportedData
             self._bus.async_fire_internal(  # type: ignore[misc]
                 EVENT_STATE_REPORTED,
@@ -2374,6 +2688,13 @@ class StateMachine:
             timestamp,
         )
         if old_state is not None:
+            if same_attr and (
+                attributes_json_fragment := old_state._cache.get(  # noqa: SLF001
+                    "attributes_json_fragment"
+                )
+            ):
+                # The attributes are shared so their JSON can be shared as well
+                state._cache["attributes_json_fragment"] = attributes_json_fragment  # noqa: SLF001
             old_state.expire()
         self._states[entity_id] = state
         state_changed_data: EventStateChangedData = {
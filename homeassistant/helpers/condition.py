@@ -65,6 +65,7 @@ from .template import Template, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_enabled,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -151,8 +152,11 @@ def condition_trace_update_result(**kwargs: Any) -> None:
 
 
 @contextmanager
-def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement]:
+def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement | None]:
     """Trace condition evaluation."""
+    if not trace_enabled():
+        yield None
+        return
     should_pop = True
     trace_element = trace_stack_top(trace_stack_cv)
     if trace_element and trace_element.reuse_by_child:
@@ -177,6 +181,8 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if not trace_enabled():
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Mapping
 from datetime import datetime
 from enum import StrEnum
 from functools import lru_cache
 import logging
+import sys
 import time
-from typing import TYPE_CHECKING, Any, Literal, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 import attr
 from yarl import URL
@@ -27,14 +27,14 @@ from homeassistant.loader import async_suggest_report_issue
 from homeassistant.util.dt import utc_from_timestamp, utcnow
 from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
-from homeassistant.util.json import format_unserializable_data
+from homeassistant.util.json import format_unserializable_data, json_loads
 import homeassistant.util.uuid as uuid_util
 
 from . import storage, translation
 from .debounce import Debouncer
 from .frame import ReportBehavior, report_usage
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry, BaseRegistryItems, RegistryIndexType
+from .registry import BaseRegistry, BaseRegistryItems, SharedValues
 from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
@@ -379,6 +379,18 @@ class DeviceEntry:
         )
 
 
+# The keys of a deleted device in storage
+DELETED_DEVICE_STORAGE_KEYS = (
+    "config_entries",
+    "connections",
+    "created_at",
+    "identifiers",
+    "id",
+    "orphaned_timestamp",
+    "modified_at",
+)
+
+
 @attr.s(frozen=True, slots=True)
 class DeletedDeviceEntry:
     """Deleted Device Registry Entry."""
@@ -427,6 +439,28 @@ class DeletedDeviceEntry:
         )
 
 
+def _load_deleted_devices(
+    stored_devices: list[dict[str, Any]],
+) -> DeviceRegistryItems[DeletedDeviceEntry]:
+    """Load the stored deleted devices."""
+    deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
+    shared = SharedValues()
+    for device in stored_devices:
+        deleted_devices[device["id"]] = DeletedDeviceEntry(
+            config_entries={
+                sys.intern(config_entry_id)
+                for config_entry_id in device["config_entries"]
+            },
+            connections={tuple(conn) for conn in device["connections"]},
+            created_at=shared.datetime(device["created_at"]),
+            identifiers={tuple(iden) for iden in device["identifiers"]},
+            id=device["id"],
+            modified_at=shared.datetime(device["modified_at"]),
+            orphaned_timestamp=device["orphaned_timestamp"],
+        )
+    return deleted_devices
+
+
 @lru_cache(maxsize=512)
 def format_mac(mac: str) -> str:
     """Format the mac address string for entry into dev reg."""
@@ -563,55 +597,24 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
 
 
 class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
-    """Container for active (non-deleted) device registry entries."""
-
-    def __init__(self) -> None:
-        """Initialize the container.
+    """Container for active (non-deleted) device registry entries.
 
-        Maintains three additional indexes:
+    Maintains three additional indexes that are built on first use:
 
-        - area_id -> dict[key, True]
-        - config_entry_id -> dict[key, True]
-        - label -> dict[key, True]
-        """
-        super().__init__()
-        self._area_id_index: RegistryIndexType = defaultdict(dict)
-        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
-        self._labels_index: RegistryIndexType = defaultdict(dict)
-
-    def _index_entry(self, key: str, entry: DeviceEntry) -> None:
-        """Index an entry."""
-        super()._index_entry(key, entry)
-        if (area_id := entry.area_id) is not None:
-            self._area_id_index[area_id][key] = True
-        for label in entry.labels:
-            self._labels_index[label][key] = True
-        for config_entry_id in entry.config_entries:
-            self._config_entry_id_index[config_entry_id][key] = True
-
-    def _unindex_entry(
-        self, key: str, replacement_entry: DeviceEntry | None = None
-    ) -> None:
-        """Unindex an entry."""
-        entry = self.data[key]
-        if area_id := entry.area_id:
-            self._unindex_entry_value(key, area_id, self._area_id_index)
-        if labels := entry.labels:
-            for label in labels:
-                self._unindex_entry_value(key, label, self._labels_index)
-        for config_entry_id in entry.config_entries:
-            self._unindex_entry_value(key, config_entry_id, self._config_entry_id_index)
-        super()._unindex_entry(key, replacement_entry)
+    - area_id -> dict[key, True]
+    - config_entries -> dict[key, True]
+    - labels -> dict[key, True]
+    """
 
     def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
         """Get devices for area."""
         data = self.data
-        return [data[key] for key in self._area_id_index.get(area_id, ())]
+        return [data[key] for key in self._get_lazy_index("area_id").get(area_id, ())]
 
     def get_devices_for_label(self, label: str) -> list[DeviceEntry]:
         """Get devices for label."""
         data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        return [data[key] for key in self._get_lazy_index("labels").get(label, ())]
 
     def get_devices_for_config_entry_id(
         self, config_entry_id: str
@@ -619,7 +622,8 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         """Get devices for config entry."""
         data = self.data
         return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+            data[key]
+            for key in self._get_lazy_index("config_entries").get(config_entry_id, ())
         ]
 
 
@@ -627,8 +631,13 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
     """Class to hold a registry of devices."""
 
     devices: ActiveDeviceRegistryItems
-    deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
+    _deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
     _device_data: dict[str, DeviceEntry]
+    # The stored deleted devices, they are loaded when first used
+    _stored_deleted_devices: bytes | None = None
+    _stored_deleted_devices_fragment: json_fragment | None = None
+    # The earliest orphaned timestamp of the stored deleted devices
+    _stored_min_orphaned_timestamp: float | None = None
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
@@ -639,8 +648,27 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
 
+    @property
+    def deleted_devices(self) -> DeviceRegistryItems[DeletedDeviceEntry]:
+        """Return the deleted devices, loading them when first used."""
+        if (stored := self._stored_deleted_devices) is not None:
+            self.deleted_devices = _load_deleted_devices(
+                cast(list[dict[str, Any]], json_loads(stored))
+            )
+        return self._deleted_devices
+
+    @deleted_devices.setter
+    def deleted_devices(
+        self, deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
+    ) -> None:
+        """Set the deleted devices."""
+        self._deleted_devices = deleted_devices
+        self._stored_deleted_devices = None
+        self._stored_deleted_devices_fragment = None
+
     @callback
     def async_get(self, device_id: str) -> DeviceEntry | None:
         """Get device.
@@ -1136,20 +1164,25 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         data = await self._store.async_load()
 
         devices = ActiveDeviceRegistryItems()
-        deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
+        self.deleted_devices = DeviceRegistryItems()
 
         if data is not None:
+            shared = SharedValues()
             for device in data["devices"]:
                 devices[device["id"]] = DeviceEntry(
-                    area_id=device["area_id"],
-                    config_entries=set(device["config_entries"]),
+                    area_id=shared.string(device["area_id"]),
+                    # type ignores (if the strings are interned): likely https://github.com/python/mypy/issues/8625
+                    config_entries={
+                        sys.intern(config_entry_id)  # type: ignore[misc]
+                        for config_entry_id in device["config_entries"]
+                    },
                     configuration_url=device["configuration_url"],
                     # type ignores (if tuple arg was cast): likely https://github.com/python/mypy/issues/8625
                     connections={
                         tuple(conn)  # type: ignore[misc]
                         for conn in device["connections"]
                     },
-                    created_at=datetime.fromisoformat(device["created_at"]),
+                    created_at=shared.datetime(device["created_at"]),
                     disabled_by=(
                         DeviceEntryDisabler(device["disabled_by"])
                         if device["disabled_by"]
@@ -1160,38 +1193,47 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
                         if device["entry_type"]
                         else None
                     ),
-                    hw_version=device["hw_version"],
+                    hw_version=shared.string(device["hw_version"]),
                     id=device["id"],
                     identifiers={
                         tuple(iden)  # type: ignore[misc]
                         for iden in device["identifiers"]
                     },
-                    labels=set(device["labels"]),
-                    manufacturer=device["manufacturer"],
-                    model=device["model"],
-                    model_id=device["model_id"],
-                    modified_at=datetime.fromisoformat(device["modified_at"]),
+                    labels={
+                        sys.intern(label)  # type: ignore[misc]
+                        for label in device["labels"]
+                    },
+                    manufacturer=shared.string(device["manufacturer"]),
+                    model=shared.string(device["model"]),
+                    model_id=shared.string(device["model_id"]),
+                    modified_at=shared.datetime(device["modified_at"]),
                     name_by_user=device["name_by_user"],
                     name=device["name"],
-                    primary_config_entry=device["primary_config_entry"],
+                    primary_config_entry=shared.string(device["primary_config_entry"]),
                     serial_number=device["serial_number"],
-                    sw_version=device["sw_version"],
-                    via_device_id=device["via_device_id"],
+                    sw_version=shared.string(device["sw_version"]),
+                    via_device_id=shared.string(device["via_device_id"]),
                 )
             # Introduced in 0.111
-            for device in data["deleted_devices"]:
-                deleted_devices[device["id"]] = DeletedDeviceEntry(
-                    config_entries=set(device["config_entries"]),
-                    connections={tuple(conn) for conn in device["connections"]},
-                    created_at=datetime.fromisoformat(device["created_at"]),
-                    identifiers={tuple(iden) for iden in device["identifiers"]},
-                    id=device["id"],
-                    modified_at=datetime.fromisoformat(device["modified_at"]),
-                    orphaned_timestamp=device["orphaned_timestamp"],
+            if data["deleted_devices"]:
+                # Deleted devices are kept as JSON until they are used
+                self._stored_deleted_devices = json_bytes(
+                    [
+                        {key: device[key] for key in DELETED_DEVICE_STORAGE_KEYS}
+                        for device in data["deleted_devices"]
+                    ]
+                )
+                self._stored_min_orphaned_timestamp = min(
+                    (
+                        orphaned_timestamp
+                        for device in data["deleted_devices"]
+                        if (orphaned_timestamp := device["orphaned_timestamp"])
+                        is not None
+                    ),
+                    default=None,
                 )
 
         self.devices = devices
-        self.deleted_devices = deleted_devices
         self._device_data = devices.data
 
     @callback
@@ -1199,11 +1241,20 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         """Return data of device registry to store in a file."""
         return {
             "devices": [entry.as_storage_fragment for entry in self.devices.values()],
-            "deleted_devices": [
-                entry.as_storage_fragment for entry in self.deleted_devices.values()
-            ],
+            "deleted_devices": self._deleted_devices_to_save(),
         }
 
+    @callback
+    def _deleted_devices_to_save(self) -> list[json_fragment] | json_fragment:
+        """Return the deleted devices to store in a file."""
+        if (stored := self._stored_deleted_devices) is None:
+            return [
+                entry.as_storage_fragment for entry in self._deleted_devices.values()
+            ]
+        if self._stored_deleted_devices_fragment is None:
+            self._stored_deleted_devices_fragment = json_fragment(stored)
+        return self._stored_deleted_devices_fragment
+
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
@@ -1236,6 +1287,13 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         growing without bound.
         """
         now_time = time.time()
+        if self._stored_deleted_devices is not None and (
+            (min_timestamp := self._stored_min_orphaned_timestamp) is None
+            or min_timestamp + ORPHANED_DEVICE_KEEP_SECONDS >= now_time
+        ):
+            # None of the stored deleted devices has expired, keep them
+            # as JSON instead of loading them
+            return
         for deleted_device in list(self.deleted_devices.values()):
             if deleted_device.orphaned_timestamp is None:
                 continue
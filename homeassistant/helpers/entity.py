@@ -31,6 +31,7 @@ from homeassistant.const import (
     ATTR_SUPPORTED_FEATURES,
     ATTR_UNIT_OF_MEASUREMENT,
     DEVICE_DEFAULT_NAME,
+    MAX_LENGTH_STATE_STATE,
     STATE_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
@@ -44,6 +45,7 @@ from homeassistant.core import (
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
+    StateUpdate,
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
@@ -196,6 +198,40 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
     return entry.unit_of_measurement
 
 
+@callback
+def async_write_ha_states(hass: HomeAssistant, entities: Iterable[Entity]) -> None:
+    """Write the state of multiple entities to the state machine in one batch.
+
+    The states are written with StateMachine.async_set_many so they
+    share the same timestamp.
+    """
+    if hass.loop_thread_id != threading.get_ident():
+        report_non_thread_safe_operation("async_write_ha_states")
+    updates: list[StateUpdate] = []
+    for entity in entities:
+        if (
+            type(entity).async_write_ha_state is not Entity.async_write_ha_state
+            or type(entity)._async_write_ha_state  # noqa: SLF001
+            is not Entity._async_write_ha_state  # noqa: SLF001
+        ):
+            # Entities that customize writing their state are written on their own
+            entity.async_write_ha_state()
+            continue
+        if not entity.hass or not entity._verified_state_writable:  # noqa: SLF001
+            entity._async_verify_state_writable()  # noqa: SLF001
+        if (prepared := entity._async_prepare_state_update()) is None:  # noqa: SLF001
+            continue
+        update = prepared[0]
+        if len(update.state) > MAX_LENGTH_STATE_STATE:
+            # Write the state on its own to fall back
+            # to unknown for states that are too long
+            entity._async_write_prepared_state(*prepared)  # noqa: SLF001
+            continue
+        updates.append(update)
+    if updates:
+        hass.states.async_set_many(updates, timestamp=timer())
+
+
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
@@ -1123,9 +1159,43 @@ class Entity(
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (prepared := self._async_prepare_state_update()) is None:
+            return
+        self._async_write_prepared_state(*prepared)
+
+    @callback
+    def _async_write_prepared_state(self, update: StateUpdate, time_now: float) -> None:
+        """Write a prepared state update to the state machine."""
+        hass = self.hass
+        entity_id = update.entity_id
+        try:
+            hass.states.async_set_internal(
+                entity_id,
+                update.state,
+                update.attributes,
+                update.force_update,
+                update.context,
+                update.state_info,
+                time_now,
+            )
+        except InvalidStateError:
+            _LOGGER.exception(
+                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
+            )
+            hass.states.async_set(
+                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
+            )
+
+    @callback
+    def _async_prepare_state_update(self) -> tuple[StateUpdate, float] | None:
+        """Calculate the state update to write to the state machine.
+
+        Returns the state update and the time it was calculated,
+        or None if the state should not be written.
+        """
         if self._platform_state is EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -1141,7 +1211,7 @@ class Entity(
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
@@ -1223,23 +1293,17 @@ class Entity(
             self._context = None
             self._context_set = None
 
-        try:
-            hass.states.async_set_internal(
+        return (
+            StateUpdate(
                 entity_id,
                 state,
                 attr,
                 self.force_update,
                 self._context,
                 self._state_info,
-                time_now,
-            )
-        except InvalidStateError:
-            _LOGGER.exception(
-                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
-            )
-            hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
-            )
+            ),
+            time_now,
+        )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -264,6 +264,7 @@ class EntityComponent(Generic[_EntityT]):
         func: str | Callable[..., Any],
         required_features: list[int] | None = None,
         supports_response: SupportsResponse = SupportsResponse.NONE,
+        entity_params: Callable[..., dict[str, Any]] | None = None,
     ) -> None:
         """Register an entity service."""
         service.async_register_entity_service(
@@ -276,6 +277,7 @@ class EntityComponent(Generic[_EntityT]):
             required_features=required_features,
             schema=schema,
             supports_response=supports_response,
+            entity_params=entity_params,
         )
 
     async def async_setup_platform(
@@ -19,6 +19,7 @@ from homeassistant.core import (
     CALLBACK_TYPE,
     DOMAIN as HOMEASSISTANT_DOMAIN,
     CoreState,
+    EntityServiceResponse,
     HomeAssistant,
     ServiceCall,
     SupportsResponse,
@@ -68,6 +69,11 @@ DATA_DOMAIN_PLATFORM_ENTITIES: HassKey[dict[tuple[str, str], dict[str, Entity]]]
 )
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+type EntityServiceBatchHandler = Callable[
+    [list[Entity], dict[str, Any]],
+    Coroutine[Any, Any, EntityServiceResponse | None],
+]
+
 _LOGGER = getLogger(__name__)
 
 
@@ -157,6 +163,11 @@ class EntityPlatform:
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
+        # Handlers of services which receive all the targeted entities of
+        # this platform at once, indexed by (domain, service)
+        self.service_batch_handlers: dict[
+            tuple[str, str], EntityServiceBatchHandler
+        ] = {}
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -1004,6 +1015,7 @@ class EntityPlatform:
         func: str | Callable[..., Any],
         required_features: Iterable[int] | None = None,
         supports_response: SupportsResponse = SupportsResponse.NONE,
+        entity_params: Callable[..., dict[str, Any]] | None = None,
     ) -> None:
         """Register an entity service.
 
@@ -1022,8 +1034,41 @@ class EntityPlatform:
             required_features=required_features,
             schema=schema,
             supports_response=supports_response,
+            entity_params=entity_params,
         )
 
+    @callback
+    def async_register_entity_service_batch_handler(
+        self,
+        name: str,
+        handler: EntityServiceBatchHandler,
+        domain: str | None = None,
+    ) -> None:
+        """Register a handler which receives all the targeted entities at once.
+
+        When a call of the service domain.name targets more than one entity of
+        this platform, the handler is called once with these entities instead
+        of calling the entity method of the service for each entity. This
+        allows an integration to send a single group or multicast command.
+
+        The handler receives the same data as the entity method would get as
+        keyword arguments. For services registered with the name of an
+        entity method, such as switch.turn_off, that is the validated service
+        data without the target fields. Services registered with a function
+        are only batched if they were registered with entity_params, such as
+        light.turn_off; the entities are then batched by equal keyword
+        arguments. Other services registered with a function, such as
+        light.turn_on which converts the colors for each light, are always
+        called for each entity.
+
+        The domain defaults to the domain of the entity component, so
+        ("turn_off", handler) is used for switch.turn_off on a switch
+        platform. The handler returns the service response of each entity,
+        or None, and should write the states of the entities with
+        homeassistant.helpers.entity.async_write_ha_states.
+        """
+        self.service_batch_handlers[(domain or self.domain, name)] = handler
+
     async def _async_update_entity_states(self) -> None:
         """Update the states of all the polling entities.
 
@@ -10,13 +10,13 @@ timer.
 
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Callable, Container, Hashable, KeysView, Mapping
 from datetime import datetime, timedelta
 from enum import StrEnum
 import logging
+import sys
 import time
-from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict, cast
 
 import attr
 import voluptuous as vol
@@ -50,7 +50,7 @@ from homeassistant.util import slugify, uuid as uuid_util
 from homeassistant.util.dt import utc_from_timestamp, utcnow
 from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
-from homeassistant.util.json import format_unserializable_data
+from homeassistant.util.json import format_unserializable_data, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import device_registry as dr, storage
@@ -59,7 +59,7 @@ from .device_registry import (
     EventDeviceRegistryUpdatedData,
 )
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry, BaseRegistryItems, RegistryIndexType
+from .registry import BaseRegistry, BaseRegistryItems, SharedValues
 from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
@@ -163,6 +163,10 @@ def _protect_entity_options(
     """Protect entity options from being modified."""
     if data is None:
         return ReadOnlyDict({})
+    if type(data) is ReadOnlyDict and all(
+        type(val) is ReadOnlyDict for val in data.values()
+    ):
+        return data
     return ReadOnlyDict({key: ReadOnlyDict(val) for key, val in data.items()})
 
 
@@ -399,6 +403,19 @@ class RegistryEntry:
         hass.states.async_set(self.entity_id, STATE_UNAVAILABLE, attrs)
 
 
+# The keys of a deleted entity in storage
+DELETED_ENTITY_STORAGE_KEYS = (
+    "config_entry_id",
+    "created_at",
+    "entity_id",
+    "id",
+    "modified_at",
+    "orphaned_timestamp",
+    "platform",
+    "unique_id",
+)
+
+
 @attr.s(frozen=True, slots=True)
 class DeletedRegistryEntry:
     """Deleted Entity Registry Entry."""
@@ -549,13 +566,15 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains six additional indexes:
+    Maintains two additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+
+    And four indexes that are built on first use:
     - config_entry_id -> dict[key, True]
     - device_id -> dict[key, True]
     - area_id -> dict[key, True]
-    - label -> dict[key, True]
+    - labels -> dict[key, True]
     """
 
     def __init__(self) -> None:
@@ -563,25 +582,11 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
-        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
-        self._device_id_index: RegistryIndexType = defaultdict(dict)
-        self._area_id_index: RegistryIndexType = defaultdict(dict)
-        self._labels_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
-        # python has no ordered set, so we use a dict with True values
-        # https://discuss.python.org/t/add-orderedset-to-stdlib/12730
-        if (config_entry_id := entry.config_entry_id) is not None:
-            self._config_entry_id_index[config_entry_id][key] = True
-        if (device_id := entry.device_id) is not None:
-            self._device_id_index[device_id][key] = True
-        if (area_id := entry.area_id) is not None:
-            self._area_id_index[area_id][key] = True
-        for label in entry.labels:
-            self._labels_index[label][key] = True
 
     def _unindex_entry(
         self, key: str, replacement_entry: RegistryEntry | None = None
@@ -590,19 +595,10 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         entry = self.data[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
-        if config_entry_id := entry.config_entry_id:
-            self._unindex_entry_value(key, config_entry_id, self._config_entry_id_index)
-        if device_id := entry.device_id:
-            self._unindex_entry_value(key, device_id, self._device_id_index)
-        if area_id := entry.area_id:
-            self._unindex_entry_value(key, area_id, self._area_id_index)
-        if labels := entry.labels:
-            for label in labels:
-                self._unindex_entry_value(key, label, self._labels_index)
 
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
-        return self._device_id_index.keys()
+        return self._get_lazy_index("device_id").keys()
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
@@ -619,7 +615,7 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         data = self.data
         return [
             entry
-            for key in self._device_id_index.get(device_id, ())
+            for key in self._get_lazy_index("device_id").get(device_id, ())
             if not (entry := data[key]).disabled_by or include_disabled_entities
         ]
 
@@ -629,18 +625,19 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         """Get entries for config entry."""
         data = self.data
         return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+            data[key]
+            for key in self._get_lazy_index("config_entry_id").get(config_entry_id, ())
         ]
 
     def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
         """Get entries for area."""
         data = self.data
-        return [data[key] for key in self._area_id_index.get(area_id, ())]
+        return [data[key] for key in self._get_lazy_index("area_id").get(area_id, ())]
 
     def get_entries_for_label(self, label: str) -> list[RegistryEntry]:
         """Get entries for label."""
         data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        return [data[key] for key in self._get_lazy_index("labels").get(label, ())]
 
 
 def _validate_item(
@@ -700,9 +697,14 @@ def _validate_item(
 class EntityRegistry(BaseRegistry):
     """Class to hold a registry of entities."""
 
-    deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry]
     entities: EntityRegistryItems
+    _deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry]
     _entities_data: dict[str, RegistryEntry]
+    # The stored deleted entities, they are loaded when first used
+    _stored_deleted_entities: bytes | None = None
+    _stored_deleted_entities_fragment: json_fragment | None = None
+    # The earliest orphaned timestamp of the stored deleted entities
+    _stored_min_orphaned_timestamp: float | None = None
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the registry."""
@@ -713,12 +715,55 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
             self.async_device_modified,
         )
 
+    @property
+    def deleted_entities(self) -> dict[tuple[str, str, str], DeletedRegistryEntry]:
+        """Return the deleted entities, loading them when first used."""
+        if (stored := self._stored_deleted_entities) is not None:
+            self.deleted_entities = self._load_deleted_entities(
+                cast(list[dict[str, Any]], json_loads(stored))
+            )
+        return self._deleted_entities
+
+    @deleted_entities.setter
+    def deleted_entities(
+        self, deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry]
+    ) -> None:
+        """Set the deleted entities."""
+        self._deleted_entities = deleted_entities
+        self._stored_deleted_entities = None
+        self._stored_deleted_entities_fragment = None
+
+    def _load_deleted_entities(
+        self, stored_entities: list[dict[str, Any]]
+    ) -> dict[tuple[str, str, str], DeletedRegistryEntry]:
+        """Load the stored deleted entities."""
+        deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
+        shared = SharedValues()
+        for entity in stored_entities:
+            key = (
+                split_entity_id(entity["entity_id"])[0],
+                entity["platform"],
+                entity["unique_id"],
+            )
+            deleted_entities[key] = DeletedRegistryEntry(
+                config_entry_id=shared.string(entity["config_entry_id"]),
+                created_at=shared.datetime(entity["created_at"]),
+                entity_id=entity["entity_id"],
+                id=entity["id"],
+                modified_at=shared.datetime(entity["modified_at"]),
+                orphaned_timestamp=entity["orphaned_timestamp"],
+                platform=sys.intern(entity["platform"]),
+                unique_id=entity["unique_id"],
+            )
+        return deleted_entities
+
     @callback
     def async_is_registered(self, entity_id: str) -> bool:
         """Check if an entity_id is currently registered."""
@@ -1253,6 +1298,20 @@ class EntityRegistry(BaseRegistry):
             new_options[domain] = options
         return self._async_update_entity(entity_id, options=new_options)
 
+    def _is_valid_deleted_entity(self, entity: dict[str, Any]) -> bool:
+        """Return if a stored deleted entity is valid."""
+        try:
+            _validate_item(
+                self.hass,
+                split_entity_id(entity["entity_id"])[0],
+                entity["platform"],
+                report_non_string_unique_id=False,
+                unique_id=entity["unique_id"],
+            )
+        except (TypeError, ValueError):
+            return False
+        return True
+
     async def async_load(self) -> None:
         """Load the entity registry."""
         _async_setup_cleanup(self.hass, self)
@@ -1260,9 +1319,10 @@ class EntityRegistry(BaseRegistry):
 
         data = await self._store.async_load()
         entities = EntityRegistryItems()
-        deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
+        self.deleted_entities = {}
 
         if data is not None:
+            shared = SharedValues()
             for entity in data["entities"]:
                 try:
                     domain = split_entity_id(entity["entity_id"])[0]
@@ -1291,13 +1351,13 @@ class EntityRegistry(BaseRegistry):
 
                 entities[entity["entity_id"]] = RegistryEntry(
                     aliases=set(entity["aliases"]),
-                    area_id=entity["area_id"],
+                    area_id=shared.string(entity["area_id"]),
                     categories=entity["categories"],
-                    capabilities=entity["capabilities"],
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    device_class=entity["device_class"],
-                    device_id=entity["device_id"],
+                    capabilities=shared.value(entity["capabilities"]),
+                    config_entry_id=shared.string(entity["config_entry_id"]),
+                    created_at=shared.datetime(entity["created_at"]),
+                    device_class=shared.string(entity["device_class"]),
+                    device_id=shared.string(entity["device_id"]),
                     disabled_by=RegistryEntryDisabler(entity["disabled_by"])
                     if entity["disabled_by"]
                     else None,
@@ -1311,49 +1371,39 @@ class EntityRegistry(BaseRegistry):
                     icon=entity["icon"],
                     id=entity["id"],
                     has_entity_name=entity["has_entity_name"],
-                    labels=set(entity["labels"]),
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
+                    labels={sys.intern(label) for label in entity["labels"]},
+                    modified_at=shared.datetime(entity["modified_at"]),
                     name=entity["name"],
-                    options=entity["options"],
-                    original_device_class=entity["original_device_class"],
-                    original_icon=entity["original_icon"],
-                    original_name=entity["original_name"],
-                    platform=entity["platform"],
+                    options=shared.value(entity["options"], _protect_entity_options),
+                    original_device_class=shared.string(
+                        entity["original_device_class"]
+                    ),
+                    original_icon=shared.string(entity["original_icon"]),
+                    original_name=shared.string(entity["original_name"]),
+                    platform=sys.intern(entity["platform"]),
                     supported_features=entity["supported_features"],
-                    translation_key=entity["translation_key"],
+                    translation_key=shared.string(entity["translation_key"]),
                     unique_id=entity["unique_id"],
                     previous_unique_id=entity["previous_unique_id"],
-                    unit_of_measurement=entity["unit_of_measurement"],
+                    unit_of_measurement=shared.string(entity["unit_of_measurement"]),
                 )
-            for entity in data["deleted_entities"]:
-                try:
-                    domain = split_entity_id(entity["entity_id"])[0]
-                    _validate_item(
-                        self.hass,
-                        domain,
-                        entity["platform"],
-                        report_non_string_unique_id=False,
-                        unique_id=entity["unique_id"],
-                    )
-                except (TypeError, ValueError):
-                    continue
-                key = (
-                    split_entity_id(entity["entity_id"])[0],
-                    entity["platform"],
-                    entity["unique_id"],
-                )
-                deleted_entities[key] = DeletedRegistryEntry(
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    entity_id=entity["entity_id"],
-                    id=entity["id"],
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
-                    orphaned_timestamp=entity["orphaned_timestamp"],
-                    platform=entity["platform"],
-                    unique_id=entity["unique_id"],
+            if stored_deleted_entities := [
+                {key: entity[key] for key in DELETED_ENTITY_STORAGE_KEYS}
+                for entity in data["deleted_entities"]
+                if self._is_valid_deleted_entity(entity)
+            ]:
+                # Deleted entities are kept as JSON until they are used
+                self._stored_deleted_entities = json_bytes(stored_deleted_entities)
+                self._stored_min_orphaned_timestamp = min(
+                    (
+                        orphaned_timestamp
+                        for entity in stored_deleted_entities
+                        if (orphaned_timestamp := entity["orphaned_timestamp"])
+                        is not None
+                    ),
+                    default=None,
                 )
 
-        self.deleted_entities = deleted_entities
         self.entities = entities
         self._entities_data = entities.data
 
@@ -1362,11 +1412,20 @@ class EntityRegistry(BaseRegistry):
         """Return data of entity registry to store in a file."""
         return {
             "entities": [entry.as_storage_fragment for entry in self.entities.values()],
-            "deleted_entities": [
-                entry.as_storage_fragment for entry in self.deleted_entities.values()
-            ],
+            "deleted_entities": self._deleted_entities_to_save(),
         }
 
+    @callback
+    def _deleted_entities_to_save(self) -> list[json_fragment] | json_fragment:
+        """Return the deleted entities to store in a file."""
+        if (stored := self._stored_deleted_entities) is None:
+            return [
+                entry.as_storage_fragment for entry in self._deleted_entities.values()
+            ]
+        if self._stored_deleted_entities_fragment is None:
+            self._stored_deleted_entities_fragment = json_fragment(stored)
+        return self._stored_deleted_entities_fragment
+
     @callback
     def async_clear_category_id(self, scope: str, category_id: str) -> None:
         """Clear category id from registry entries."""
@@ -1410,6 +1469,13 @@ class EntityRegistry(BaseRegistry):
         growing without bound.
         """
         now_time = time.time()
+        if self._stored_deleted_entities is not None and (
+            (min_timestamp := self._stored_min_orphaned_timestamp) is None
+            or min_timestamp + ORPHANED_ENTITY_KEEP_SECONDS >= now_time
+        ):
+            # None of the stored deleted entities has expired, keep them
+            # as JSON instead of loading them
+            return
         for key, deleted_entity in list(self.deleted_entities.items()):
             if (orphaned_timestamp := deleted_entity.orphaned_timestamp) is None:
                 continue
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
@@ -34,14 +33,12 @@ from homeassistant.core import (
     HomeAssistant,
     State,
     callback,
-    split_entity_id,
 )
 from homeassistant.exceptions import TemplateError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.event_type import EventType
-from homeassistant.util.hass_dict import HassKey
 
 from . import frame
 from .device_registry import (
@@ -57,25 +54,6 @@ from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
 
-_TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
-    "track_state_change_data"
-)
-_TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
-    "track_state_report_data"
-)
-_TRACK_STATE_ADDED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_added_domain_data")
-)
-_TRACK_STATE_REMOVED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_removed_domain_data")
-)
-_TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
-    _KeyedEventData[EventEntityRegistryUpdatedData]
-] = HassKey("track_entity_registry_updated_data")
-_TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
-    _KeyedEventData[EventDeviceRegistryUpdatedData]
-] = HassKey("track_device_registry_updated_data")
-
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -94,34 +72,15 @@ _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 
 @dataclass(slots=True, frozen=True)
 class _KeyedEventTracker(Generic[_TypedDictT]):
-    """Class to track events by key."""
+    """Class to track events by key.
 
-    key: HassKey[_KeyedEventData[_TypedDictT]]
-    event_type: EventType[_TypedDictT] | str
-    dispatcher_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            Event[_TypedDictT],
-        ],
-        None,
-    ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
-
-
-@dataclass(slots=True, frozen=True)
-class _KeyedEventData(Generic[_TypedDictT]):
-    """Class to track data for events by key."""
+    All trackers share the keyed listener index of the event bus.
+    """
 
-    listener: CALLBACK_TYPE
-    callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    event_type: EventType[_TypedDictT] | str
+    key_getter: Callable[[_TypedDictT], str | None]
+    dispatch_soon: bool = False
+    match_all: bool = False
 
 
 @dataclass(slots=True)
@@ -332,50 +291,19 @@ def async_track_state_change_event(
 
 
 @callback
-def _async_dispatch_entity_id_event_soon[_StateEventDataT: EventStateEventData](
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
-
-
-@callback
-def _async_dispatch_entity_id_event[_StateEventDataT: EventStateEventData](
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_filter[_StateEventDataT: EventStateEventData](
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+def _async_entity_id_key[_StateEventDataT: EventStateEventData](
     event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
+) -> str:
+    """Return the entity_id of a state event."""
+    return event_data["entity_id"]
 
 
+# State changes are dispatched soon to ensure one
+# event loop iteration runs before dispatch.
 _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
-    key=_TRACK_STATE_CHANGE_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
+    key_getter=_async_entity_id_key,
+    dispatch_soon=True,
 )
 
 
@@ -396,10 +324,8 @@ def _async_track_state_change_event(
 
 
 _KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
-    key=_TRACK_STATE_REPORT_DATA,
     event_type=EVENT_STATE_REPORTED,
-    dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
+    key_getter=_async_entity_id_key,
 )
 
 
@@ -424,24 +350,6 @@ def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
 
 
-@callback
-def _remove_listener(
-    hass: HomeAssistant,
-    tracker: _KeyedEventTracker[_TypedDictT],
-    keys: Iterable[str],
-    job: HassJob[[Event[_TypedDictT]], Any],
-    callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-) -> None:
-    """Remove listener."""
-    for key in keys:
-        callbacks[key].remove(job)
-        if not callbacks[key]:
-            del callbacks[key]
-
-    if not callbacks:
-        hass.data.pop(tracker.key).listener()
-
-
 # tracker, not hass is intentionally the first argument here since its
 # constant and may be used in a partial in the future
 def _async_track_event(
@@ -458,77 +366,28 @@ def _async_track_event(
     if not keys:
         return _remove_empty_listener
 
-    hass_data = hass.data
-    tracker_key = tracker.key
-    if tracker_key in hass_data:
-        event_data = hass_data[tracker_key]
-        callbacks = event_data.callbacks
-    else:
-        callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
-        )
-        event_data = _KeyedEventData(listener, callbacks)
-        hass_data[tracker_key] = event_data
-
-    job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
-
-    if isinstance(keys, str):
-        # Almost all calls to this function use a single key
-        # so we optimize for that case. We don't use setdefault
-        # here because this function gets called ~20000 times
-        # during startup, and we want to avoid the overhead of
-        # creating empty lists and throwing them away.
-        callbacks[keys].append(job)
-        keys = (keys,)
-    else:
-        for key in keys:
-            callbacks[key].append(job)
-
-    return partial(_remove_listener, hass, tracker, keys, job, callbacks)
-
-
-@callback
-def _async_dispatch_old_entity_id_or_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
-    event: Event[EventEntityRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (
-        callbacks_list := callbacks.get(  # type: ignore[call-overload]  # mypy bug?
-            event.data.get("old_entity_id", event.data["entity_id"])
-        )
-    ):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data.get("old_entity_id", event.data["entity_id"]),
-                job,
-            )
+    return hass.bus.async_listen_keyed(
+        tracker.event_type,
+        tracker.key_getter,
+        keys,
+        action,
+        job_type,
+        tracker.dispatch_soon,
+        tracker.match_all,
+    )
 
 
 @callback
-def _async_entity_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
+def _async_old_entity_id_or_entity_id_key(
     event_data: EventEntityRegistryUpdatedData,
-) -> bool:
-    """Filter entity registry updates by entity_id."""
-    return event_data.get("old_entity_id", event_data["entity_id"]) in callbacks
+) -> str:
+    """Return the entity_id of an entity registry update before the update."""
+    return event_data.get("old_entity_id", event_data["entity_id"])  # type: ignore[return-value]
 
 
 _KEYED_TRACK_ENTITY_REGISTRY_UPDATED = _KeyedEventTracker(
-    key=_TRACK_ENTITY_REGISTRY_UPDATED_DATA,
     event_type=EVENT_ENTITY_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_old_entity_id_or_entity_id_event,
-    filter_callable=_async_entity_registry_updated_filter,
+    key_getter=_async_old_entity_id_or_entity_id_key,
 )
 
 
@@ -552,40 +411,14 @@ def async_track_entity_registry_updated_event(
 
 
 @callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
-
-
-@callback
-def _async_dispatch_device_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event: Event[EventDeviceRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["device_id"],
-                job,
-            )
+def _async_device_id_key(event_data: EventDeviceRegistryUpdatedData) -> str:
+    """Return the device_id of a device registry update."""
+    return event_data["device_id"]
 
 
 _KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
-    key=_TRACK_DEVICE_REGISTRY_UPDATED_DATA,
     event_type=EVENT_DEVICE_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
+    key_getter=_async_device_id_key,
 )
 
 
@@ -606,36 +439,13 @@ def async_track_device_registry_updated_event(
 
 
 @callback
-def _async_dispatch_domain_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event: Event[EventStateChangedData],
-) -> None:
-    """Dispatch domain event listeners."""
-    domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while processing event %s for domain %s", event, domain
-            )
-
-
-@callback
-def _async_domain_added_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["old_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If old_state is None, new_state must be set but
-        # mypy doesn't know that
-        event_data["new_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_added_key(event_data: EventStateChangedData) -> str | None:
+    """Return the domain of an added entity."""
+    if event_data["old_state"] is not None:
+        return None
+    # If old_state is None, new_state must be set but
+    # mypy doesn't know that
+    return event_data["new_state"].domain  # type: ignore[union-attr]
 
 
 @bind_hass
@@ -652,10 +462,9 @@ def async_track_state_added_domain(
 
 
 _KEYED_TRACK_STATE_ADDED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_ADDED_DOMAIN_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_added_filter,
+    key_getter=_async_domain_added_key,
+    match_all=True,
 )
 
 
@@ -673,26 +482,19 @@ def _async_track_state_added_domain(
 
 
 @callback
-def _async_domain_removed_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["new_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If new_state is None, old_state must be set but
-        # mypy doesn't know that
-        event_data["old_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_removed_key(event_data: EventStateChangedData) -> str | None:
+    """Return the domain of a removed entity."""
+    if event_data["new_state"] is not None:
+        return None
+    # If new_state is None, old_state must be set but
+    # mypy doesn't know that
+    return event_data["old_state"].domain  # type: ignore[union-attr]
 
 
 _KEYED_TRACK_STATE_REMOVED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_REMOVED_DOMAIN_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_removed_filter,
+    key_getter=_async_domain_removed_key,
+    match_all=True,
 )
 
 
@@ -4,11 +4,16 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
-from collections.abc import Mapping, Sequence, ValuesView
+from collections.abc import Callable, Iterable, Mapping, Sequence, ValuesView
+from datetime import datetime
+import itertools
+import sys
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.core import CoreState, HomeAssistant, callback
 
+from .json import json_bytes
+
 if TYPE_CHECKING:
     from .storage import Store
 
@@ -17,12 +22,30 @@ SAVE_DELAY_LONG = 180
 
 type RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
 
+# The versions of all registry items are taken from one counter, so a
+# version identifies the content of the registry items it was taken from
+_VERSIONS = itertools.count()
+
 
 class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
-    """Base class for registry items."""
+    """Base class for registry items.
+
+    Besides the indexes maintained by subclasses, entries can be indexed
+    by the value of an attribute with _get_lazy_index. These indexes are
+    only built when they are first used.
+
+    The version changes whenever an entry is added, replaced or removed,
+    it can be used to invalidate what is derived from the entries.
+    """
 
     data: dict[str, _DataT]
 
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._lazy_indexes: dict[str, RegistryIndexType] = {}
+        self.version = next(_VERSIONS)
+
     def values(self) -> ValuesView[_DataT]:
         """Return the underlying values to avoid __iter__ overhead."""
         return self.data.values()
@@ -35,13 +58,42 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
     def _unindex_entry(self, key: str, replacement_entry: _DataT | None = None) -> None:
         """Unindex an entry."""
 
+    def _get_lazy_index(self, attribute: str) -> RegistryIndexType:
+        """Return the index of an attribute, building it on first use."""
+        if (index := self._lazy_indexes.get(attribute)) is None:
+            # python has no ordered set, so we use a dict with True values
+            # https://discuss.python.org/t/add-orderedset-to-stdlib/12730
+            index = self._lazy_indexes[attribute] = defaultdict(dict)
+            for key, entry in self.data.items():
+                for value in _index_values(getattr(entry, attribute)):
+                    index[value][key] = True
+        return index
+
+    def _index_lazy_entry(self, key: str, entry: _DataT) -> None:
+        """Index an entry in the lazy indexes that are built."""
+        for attribute, index in self._lazy_indexes.items():
+            for value in _index_values(getattr(entry, attribute)):
+                index[value][key] = True
+
+    def _unindex_lazy_entry(self, key: str) -> None:
+        """Unindex an entry from the lazy indexes that are built."""
+        entry = self.data[key]
+        for attribute, index in self._lazy_indexes.items():
+            for value in _index_values(getattr(entry, attribute)):
+                self._unindex_entry_value(key, value, index)
+
     def __setitem__(self, key: str, entry: _DataT) -> None:
         """Add an item."""
         data = self.data
         if key in data:
             self._unindex_entry(key, entry)
+            if self._lazy_indexes:
+                self._unindex_lazy_entry(key)
         data[key] = entry
         self._index_entry(key, entry)
+        if self._lazy_indexes:
+            self._index_lazy_entry(key, entry)
+        self.version = next(_VERSIONS)
 
     def _unindex_entry_value(
         self, key: str, value: str, index: RegistryIndexType
@@ -60,7 +112,54 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         self._unindex_entry(key)
+        if self._lazy_indexes:
+            self._unindex_lazy_entry(key)
         super().__delitem__(key)
+        self.version = next(_VERSIONS)
+
+
+def _index_values(value: str | Iterable[str] | None) -> Iterable[str]:
+    """Return the values to index of an attribute value."""
+    if value is None:
+        return ()
+    if type(value) is str:
+        return (value,)
+    return value
+
+
+class SharedValues:
+    """Share equal values between the entries loaded into a registry.
+
+    The entries of a registry often have equal strings, timestamps and
+    options. Sharing them keeps a large registry compact in memory.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the shared values."""
+        self._datetimes: dict[str, datetime] = {}
+        self._values: dict[tuple[Callable[[Any], Any] | None, bytes], Any] = {}
+
+    @staticmethod
+    def string(value: str | None) -> str | None:
+        """Return the shared string."""
+        return None if value is None else sys.intern(value)
+
+    def datetime(self, value: str) -> datetime:
+        """Return the shared datetime of an ISO formatted string."""
+        if (result := self._datetimes.get(value)) is None:
+            result = self._datetimes[value] = datetime.fromisoformat(value)
+        return result
+
+    def value(self, value: Any, convert: Callable[[Any], Any] | None = None) -> Any:
+        """Return the shared JSON value, converted by convert.
+
+        The value must not be modified after it is shared.
+        """
+        key = (convert, json_bytes(value))
+        if key in self._values:
+            return self._values[key]
+        result = self._values[key] = value if convert is None else convert(value)
+        return result
 
 
 class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
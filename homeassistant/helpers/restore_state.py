@@ -5,7 +5,9 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 import logging
-from typing import Any, Self, cast
+import sys
+import time
+from typing import Any, NamedTuple, Self, cast
 
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
@@ -17,7 +19,7 @@ from homeassistant.util.json import json_loads
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -26,7 +28,7 @@ DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
@@ -58,6 +60,30 @@ class RestoredExtraData(ExtraStoredData):
         return self.json_dict
 
 
+class DumpStats(NamedTuple):
+    """Statistics of a dump of the stored states.
+
+    cache_size is the approximate memory in bytes held by the cache of
+    the dumped states and the JSON of their extra data, which is kept to
+    be reused by the next dump.
+    """
+
+    states: int
+    encoded: int
+    duration: float
+    json_size: int
+    cache_size: int
+
+
+class _DumpedState(NamedTuple):
+    """The JSON of a stored state from the previous dump."""
+
+    state: State
+    extra_data: dict[str, Any] | None
+    extra_data_fragment: json_fragment | None
+    extra_data_size: int
+
+
 class StoredState:
     """Object to represent a stored state."""
 
@@ -81,11 +107,16 @@ class StoredState:
         }
 
     @classmethod
-    def from_dict(cls, json_dict: dict) -> Self:
-        """Initialize a stored state from a dict."""
+    def from_dict(
+        cls, json_dict: dict, last_dump: datetime | str | None = None
+    ) -> Self:
+        """Initialize a stored state from a dict.
+
+        States without last_seen were seen at the time of the dump.
+        """
         extra_data_dict = json_dict.get("extra_data")
         extra_data = RestoredExtraData(extra_data_dict) if extra_data_dict else None
-        last_seen = json_dict["last_seen"]
+        last_seen = json_dict.get("last_seen", last_dump)
 
         if isinstance(last_seen, str):
             last_seen = dt_util.parse_datetime(last_seen)
@@ -95,6 +126,23 @@ class StoredState:
         )
 
 
+class _RestoreStateStore(Store[dict[str, Any]]):
+    """Store of the restore states."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Migrate to the new version."""
+        if old_major_version == 1:
+            # Version 2 stores the time of the dump once, the states that
+            # were seen at the time of the dump have no last_seen
+            return {"last_dump": None, "states": old_data}
+        raise NotImplementedError
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -118,11 +166,13 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+        self.store = _RestoreStateStore(
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self.last_dump_stats: DumpStats | None = None
+        self._dumped_states: dict[str, _DumpedState] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -138,18 +188,19 @@ class RestoreStateData:
     async def async_load(self) -> None:
         """Load the instance of this data helper."""
         try:
-            stored_states = await self.store.async_load()
+            stored = await self.store.async_load()
         except HomeAssistantError as exc:
             _LOGGER.error("Error loading last states", exc_info=exc)
-            stored_states = None
+            stored = None
 
-        if stored_states is None:
+        if stored is None:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
         else:
+            last_dump = stored["last_dump"]
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
+                item["state"]["entity_id"]: StoredState.from_dict(item, last_dump)
+                for item in stored["states"]
                 if valid_entity_id(item["state"]["entity_id"])
             }
             _LOGGER.debug("Created cache with %s", list(self.last_states))
@@ -162,7 +213,11 @@ class RestoreStateData:
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
         """
-        now = dt_util.utcnow()
+        return self._async_get_stored_states(dt_util.utcnow())
+
+    @callback
+    def _async_get_stored_states(self, now: datetime) -> list[StoredState]:
+        """Get the set of states which should be stored, seen at now."""
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
         current_states_by_entity_id = {
@@ -201,16 +256,99 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                {
+                    "last_dump": now,
+                    "states": self._async_stored_states_as_dicts(
+                        self._async_get_stored_states(now), now
+                    ),
+                }
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
+    @callback
+    def _async_stored_states_as_dicts(
+        self, stored_states: list[StoredState], last_dump: datetime
+    ) -> list[dict[str, Any]]:
+        """Return the dicts of the stored states to be JSON serialized.
+
+        The JSON of states and extra data that did not change since the
+        previous dump is reused instead of encoding them again. The states
+        seen at the time of the dump have no last_seen, so the dicts of
+        the current entities only change when their state does.
+        """
+        start = time.perf_counter()
+        previous = self._dumped_states
+        dumped: dict[str, _DumpedState] = {}
+        as_dicts: list[dict[str, Any]] = []
+        encoded = 0
+        json_size = 0
+        cache_size = sys.getsizeof(dumped)
+        for stored_state in stored_states:
+            state = stored_state.state
+            extra_data = stored_state.extra_data
+            extra_data_dict = extra_data.as_dict() if extra_data else None
+            if (dumped_state := previous.get(state.entity_id)) is not None and (
+                dumped_state.extra_data == extra_data_dict
+                # A dict that is returned again may have been changed in place
+                and (
+                    dumped_state.extra_data is not extra_data_dict
+                    or type(extra_data) is RestoredExtraData
+                )
+            ):
+                if changed := dumped_state.state is not state:
+                    dumped_state = _DumpedState(state, *dumped_state[1:])
+            elif extra_data_dict is None:
+                changed = True
+                dumped_state = _DumpedState(state, None, None, 0)
+            else:
+                changed = True
+                try:
+                    extra_data_json = json_bytes(extra_data_dict)
+                except TypeError:
+                    _LOGGER.error(
+                        "Not saving the state of %s as its extra data can not"
+                        " be serialized: %s",
+                        state.entity_id,
+                        extra_data_dict,
+                    )
+                    continue
+                dumped_state = _DumpedState(
+                    state,
+                    extra_data_dict,
+                    json_fragment(extra_data_json),
+                    len(extra_data_json),
+                )
+            dumped[state.entity_id] = dumped_state
+            encoded += changed
+            json_size += len(state.as_dict_json) + dumped_state.extra_data_size
+            cache_size += sys.getsizeof(dumped_state) + dumped_state.extra_data_size
+            as_dict: dict[str, Any] = {
+                "state": state.json_fragment,
+                "extra_data": dumped_state.extra_data_fragment,
+            }
+            if stored_state.last_seen != last_dump:
+                as_dict["last_seen"] = stored_state.last_seen
+            as_dicts.append(as_dict)
+        self._dumped_states = dumped
+        duration = time.perf_counter() - start
+        self.last_dump_stats = DumpStats(
+            len(as_dicts), encoded, duration, json_size, cache_size
+        )
+        _LOGGER.debug(
+            "Prepared %s states (%s changed, %s bytes of JSON, %s bytes cached)"
+            " in %.3fs",
+            len(as_dicts),
+            encoded,
+            json_size,
+            cache_size,
+            duration,
+        )
+        return as_dicts
+
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Coroutine, Mapping, Sequence
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from copy import copy
@@ -29,6 +29,7 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_FLOOR_ID,
     ATTR_LABEL_ID,
+    CONF_ACTION,
     CONF_ALIAS,
     CONF_CHOOSE,
     CONF_CONDITION,
@@ -57,6 +58,7 @@ from homeassistant.const import (
     CONF_SERVICE,
     CONF_SERVICE_DATA,
     CONF_SERVICE_DATA_TEMPLATE,
+    CONF_SERVICE_TEMPLATE,
     CONF_SET_CONVERSATION_RESPONSE,
     CONF_STOP,
     CONF_TARGET,
@@ -67,6 +69,8 @@ from homeassistant.const import (
     CONF_WAIT_FOR_TRIGGER,
     CONF_WAIT_TEMPLATE,
     CONF_WHILE,
+    ENTITY_MATCH_ALL,
+    ENTITY_MATCH_NONE,
     EVENT_HOMEASSISTANT_STOP,
     SERVICE_TURN_ON,
 )
@@ -79,6 +83,7 @@ from homeassistant.core import (
     State,
     SupportsResponse,
     callback,
+    valid_entity_id,
 )
 from homeassistant.util import slugify
 from homeassistant.util.async_ import create_eager_task
@@ -97,6 +102,7 @@ from .trace import (
     async_trace_path,
     script_execution_set,
     trace_append_element,
+    trace_enabled,
     trace_id_get,
     trace_path,
     trace_path_get,
@@ -491,7 +497,11 @@ class _ScriptRun:
         return ScriptRunResult(self._conversation_response, response, self._variables)
 
     async def _async_step(self, log_exceptions: bool) -> None:
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        if not trace_enabled():
+            # The run is not traced, skip building the trace of the step
+            if not self._stop.done():
+                await self._async_run_step(log_exceptions, None)
+            return
 
         with trace_path(str(self._step)):
             async with trace_action(
@@ -499,37 +509,44 @@ class _ScriptRun:
             ) as trace_element:
                 if self._stop.done():
                     return
+                await self._async_run_step(log_exceptions, trace_element)
 
-                action = cv.determine_script_action(self._action)
-
-                if CONF_ENABLED in self._action:
-                    enabled = self._action[CONF_ENABLED]
-                    if isinstance(enabled, Template):
-                        try:
-                            enabled = enabled.async_render(limited=True)
-                        except exceptions.TemplateError as ex:
-                            self._handle_exception(
-                                ex,
-                                continue_on_error,
-                                self._log_exceptions or log_exceptions,
-                            )
-                    if not enabled:
-                        self._log(
-                            "Skipped disabled step %s",
-                            self._action.get(CONF_ALIAS, action),
-                        )
-                        trace_set_result(enabled=False)
-                        return
+    async def _async_run_step(
+        self, log_exceptions: bool, trace_element: TraceElement | None
+    ) -> None:
+        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        compiled = self._script._get_compiled_step(self._step)  # noqa: SLF001
 
-                handler = f"_async_{action}_step"
+        if CONF_ENABLED in self._action:
+            enabled = self._action[CONF_ENABLED]
+            if isinstance(enabled, Template):
                 try:
-                    await getattr(self, handler)()
-                except Exception as ex:  # noqa: BLE001
+                    enabled = enabled.async_render(limited=True)
+                except exceptions.TemplateError as ex:
                     self._handle_exception(
-                        ex, continue_on_error, self._log_exceptions or log_exceptions
+                        ex,
+                        continue_on_error,
+                        self._log_exceptions or log_exceptions,
                     )
-                finally:
-                    trace_element.update_variables(self._variables)
+            if not enabled:
+                self._log(
+                    "Skipped disabled step %s",
+                    self._action.get(
+                        CONF_ALIAS, cv.determine_script_action(self._action)
+                    ),
+                )
+                trace_set_result(enabled=False)
+                return
+
+        try:
+            await compiled.handler(self)
+        except Exception as ex:  # noqa: BLE001
+            self._handle_exception(
+                ex, continue_on_error, self._log_exceptions or log_exceptions
+            )
+        finally:
+            if trace_element is not None:
+                trace_element.update_variables(self._variables)
 
     def _finish(self) -> None:
         self._script._runs.remove(self)  # noqa: SLF001
@@ -732,9 +749,19 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        compiled = self._script._get_compiled_step(self._step)  # noqa: SLF001
+        if (static_params := compiled.service_params) is not None:
+            # Copy the service call as the service call modifies the data
+            params: service.ServiceParams = {
+                "domain": static_params["domain"],
+                "service": static_params["service"],
+                "service_data": template.render_complex(static_params["service_data"]),
+                "target": template.render_complex(static_params["target"]),
+            }
+        else:
+            params = service.async_prepare_call_from_config(
+                self._hass, self._action, self._variables
+            )
 
         # Validate response data parameters. This check ignores services that do
         # not exist which will raise an appropriate error in the service call below.
@@ -821,7 +848,9 @@ class _ScriptRun:
         self._script.last_action = self._action.get(
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
-        cond = await self._async_get_condition(self._action)
+        compiled = self._script._get_compiled_step(self._step)  # noqa: SLF001
+        if (cond := compiled.condition) is None:
+            cond = compiled.condition = await self._async_get_condition(self._action)
         try:
             trace_element = trace_stack_top(trace_stack_cv)
             if trace_element:
@@ -1257,7 +1286,8 @@ class _ScriptRun:
 
         async def async_run_with_trace(idx: int, script: Script) -> None:
             """Run a script with a trace path."""
-            trace_path_stack_cv.set(copy(trace_path_stack_cv.get()))
+            if trace_enabled():
+                trace_path_stack_cv.set(copy(trace_path_stack_cv.get()))
             with trace_path([str(idx), "sequence"]):
                 await self._async_run_script(script)
 
@@ -1387,6 +1417,86 @@ class _IfData(TypedDict):
     if_else: Script | None
 
 
+@dataclass(slots=True)
+class _CompiledStep:
+    """A step of a script sequence, prepared to be run.
+
+    The step is compiled when it is first run and then reused by every run.
+    """
+
+    handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]]
+    # The condition of a condition step, created when it is first tested
+    condition: ConditionCheckerType | None = None
+    # The service call of a call service step without templates
+    service_params: service.ServiceParams | None = None
+
+
+def _compile_step(hass: HomeAssistant, action: dict[str, Any]) -> _CompiledStep:
+    """Compile a step of a script sequence."""
+    action_type = cv.determine_script_action(action)
+    compiled = _CompiledStep(getattr(_ScriptRun, f"_async_{action_type}_step"))
+    if action_type == cv.SCRIPT_ACTION_CALL_SERVICE:
+        compiled.service_params = _static_service_params(hass, action)
+    return compiled
+
+
+def _is_static(value: Any) -> bool:
+    """Return if a config value renders to the same result in every run."""
+    if isinstance(value, Template):
+        return value.is_static
+    if isinstance(value, list):
+        return all(_is_static(item) for item in value)
+    if isinstance(value, Mapping):
+        return all(_is_static(key) and _is_static(val) for key, val in value.items())
+    return True
+
+
+def _is_entity_ids(value: Any) -> bool:
+    """Return if a config value only holds entity ids, not registry ids."""
+    if isinstance(value, Template):
+        value = value.template
+    if isinstance(value, str):
+        if value.lower() in (ENTITY_MATCH_ALL, ENTITY_MATCH_NONE):
+            return True
+        value = value.split(",")
+    if not isinstance(value, list):
+        return False
+    for item in value:
+        if isinstance(item, Template):
+            item = item.template
+        if not isinstance(item, str) or not valid_entity_id(item.strip().lower()):
+            return False
+    return True
+
+
+def _static_service_params(
+    hass: HomeAssistant, action: dict[str, Any]
+) -> service.ServiceParams | None:
+    """Return the service call of an action if it does not depend on the run."""
+    if (
+        not isinstance(action.get(CONF_ACTION), str)
+        or CONF_SERVICE_TEMPLATE in action
+        or not all(
+            _is_static(action[key])
+            for key in (CONF_TARGET, CONF_SERVICE_DATA, CONF_SERVICE_DATA_TEMPLATE)
+            if key in action
+        )
+    ):
+        return None
+    # Entity registry ids are resolved when the call is prepared, so a call
+    # targeting them would keep the entity id an entity had when it was cached
+    target = action.get(CONF_TARGET)
+    if target is not None and (
+        not isinstance(target, Mapping)
+        or (ATTR_ENTITY_ID in target and not _is_entity_ids(target[ATTR_ENTITY_ID]))
+    ):
+        return None
+    try:
+        return service.async_prepare_call_from_config(hass, action)
+    except exceptions.HomeAssistantError:
+        return None
+
+
 @dataclass
 class ScriptRunResult:
     """Container with the result of a script run."""
@@ -1461,6 +1571,7 @@ class Script:
         self._if_data: dict[int, _IfData] = {}
         self._parallel_scripts: dict[int, list[Script]] = {}
         self._sequence_scripts: dict[int, Script] = {}
+        self._compiled_steps: dict[int, _CompiledStep] = {}
         self.variables = variables
         self._variables_dynamic = template.is_complex(variables)
         self._copy_variables_on_run = copy_variables
@@ -1849,6 +1960,12 @@ class Script:
         sub_script.change_listener = partial(self._chain_change_listener, sub_script)
         return sub_script
 
+    def _get_compiled_step(self, step: int) -> _CompiledStep:
+        if not (compiled := self._compiled_steps.get(step)):
+            compiled = _compile_step(self._hass, self.sequence[step])
+            self._compiled_steps[step] = compiled
+        return compiled
+
     def _get_repeat_script(self, step: int) -> Script:
         if not (sub_script := self._repeat_script.get(step)):
             sub_script = self._prep_repeat_script(step)
@@ -69,6 +69,7 @@ from .typing import ConfigType, TemplateVarsType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
     from .entity import Entity
+    from .entity_platform import EntityPlatform
 
 CONF_SERVICE_ENTITY_ID = "entity_id"
 
@@ -80,6 +81,7 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_INDEX: HassKey[_TargetIndex] = HassKey("service_target_index")
 
 
 @cache
@@ -306,6 +308,160 @@ class SelectedEntities:
         )
 
 
+@dataclasses.dataclass(slots=True, frozen=True)
+class _ResolvedTarget:
+    """Class to hold what a device, area, floor or label target resolves to."""
+
+    entity_ids: frozenset[str]
+    device_ids: frozenset[str]
+    area_ids: frozenset[str]
+
+
+class _TargetIndex:
+    """Index of what device, area, floor and label targets resolve to.
+
+    Targets are resolved when they are first used, the resolved targets
+    are discarded when the entity, device or area registry changes.
+    """
+
+    __slots__ = ("_hass", "_resolved", "_versions")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._resolved: dict[tuple[str, str], _ResolvedTarget] = {}
+        self._versions: tuple[int, int, int] | None = None
+
+    @callback
+    def async_resolve(self, target: str, target_id: str) -> _ResolvedTarget:
+        """Return what a target resolves to.
+
+        target is one of ATTR_DEVICE_ID, ATTR_AREA_ID, ATTR_FLOOR_ID or
+        ATTR_LABEL_ID.
+        """
+        hass = self._hass
+        versions = (
+            entity_registry.async_get(hass).entities.version,
+            device_registry.async_get(hass).devices.version,
+            area_registry.async_get(hass).areas.version,
+        )
+        if versions != self._versions:
+            self._resolved.clear()
+            self._versions = versions
+        if (resolved := self._resolved.get((target, target_id))) is None:
+            resolved = self._resolved[(target, target_id)] = self._RESOLVERS[target](
+                self, target_id
+            )
+        return resolved
+
+    def _union(self, resolved_targets: Iterable[_ResolvedTarget]) -> _ResolvedTarget:
+        """Return the union of resolved targets."""
+        entity_ids: set[str] = set()
+        device_ids: set[str] = set()
+        area_ids: set[str] = set()
+        for resolved in resolved_targets:
+            entity_ids.update(resolved.entity_ids)
+            device_ids.update(resolved.device_ids)
+            area_ids.update(resolved.area_ids)
+        return _ResolvedTarget(
+            frozenset(entity_ids), frozenset(device_ids), frozenset(area_ids)
+        )
+
+    def _resolve_device(self, device_id: str) -> _ResolvedTarget:
+        """Resolve a device target."""
+        entities = entity_registry.async_get(self._hass).entities
+        return _ResolvedTarget(
+            frozenset(
+                entry.entity_id
+                for entry in entities.get_entries_for_device_id(device_id)
+                # Do not add entities which are hidden or which are config
+                # or diagnostic entities.
+                if entry.entity_category is None and entry.hidden_by is None
+            ),
+            frozenset((device_id,)),
+            frozenset(),
+        )
+
+    def _resolve_area(self, area_id: str) -> _ResolvedTarget:
+        """Resolve an area target."""
+        entities = entity_registry.async_get(self._hass).entities
+        devices = device_registry.async_get(self._hass).devices
+        device_ids = frozenset(
+            device_entry.id for device_entry in devices.get_devices_for_area_id(area_id)
+        )
+        entity_ids = {
+            entry.entity_id
+            # The entity's area matches a targeted area
+            for entry in entities.get_entries_for_area_id(area_id)
+            # Do not add entities which are hidden or which are config
+            # or diagnostic entities.
+            if entry.entity_category is None and entry.hidden_by is None
+        }
+        entity_ids.update(
+            entry.entity_id
+            for device_id in device_ids
+            for entry in entities.get_entries_for_device_id(device_id)
+            # The entity's device is in the area and the entity
+            # has no explicitly set area
+            if entry.entity_category is None
+            and entry.hidden_by is None
+            and not entry.area_id
+        )
+        return _ResolvedTarget(frozenset(entity_ids), device_ids, frozenset((area_id,)))
+
+    def _resolve_floor(self, floor_id: str) -> _ResolvedTarget:
+        """Resolve a floor target."""
+        areas = area_registry.async_get(self._hass).areas
+        return self._union(
+            self.async_resolve(ATTR_AREA_ID, area_entry.id)
+            for area_entry in areas.get_areas_for_floor(floor_id)
+        )
+
+    def _resolve_label(self, label_id: str) -> _ResolvedTarget:
+        """Resolve a label target."""
+        hass = self._hass
+        entities = entity_registry.async_get(hass).entities
+        devices = device_registry.async_get(hass).devices
+        areas = area_registry.async_get(hass).areas
+        labeled_entities = _ResolvedTarget(
+            frozenset(
+                entry.entity_id
+                for entry in entities.get_entries_for_label(label_id)
+                if entry.entity_category is None and entry.hidden_by is None
+            ),
+            frozenset(),
+            frozenset(),
+        )
+        return self._union(
+            [
+                labeled_entities,
+                *(
+                    self.async_resolve(ATTR_DEVICE_ID, device_entry.id)
+                    for device_entry in devices.get_devices_for_label(label_id)
+                ),
+                *(
+                    self.async_resolve(ATTR_AREA_ID, area_entry.id)
+                    for area_entry in areas.get_areas_for_label(label_id)
+                ),
+            ]
+        )
+
+    _RESOLVERS: dict[str, Callable[[_TargetIndex, str], _ResolvedTarget]] = {
+        ATTR_DEVICE_ID: _resolve_device,
+        ATTR_AREA_ID: _resolve_area,
+        ATTR_FLOOR_ID: _resolve_floor,
+        ATTR_LABEL_ID: _resolve_label,
+    }
+
+
+@callback
+def _async_get_target_index(hass: HomeAssistant) -> _TargetIndex:
+    """Return the target index."""
+    if (index := hass.data.get(TARGET_INDEX)) is None:
+        index = hass.data[TARGET_INDEX] = _TargetIndex(hass)
+    return index
+
+
 @bind_hass
 def call_from_config(
     hass: HomeAssistant,
@@ -503,7 +659,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -527,7 +683,6 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
 
@@ -551,81 +706,18 @@ def async_extract_referenced_entity_ids(  # noqa: C901
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
 
-            for entity_entry in entities.get_entries_for_label(label_id):
-                if (
-                    entity_entry.entity_category is None
-                    and entity_entry.hidden_by is None
-                ):
-                    selected.indirectly_referenced.add(entity_entry.entity_id)
-
-            for device_entry in dev_reg.devices.get_devices_for_label(label_id):
-                selected.referenced_devices.add(device_entry.id)
-
-            for area_entry in area_reg.areas.get_areas_for_label(label_id):
-                selected.referenced_areas.add(area_entry.id)
-
-    # Find areas for targeted floors
-    if selector.floor_ids:
-        selected.referenced_areas.update(
-            area_entry.id
-            for floor_id in selector.floor_ids
-            for area_entry in area_reg.areas.get_areas_for_floor(floor_id)
-        )
-
-    selected.referenced_areas.update(selector.area_ids)
-    selected.referenced_devices.update(selector.device_ids)
-
-    if not selected.referenced_areas and not selected.referenced_devices:
-        return selected
-
-    # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (entry.entity_category is None and entry.hidden_by is None)
-    )
-
-    # Find devices for targeted areas
-    referenced_devices_by_area: set[str] = set()
-    if selected.referenced_areas:
-        for area_id in selected.referenced_areas:
-            referenced_devices_by_area.update(
-                device_entry.id
-                for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
-            )
-    selected.referenced_devices.update(referenced_devices_by_area)
-
-    # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
-    # Add indirectly referenced by area through device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in referenced_devices_by_area
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-            )
-        )
-    )
+    index = _async_get_target_index(hass)
+    for target, target_ids in (
+        (ATTR_DEVICE_ID, selector.device_ids),
+        (ATTR_AREA_ID, selector.area_ids),
+        (ATTR_FLOOR_ID, selector.floor_ids),
+        (ATTR_LABEL_ID, selector.label_ids),
+    ):
+        for target_id in target_ids:
+            resolved = index.async_resolve(target, target_id)
+            selected.indirectly_referenced.update(resolved.entity_ids)
+            selected.referenced_devices.update(resolved.device_ids)
+            selected.referenced_areas.update(resolved.area_ids)
 
     return selected
 
@@ -923,6 +1015,7 @@ async def entity_service_call(
     func: str | HassJob,
     call: ServiceCall,
     required_features: Iterable[int] | None = None,
+    entity_params: Callable[..., dict[str, Any]] | None = None,
 ) -> EntityServiceResponse | None:
     """Handle an entity service call.
 
@@ -1013,42 +1106,153 @@ async def entity_service_call(
             await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
+    single_entities, batches = _group_batched_entities(
+        call, func, data, entities, entity_params
+    )
+
     # Use asyncio.gather here to ensure the returned results
-    # are in the same order as the entities list
-    results: list[ServiceResponse | BaseException] = await asyncio.gather(
+    # are in the same order as the entities and batches
+    results: list[
+        ServiceResponse | EntityServiceResponse | BaseException
+    ] = await asyncio.gather(
         *[
             entity.async_request_call(
                 _handle_entity_call(hass, entity, func, data, call.context)
             )
-            for entity in entities
+            for entity in single_entities
+        ],
+        *[
+            _handle_batch_call(platform, batch, call, batch_data)
+            for platform, batch, batch_data in batches
         ],
         return_exceptions=True,
     )
 
-    response_data: EntityServiceResponse = {}
-    for entity, result in zip(entities, results, strict=False):
+    entity_results: dict[str, ServiceResponse] = {}
+    for entity, result in zip(single_entities, results, strict=False):
         if isinstance(result, BaseException):
             raise result from None
-        response_data[entity.entity_id] = result
+        entity_results[entity.entity_id] = cast(ServiceResponse, result)
+    for (_, batch, _), batch_result in zip(
+        batches, results[len(single_entities) :], strict=True
+    ):
+        if isinstance(batch_result, BaseException):
+            raise batch_result from None
+        batch_response = cast(EntityServiceResponse | None, batch_result) or {}
+        for entity in batch:
+            entity_results[entity.entity_id] = batch_response.get(entity.entity_id)
+
+    response_data: EntityServiceResponse = {
+        entity.entity_id: entity_results[entity.entity_id] for entity in entities
+    }
+
+    if polling_entities := [entity for entity in entities if entity.should_poll]:
+        await _async_update_polling_entities(hass, polling_entities, call.context)
 
-    tasks: list[asyncio.Task[None]] = []
+    return response_data if return_response and response_data else None
 
+
+def _group_batched_entities(
+    call: ServiceCall,
+    func: str | HassJob,
+    data: dict | ServiceCall,
+    entities: list[Entity],
+    entity_params: Callable[..., dict[str, Any]] | None,
+) -> tuple[list[Entity], list[tuple[EntityPlatform, list[Entity], dict[str, Any]]]]:
+    """Group the entities of platforms with a batch handler for the service.
+
+    Services that call an entity method by name pass the same data to
+    each entity. A service function may process the call differently for
+    each entity, so it is only batched if the service was registered with
+    entity_params, which returns the processed data of an entity. The
+    entities of a platform are then batched by equal data.
+
+    Returns the entities to call one by one and the batches of entities
+    to call at once with their platform and data.
+    """
+    if not isinstance(func, str) and entity_params is None:
+        return entities, []
+    service_key = (call.domain, call.service)
+    single_entities: list[Entity] = []
+    grouped: dict[EntityPlatform, list[tuple[dict[str, Any], list[Entity]]]] = {}
     for entity in entities:
-        if not entity.should_poll:
+        if (
+            platform := entity.platform
+        ) is None or service_key not in platform.service_batch_handlers:
+            single_entities.append(entity)
             continue
+        if entity_params is None:
+            params = cast(dict[str, Any], data)
+        else:
+            params = entity_params(entity, call)
+        platform_batches = grouped.setdefault(platform, [])
+        for batch_params, batch in platform_batches:
+            if batch_params == params:
+                batch.append(entity)
+                break
+        else:
+            platform_batches.append((params, [entity]))
+    batches: list[tuple[EntityPlatform, list[Entity], dict[str, Any]]] = []
+    for platform, platform_batches in grouped.items():
+        for params, batch in platform_batches:
+            if len(batch) == 1:
+                single_entities.append(batch[0])
+            else:
+                batches.append((platform, batch, params))
+    return single_entities, batches
+
+
+async def _handle_batch_call(
+    platform: EntityPlatform,
+    entities: list[Entity],
+    call: ServiceCall,
+    data: dict[str, Any],
+) -> EntityServiceResponse | None:
+    """Handle calling the batch handler of a platform."""
+    for entity in entities:
+        entity.async_set_context(call.context)
+    handler = platform.service_batch_handlers[(call.domain, call.service)]
+    if (parallel_updates := platform.parallel_updates) is None:
+        return await handler(entities, data)
+    async with parallel_updates:
+        return await handler(entities, data)
+
 
+async def _async_update_polling_entities(
+    hass: HomeAssistant, entities: list[Entity], context: Context
+) -> None:
+    """Update polling entities and write their states at once."""
+    for entity in entities:
         # Context expires if the turn on commands took a long time.
         # Set context again so it's there when we update
-        entity.async_set_context(call.context)
-        tasks.append(create_eager_task(entity.async_update_ha_state(True)))
+        entity.async_set_context(context)
+    updated = await asyncio.gather(
+        *[create_eager_task(_async_device_update(entity)) for entity in entities]
+    )
+    # pylint: disable-next=import-outside-toplevel
+    from .entity import async_write_ha_states
+
+    async_write_ha_states(
+        hass,
+        [
+            entity
+            for entity, entity_updated in zip(entities, updated, strict=True)
+            if entity_updated
+        ],
+    )
 
-    if tasks:
-        done, pending = await asyncio.wait(tasks)
-        assert not pending
-        for future in done:
-            future.result()  # pop exception if have
 
-    return response_data if return_response and response_data else None
+async def _async_device_update(entity: Entity) -> bool:
+    """Update an entity before its state is written.
+
+    Returns if the entity was updated.
+    """
+    try:
+        await entity.async_device_update()
+    except Exception:
+        _LOGGER.exception("Update for %s fails", entity.entity_id)
+        return False
+    return True
 
 
 async def _handle_entity_call(
@@ -1265,12 +1469,18 @@ def async_register_entity_service(
     required_features: Iterable[int] | None = None,
     schema: VolDictType | VolSchemaType | None,
     supports_response: SupportsResponse = SupportsResponse.NONE,
+    entity_params: Callable[..., dict[str, Any]] | None = None,
 ) -> None:
     """Help registering an entity service.
 
     This is called by EntityComponent.async_register_entity_service and
     EntityPlatform.async_register_entity_service and should not be called
     directly by integrations.
+
+    If func is a function, entity_params may return the keyword arguments
+    func calls the entity method with for an entity and a service call,
+    which allows the service to be handled by the batch handlers of the
+    entity platforms.
     """
     if schema is None or isinstance(schema, dict):
         schema = cv.make_entity_service_schema(schema)
@@ -1296,6 +1506,7 @@ def async_register_entity_service(
             entities,
             service_func,
             required_features=required_features,
+            entity_params=entity_params,
         ),
         schema,
         supports_response,
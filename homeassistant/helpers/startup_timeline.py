@@ -0,0 +1,230 @@
+"""Record a timeline of the startup of Home Assistant.
+
+When Home Assistant is started with --profile-startup, the setup of
+integrations, config entries and platforms, imports, Store loads and the
+intervals the event loop was blocked are recorded as spans. The timeline
+is written in the Chrome trace event format when startup is done, it can
+be opened with chrome://tracing or https://ui.perfetto.dev.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import logging
+import os
+import threading
+import time
+from typing import Any, Final
+from weakref import WeakKeyDictionary
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .json import json_bytes
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP_TIMELINE: HassKey[StartupTimeline] = HassKey("startup_timeline")
+
+TIMELINE_FILENAME: Final = "startup_timeline.json"
+
+# How often the event loop is checked for being blocked
+LOOP_CHECK_INTERVAL = 0.01
+# The minimum time the event loop must be blocked to be recorded
+LOOP_BLOCKED_THRESHOLD = 0.05
+
+CATEGORY_INTEGRATION: Final = "integration"
+CATEGORY_CONFIG_ENTRY: Final = "config_entry"
+CATEGORY_PLATFORM: Final = "platform"
+CATEGORY_WAIT: Final = "wait"
+CATEGORY_IMPORT: Final = "import"
+CATEGORY_STORAGE: Final = "storage"
+CATEGORY_STAGE: Final = "stage"
+CATEGORY_LOOP_BLOCKED: Final = "loop_blocked"
+
+# The lane of the event loop blocking intervals
+_LOOP_LANE = 0
+
+
+@dataclass(slots=True, frozen=True)
+class TimelineSpan:
+    """A span of the startup timeline."""
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    lane: int
+    args: dict[str, Any]
+
+
+class StartupTimeline:
+    """Timeline of the spans recorded during startup.
+
+    Spans are placed in lanes by the asyncio task that recorded them, so
+    the spans of a lane are nested in each other like the calls of a stack.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self.started = time.monotonic()
+        self.spans: list[TimelineSpan] = []
+        # Tasks are weakly referenced, a finished task can be garbage
+        # collected and a new task must not reuse its lane
+        self._lanes: WeakKeyDictionary[asyncio.Task[Any] | threading.Thread, int] = (
+            WeakKeyDictionary()
+        )
+        self._lane_names: list[str] = []
+        self._loop_check: asyncio.TimerHandle | None = None
+
+    def _lane(self) -> int:
+        """Return the lane of the current task or thread."""
+        try:
+            task: asyncio.Task[Any] | threading.Thread | None = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is None:
+            task = threading.current_thread()
+        if (lane := self._lanes.get(task)) is None:
+            self._lane_names.append(
+                task.get_name() if isinstance(task, asyncio.Task) else task.name
+            )
+            lane = self._lanes[task] = len(self._lane_names)
+        return lane
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        duration: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Add a span which started at the monotonic time start."""
+        self.spans.append(
+            TimelineSpan(name, category, start, duration, self._lane(), args or {})
+        )
+
+    @contextmanager
+    def span(
+        self, name: str, category: str, args: dict[str, Any] | None = None
+    ) -> Generator[None]:
+        """Record the time spent in the context as a span."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add_span(name, category, start, time.monotonic() - start, args)
+
+    def async_start_loop_watch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start recording the intervals the event loop is blocked."""
+        expected = loop.time() + LOOP_CHECK_INTERVAL
+
+        def _check_loop() -> None:
+            nonlocal expected
+            now = loop.time()
+            if (blocked := now - expected) >= LOOP_BLOCKED_THRESHOLD:
+                self.spans.append(
+                    TimelineSpan(
+                        "event loop blocked",
+                        CATEGORY_LOOP_BLOCKED,
+                        expected,
+                        blocked,
+                        _LOOP_LANE,
+                        {},
+                    )
+                )
+            expected = now + LOOP_CHECK_INTERVAL
+            self._loop_check = loop.call_at(expected, _check_loop)
+
+        self._loop_check = loop.call_at(expected, _check_loop)
+
+    def async_stop_loop_watch(self) -> None:
+        """Stop recording the intervals the event loop is blocked."""
+        if self._loop_check is not None:
+            self._loop_check.cancel()
+            self._loop_check = None
+
+    def as_trace_events(self) -> list[dict[str, Any]]:
+        """Return the timeline in the Chrome trace event format."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": _LOOP_LANE,
+                "args": {"name": "event loop"},
+            }
+        ]
+        events.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": lane,
+                "args": {"name": name},
+            }
+            for lane, name in enumerate(self._lane_names, 1)
+        )
+        started = self.started
+        events.extend(
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round((span.start - started) * 1_000_000),
+                "dur": round(span.duration * 1_000_000),
+                "pid": pid,
+                "tid": span.lane,
+                "args": span.args,
+            }
+            for span in sorted(self.spans, key=lambda span: span.start)
+        )
+        return events
+
+    def write(self, path: str) -> None:
+        """Write the timeline to a file in the Chrome trace event format."""
+        with open(path, "wb") as fdesc:
+            fdesc.write(json_bytes({"traceEvents": self.as_trace_events()}))
+
+
+@callback
+def async_get_timeline(hass: HomeAssistant) -> StartupTimeline | None:
+    """Return the startup timeline if startup is being profiled."""
+    return hass.data.get(DATA_STARTUP_TIMELINE)
+
+
+@contextmanager
+def timeline_span(
+    hass: HomeAssistant, name: str, category: str, args: dict[str, Any] | None = None
+) -> Generator[None]:
+    """Record the time spent in the context if startup is being profiled."""
+    if (timeline := hass.data.get(DATA_STARTUP_TIMELINE)) is None:
+        yield
+        return
+    with timeline.span(name, category, args):
+        yield
+
+
+@callback
+def async_setup_timeline(hass: HomeAssistant) -> None:
+    """Profile the startup and write the timeline when startup is done."""
+    timeline = hass.data[DATA_STARTUP_TIMELINE] = StartupTimeline()
+    timeline.async_start_loop_watch(hass.loop)
+
+    async def _async_write_timeline(_: Event) -> None:
+        """Write the timeline when startup is done."""
+        timeline.async_stop_loop_watch()
+        del hass.data[DATA_STARTUP_TIMELINE]
+        path = hass.config.path(TIMELINE_FILENAME)
+        await hass.async_add_executor_job(timeline.write, path)
+        _LOGGER.info(
+            "Startup timeline with %s spans written to %s", len(timeline.spans), path
+        )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_write_timeline)
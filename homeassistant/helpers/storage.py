@@ -36,6 +36,7 @@ from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
+from .startup_timeline import CATEGORY_STORAGE, timeline_span
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -49,6 +50,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the main file once it grows
+# beyond this share of the size of the main file
+JOURNAL_COMPACT_RATIO = 0.5
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -90,6 +96,148 @@ async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
     return config
 
 
+def _json_diff(old: Any, new: Any, path: list[str | int], ops: list[list[Any]]) -> None:
+    """Add the journal operations that turn old into new to ops.
+
+    Dicts and lists are compared item by item, see _json_diff_list
+    for lists that changed length.
+    """
+    if old is new:
+        return
+    if type(old) is dict and type(new) is dict:
+        ops.extend(["d", [*path, key]] for key in old.keys() - new.keys())
+        for key, value in new.items():
+            if key in old:
+                _json_diff(old[key], value, [*path, key], ops)
+            else:
+                ops.append(["s", [*path, key], value])
+        return
+    if type(old) is list and type(new) is list:
+        _json_diff_list(old, new, path, ops)
+        return
+    if not _json_same(old, new):
+        ops.append(["s", path, new])
+
+
+def _json_diff_list(
+    old: list[Any], new: list[Any], path: list[str | int], ops: list[list[Any]]
+) -> None:
+    """Add the journal operations that turn the old list into the new list to ops.
+
+    When the length changed, the added or removed items are spliced in at
+    the one place that leaves the fewest of the other items changed.
+    """
+    start = 0
+    old_end = len(old)
+    new_end = len(new)
+    while start < old_end and start < new_end and _json_same(old[start], new[start]):
+        start += 1
+    while (
+        old_end > start
+        and new_end > start
+        and _json_same(old[old_end - 1], new[new_end - 1])
+    ):
+        old_end -= 1
+        new_end -= 1
+    if (shift := new_end - old_end) == 0:
+        for index in range(start, new_end):
+            _json_diff(old[index], new[index], [*path, index], ops)
+        return
+    shorter, longer = (old, new) if shift > 0 else (new, old)
+    shift = abs(shift)
+    length = min(old_end, new_end) - start
+    # The number of changed items if the splice is at each index
+    changed = [0] * (length + 1)
+    for index in range(length):
+        changed[index + 1] = changed[index] + (
+            not _json_same(shorter[start + index], longer[start + index])
+        )
+    after = 0
+    for index in range(length - 1, -1, -1):
+        after += not _json_same(shorter[start + index], longer[start + index + shift])
+        changed[index] += after
+    split = start + changed.index(min(changed))
+    for index in range(start, split):
+        _json_diff(old[index], new[index], [*path, index], ops)
+    if new_end > old_end:
+        ops.append(["r", path, split, split, new[split : split + shift]])
+        for index in range(split, start + length):
+            _json_diff(old[index], new[index + shift], [*path, index + shift], ops)
+    else:
+        ops.append(["r", path, split, split + shift, []])
+        for index in range(split, start + length):
+            _json_diff(old[index + shift], new[index], [*path, index], ops)
+
+
+def _json_same(old: Any, new: Any) -> bool:
+    """Return if two values are the same.
+
+    Unlike ==, the types of the values have to match as well, since
+    1, 1.0 and True are equal but are not written the same way.
+    """
+    if old is new:
+        return True
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(
+            _json_same(value, new[key]) for key, value in old.items()
+        )
+    if isinstance(old, (list, tuple)):
+        return len(old) == len(new) and all(map(_json_same, old, new))
+    return bool(old == new)
+
+
+def _json_apply(data: Any, ops: Any) -> Any:
+    """Apply journal operations to data and return the result.
+
+    The dicts and lists on the paths of the operations are copied
+    before they are changed, so data is left as it was if any of
+    the operations does not apply.
+    """
+    copied: set[int] = set()
+    for op in ops:
+        kind, path = op[0], op[1]
+        if kind == "s" and not path:
+            data = op[2]
+            continue
+        if id(data) not in copied:
+            data = _json_copy(data, copied)
+        target = data
+        for key in path if kind == "r" else path[:-1]:
+            key = _json_key(target, key)
+            if id(child := target[key]) not in copied:
+                child = target[key] = _json_copy(child, copied)
+            target = child
+        if kind == "r":
+            target[op[2] : op[3]] = op[4]
+        elif kind == "s":
+            target[_json_key(target, path[-1])] = op[2]
+        else:
+            del target[_json_key(target, path[-1])]
+    return data
+
+
+def _json_copy(value: Any, copied: set[int]) -> Any:
+    """Return a shallow copy of a JSON decoded dict or list."""
+    if type(value) is dict:
+        value = dict(value)
+    elif type(value) is list:
+        value = list(value)
+    else:
+        raise TypeError(f"Can not change a {type(value).__name__}")
+    copied.add(id(value))
+    return value
+
+
+def _json_key(target: Any, key: str | int) -> str | int:
+    """Return the key of a path in the JSON decoded target."""
+    # Non string keys of dicts are decoded as strings
+    if type(key) is int and type(target) is dict:
+        return str(key)
+    return key
+
+
 def get_internal_store_manager(hass: HomeAssistant) -> _StoreManager:
     """Get the store manager.
 
@@ -242,8 +390,17 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal is set, changes are appended to a journal file next to
+        the main file which is rewritten once the journal grows too large
+        and at the final write, so the main file is complete after a clean
+        shutdown. The data to save must not be changed after it was saved as it is
+        kept to find the changes of the next save, and the journal is always
+        written with the default JSON encoder.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,12 +416,26 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        # The data last written to the main file and the journal,
+        # None if the next write has to rewrite the main file
+        self._journal_base: Any = None
+        self._journal_generation = 0
+        self._journal_size = 0
+        self._journal_max_size = 0
+        # The next write has to rewrite the main file
+        self._journal_compact = False
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -307,7 +478,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if STORAGE_SEMAPHORE not in self.hass.data:
             self.hass.data[STORAGE_SEMAPHORE] = asyncio.Semaphore(MAX_LOAD_CONCURRENTLY)
         async with self.hass.data[STORAGE_SEMAPHORE]:
-            return await self._async_load_data()
+            with timeline_span(self.hass, f"load {self.key}", CATEGORY_STORAGE):
+                return await self._async_load_data()
 
     async def _async_load_data(self):
         """Load the data."""
@@ -326,6 +498,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(
+                    self._replay_journal, data
+                )
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -387,6 +563,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
             if data == {}:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(
+                    self._replay_journal, data
+                )
 
         # Add minor_version if not set
         if "minor_version" not in data:
@@ -518,6 +698,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if self._journal:
+            # Compact the journal into the main file
+            self._journal_compact = True
+            if (
+                self._data is None
+                and self._journal_size
+                and self._journal_base is not None
+            ):
+                self._data = {
+                    "version": self.version,
+                    "minor_version": self.minor_version,
+                    "key": self.key,
+                    "data": self._journal_base,
+                }
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -542,6 +736,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal_size:
+                # The main file is rewritten at the final write
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -552,6 +750,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            if not self._journal_compact and self._write_journal(data["data"]):
+                return
+            self._journal_compact = False
+            self._journal_generation += 1
+            data["journal_generation"] = self._journal_generation
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -561,6 +766,86 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal:
+            # The records of the journal are for the previous generation
+            with suppress(FileNotFoundError):
+                os.unlink(self.journal_path)
+            self._journal_base = data["data"]
+            self._journal_size = 0
+            self._journal_max_size = int(os.path.getsize(path) * JOURNAL_COMPACT_RATIO)
+
+    def _write_journal(self, data: Any) -> bool:
+        """Append the changes since the last write to the journal.
+
+        Returns False if the main file has to be written instead.
+        """
+        if (base := self._journal_base) is None or (
+            self._journal_size > self._journal_max_size
+        ):
+            return False
+        # Rewrite the main file if the journal can not be written
+        self._journal_base = None
+        ops: list[list[Any]] = []
+        _json_diff(base, data, [], ops)
+        if ops:
+            try:
+                record = json_helper.json_bytes(
+                    {"generation": self._journal_generation, "ops": ops}
+                )
+            except TypeError as err:
+                # The main file is written with the encoder of the store
+                _LOGGER.debug(
+                    "Rewriting %s as the changes can not be journaled: %s",
+                    self.path,
+                    err,
+                )
+                return False
+            _LOGGER.debug("Appending changes for %s to %s", self.key, self.journal_path)
+            try:
+                fd = os.open(
+                    self.journal_path,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                    0o600 if self._private else 0o644,
+                )
+                with os.fdopen(fd, "ab") as fdesc:
+                    fdesc.write(record + b"\n")
+            except OSError as err:
+                raise WriteError(err) from err
+            self._journal_size += len(record) + 1
+        self._journal_base = data
+        return True
+
+    def _replay_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the journal records of the generation of the main file to data."""
+        generation = data.get("journal_generation")
+        self._journal_generation = generation or 0
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                records = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return data
+        replayed = 0
+        for line in records:
+            try:
+                record = json_util.json_loads_object(line)
+            except ValueError:
+                # The last record may have been cut short by an unclean shutdown
+                _LOGGER.warning("Ignoring incomplete journal record of %s", self.key)
+                break
+            if record.get("generation") != generation:
+                continue
+            try:
+                data["data"] = _json_apply(data["data"], record["ops"])
+            except (IndexError, KeyError, TypeError):
+                _LOGGER.error(
+                    "Journal record of %s does not apply to the stored data",
+                    self.key,
+                )
+                break
+            replayed += 1
+        _LOGGER.debug("Replayed %s journal records of %s", replayed, self.key)
+        return data
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -573,3 +858,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            self._journal_base = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
@@ -15,6 +15,7 @@ from functools import cache, lru_cache, partial, wraps
 import json
 import logging
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -163,12 +164,23 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+#
+# COMPILED_TEMPLATE_CACHE_SIZE is the number of compiled template sources
+# that are kept after the last Template using them has been released.
+# Template instances that are alive share their compiled code through
+# TemplateEnvironment.template_cache, this LRU keeps the code around
+# when all templates are recreated, for example when reloading.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
+CACHED_COMPILED_TEMPLATE_LRU: LRU[tuple[str, bool, bool], CodeType] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
 ORJSON_PASSTHROUGH_OPTIONS = (
@@ -502,6 +514,81 @@ class RenderInfo:
             self.filter = _false
 
 
+_FAST_STRING = r"""(?P<{0}_quote>['"])(?P<{0}>[^'"\\]*)(?P={0}_quote)"""
+_FAST_NUMBER = r"-?\d+(?:\.\d+)?"
+_FAST_RENDER_RE = re.compile(
+    r"{{\s*(?:"
+    rf"(?P<states>states)\(\s*{_FAST_STRING.format('states_entity_id')}\s*\)"
+    r"(?:\s*\|\s*(?P<float>float)(?:\(\s*(?P<default>" + _FAST_NUMBER + r")\s*\))?"
+    r"(?:\s*(?P<op>==|!=|>=|<=|>|<)\s*(?P<value>" + _FAST_NUMBER + r"))?)?"
+    rf"|(?P<state_attr>state_attr)\(\s*{_FAST_STRING.format('attr_entity_id')}"
+    rf"\s*,\s*{_FAST_STRING.format('attr_name')}\s*\)"
+    rf"|(?P<is_state>is_state)\(\s*{_FAST_STRING.format('is_state_entity_id')}"
+    rf"\s*,\s*{_FAST_STRING.format('is_state_state')}\s*\)"
+    r")\s*}}"
+)
+# Variables with these names would shadow the globals used by fast renders
+_FAST_RENDER_NAMES = frozenset(
+    {"states", "state_attr", "is_state", "float", "True", "False", "None"}
+)
+_FAST_RENDER_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+
+def _fast_number(number: str) -> int | float:
+    """Convert a number literal like jinja does."""
+    return float(number) if "." in number else int(number)
+
+
+def _fast_render_for(template: str) -> Callable[[HomeAssistant], str] | None:
+    """Return a function that renders a trivial template without jinja.
+
+    The function returns the same string as the jinja render of the template
+    and collects the same entities in the RenderInfo since it calls the same
+    functions as the template. Templates that do not match one of the trivial
+    forms return None.
+    """
+    if not (match := _FAST_RENDER_RE.fullmatch(template)):
+        return None
+
+    if match["state_attr"]:
+        attr_entity_id = match["attr_entity_id"]
+        attr_name = match["attr_name"]
+        return lambda hass: str(state_attr(hass, attr_entity_id, attr_name))
+
+    if match["is_state"]:
+        is_state_entity_id = match["is_state_entity_id"]
+        is_state_state = match["is_state_state"]
+        return lambda hass: str(is_state(hass, is_state_entity_id, is_state_state))
+
+    entity_id = match["states_entity_id"]
+
+    def _states(hass: HomeAssistant) -> str:
+        """Return the state like states(entity_id)."""
+        if (state := _get_state(hass, entity_id)) is None:
+            return STATE_UNKNOWN
+        return state.state
+
+    if not match["float"]:
+        return _states
+
+    default = _SENTINEL if match["default"] is None else _fast_number(match["default"])
+    if not (op := match["op"]):
+        return lambda hass: str(forgiving_float_filter(_states(hass), default))
+
+    compare = _FAST_RENDER_OPERATORS[op]
+    value = _fast_number(match["value"])
+    return lambda hass: str(
+        compare(forgiving_float_filter(_states(hass), default), value)
+    )
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -518,6 +605,7 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_fast_render",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -550,6 +638,7 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._fast_render: Callable[[HomeAssistant], str] | None = None
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -640,7 +729,12 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (fast_render := self._fast_render) is not None and (
+                not kwargs or _FAST_RENDER_NAMES.isdisjoint(kwargs)
+            ):
+                render_result = fast_render(self.hass)  # type: ignore[arg-type]
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -857,6 +951,8 @@ class Template:
         self._strict = strict
         self._log_fn = log_fn
         env = self._env
+        if not limited:
+            self._fast_render = _fast_render_for(self.template)
 
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
@@ -2358,7 +2454,7 @@ def forgiving_float(value, default=_SENTINEL):
         return default
 
 
-def forgiving_float_filter(value, default=_SENTINEL):
+def forgiving_float_filter(value: Any, default: Any = _SENTINEL) -> Any:
     """Try to convert value to a float."""
     try:
         return float(value)
@@ -2864,6 +2960,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self.limited = bool(limited)
+        self.strict = bool(strict)
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3219,7 +3317,18 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        # The compiled code of string sources does not depend on the
+        # hass instance, so it is shared by all environments of the same type
+        if not isinstance(source, str):
+            compiled = super().compile(source)
+        elif (
+            cached := CACHED_COMPILED_TEMPLATE_LRU.get(
+                key := (source, self.limited, self.strict)
+            )
+        ) is not None:
+            compiled = cached
+        else:
+            compiled = CACHED_COMPILED_TEMPLATE_LRU[key] = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
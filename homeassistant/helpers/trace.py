@@ -120,6 +120,18 @@ trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 script_execution_cv: ContextVar[StopReason | None] = ContextVar(
     "script_execution_cv", default=None
 )
+# If the steps of the current run are traced
+trace_enabled_cv: ContextVar[bool] = ContextVar("trace_enabled_cv", default=True)
+
+
+def trace_set_enabled(enabled: bool) -> None:
+    """Set if the steps of the current run are traced."""
+    trace_enabled_cv.set(enabled)
+
+
+def trace_enabled() -> bool:
+    """Return if the steps of the current run are traced."""
+    return trace_enabled_cv.get()
 
 
 def trace_id_set(trace_id: tuple[str, str]) -> None:
@@ -158,6 +170,8 @@ def trace_stack_top[_T](trace_stack_var: ContextVar[list[_T] | None]) -> _T | No
 
 def trace_path_push(suffix: str | list[str]) -> int:
     """Go deeper in the config tree."""
+    if not trace_enabled_cv.get():
+        return 0
     if isinstance(suffix, str):
         suffix = [suffix]
     for node in suffix:
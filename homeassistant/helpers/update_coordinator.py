@@ -110,6 +110,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         )
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
+        # Entities waiting to write their state while the listeners are updated
+        self._pending_state_writes: list[entity.Entity] | None = None
         self._unsub_refresh: CALLBACK_TYPE | None = None
         self._unsub_shutdown: CALLBACK_TYPE | None = None
         self._request_refresh_task: asyncio.TimerHandle | None = None
@@ -172,9 +174,32 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
     @callback
     def async_update_listeners(self) -> None:
-        """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        """Update all registered listeners.
+
+        The states written with async_write_entity_state while the
+        listeners are updated are written in one batch at the end.
+        """
+        pending_state_writes: list[entity.Entity] = []
+        self._pending_state_writes = pending_state_writes
+        try:
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+        finally:
+            self._pending_state_writes = None
+            if pending_state_writes:
+                entity.async_write_ha_states(self.hass, pending_state_writes)
+
+    @callback
+    def async_write_entity_state(self, coordinator_entity: entity.Entity) -> None:
+        """Write the state of an entity of this coordinator.
+
+        If the listeners are being updated, the state is written
+        together with the states of the other entities.
+        """
+        if self._pending_state_writes is None:
+            coordinator_entity.async_write_ha_state()
+        else:
+            self._pending_state_writes.append(coordinator_entity)
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
@@ -584,6 +609,11 @@ class CoordinatorEntity(BaseCoordinatorEntity[_DataUpdateCoordinatorT]):
         """Return if entity is available."""
         return self.coordinator.last_update_success
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self.coordinator.async_write_entity_state(self)
+
     async def async_update(self) -> None:
         """Update the entity.
 
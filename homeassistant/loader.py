@@ -40,6 +40,7 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
+from .helpers.startup_timeline import CATEGORY_IMPORT, async_get_timeline
 from .helpers.typing import UNDEFINED
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
@@ -992,6 +993,8 @@ class Integration:
 
         if debug := _LOGGER.isEnabledFor(logging.DEBUG):
             start = time.perf_counter()
+        if timeline := async_get_timeline(self.hass):
+            timeline_start = time.monotonic()
 
         # Some integrations fail on import because they call functions incorrectly.
         # So we do it before validating config to catch these errors.
@@ -1007,6 +1010,14 @@ class Integration:
                     self.domain,
                     time.perf_counter() - start,
                 )
+            if timeline:
+                timeline.add_span(
+                    f"import {domain}",
+                    CATEGORY_IMPORT,
+                    timeline_start,
+                    time.monotonic() - timeline_start,
+                    {"executor": False},
+                )
             return comp
 
         self._component_future = self.hass.loop.create_future()
@@ -1044,6 +1055,14 @@ class Integration:
                 time.perf_counter() - start,
                 load_executor,
             )
+        if timeline:
+            timeline.add_span(
+                f"import {domain}",
+                CATEGORY_IMPORT,
+                timeline_start,
+                time.monotonic() - timeline_start,
+                {"executor": load_executor},
+            )
 
         return comp
 
@@ -1147,6 +1166,8 @@ class Integration:
         if load_executor_platforms or load_event_loop_platforms:
             if debug := _LOGGER.isEnabledFor(logging.DEBUG):
                 start = time.perf_counter()
+            if timeline := async_get_timeline(self.hass):
+                timeline_start = time.monotonic()
 
             try:
                 if load_executor_platforms:
@@ -1197,6 +1218,17 @@ class Integration:
                         load_event_loop_platforms,
                         time.perf_counter() - start,
                     )
+                if timeline:
+                    timeline.add_span(
+                        f"import {domain} platforms",
+                        CATEGORY_IMPORT,
+                        timeline_start,
+                        time.monotonic() - timeline_start,
+                        {
+                            "executor": load_executor_platforms,
+                            "loop": load_event_loop_platforms,
+                        },
+                    )
 
         if in_progress_imports:
             for platform_name, future in in_progress_imports.items():
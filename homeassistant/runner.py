@@ -52,6 +52,7 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    profile_startup: bool = False
 
     safe_mode: bool = False
 
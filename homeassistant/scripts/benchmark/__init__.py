@@ -7,6 +7,9 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import os
+import tempfile
+import threading
 from timeit import default_timer as timer
 
 from homeassistant import core
@@ -288,6 +291,294 @@ async def filtering_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_wildcard_subscriptions(hass):
+    """Match 100k MQTT messages against 5k wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    subscriptions = SubscriptionTrie()
+    job = core.HassJob(lambda msg: None)
+    for idx in range(5000):
+        if idx % 2:
+            topic_filter = f"zigbee2mqtt/device_{idx}/+"
+        else:
+            topic_filter = f"tasmota/discovery/device_{idx}/#"
+        subscriptions.add(Subscription(topic_filter, False, job))
+
+    topics = [
+        f"zigbee2mqtt/device_{idx}/state"
+        if idx % 2
+        else f"tasmota/discovery/device_{idx}/sensors/config"
+        for idx in range(5000)
+    ]
+    size = len(topics)
+    count = 0
+
+    start = timer()
+
+    for i in range(10**5):
+        count += len(subscriptions.matches(topics[i % size]))
+
+    assert count == 10**5
+
+    return timer() - start
+
+
+async def _recorder_write_states(hass, bulk_state_writes):
+    """Write 100k state changes for 1k entities through the recorder.
+
+    The database defaults to a temporary SQLite file. Set
+    HASS_BENCHMARK_DB_URL to compare against PostgreSQL or MariaDB.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import Recorder, db_schema
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import recorder as recorder_helper
+
+    recorder_helper.async_initialize_recorder(hass)
+    events = []
+    old_states = {}
+    for idx in range(10**5):
+        entity_id = f"sensor.power_{idx % 1000}"
+        new_state = core.State(
+            entity_id, str(idx), {"unit_of_measurement": "W", "step": idx % 10}
+        )
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_states.get(entity_id),
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_states[entity_id] = new_state
+
+    def _write_states(db_url):
+        instance = Recorder(
+            hass,
+            auto_purge=False,
+            auto_repack=False,
+            keep_days=1,
+            commit_interval=1,
+            uri=db_url,
+            db_max_retries=1,
+            db_retry_wait=1,
+            entity_filter=None,
+            exclude_event_types=set(),
+            bulk_state_writes=bulk_state_writes,
+        )
+        # Run as the recorder thread so the pool does not warn
+        instance.recorder_and_worker_thread_ids.add(threading.get_ident())
+        instance._setup_connection()  # noqa: SLF001
+        db_schema.Base.metadata.drop_all(instance.engine)
+        db_schema.Base.metadata.create_all(instance.engine)
+        instance.schema_version = db_schema.SCHEMA_VERSION
+        instance._open_event_session()  # noqa: SLF001
+
+        start = timer()
+        for idx, event in enumerate(events, 1):
+            instance._process_one_event(event)  # noqa: SLF001
+            # Commit as often as a busy instance with the
+            # default commit interval would
+            if not idx % 2000:
+                instance._commit_event_session_or_retry()  # noqa: SLF001
+        instance._commit_event_session_or_retry()  # noqa: SLF001
+        runtime = timer() - start
+
+        instance._close_event_session()  # noqa: SLF001
+        instance._close_connection()  # noqa: SLF001
+        print(f"{len(events) / runtime:.0f} events/s")
+        return runtime
+
+    if db_url := os.environ.get("HASS_BENCHMARK_DB_URL"):
+        return await hass.async_add_executor_job(_write_states, db_url)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        return await hass.async_add_executor_job(
+            _write_states, f"sqlite:///{tmp_dir}/benchmark.db"
+        )
+
+
+@benchmark
+async def recorder_write_states_orm(hass):
+    """Write 100k state changes with the ORM recorder path."""
+    return await _recorder_write_states(hass, False)
+
+
+@benchmark
+async def recorder_write_states_bulk(hass):
+    """Write 100k state changes with the bulk recorder path."""
+    return await _recorder_write_states(hass, True)
+
+
+@benchmark
+async def subscribe_entities_clients(hass):
+    """Fire 10k state changes to 10, 40 and 160 subscribe_entities clients."""
+    # pylint: disable=import-outside-toplevel
+    from types import SimpleNamespace
+
+    from homeassistant.auth.models import User
+    from homeassistant.auth.permissions import PermissionLookup, PolicyPermissions
+    from homeassistant.components.websocket_api.commands import (
+        handle_subscribe_entities,
+    )
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+    from homeassistant.components.websocket_api.const import DOMAIN
+
+    # pylint: enable=import-outside-toplevel
+
+    hass.data[DOMAIN] = {}
+    perm_lookup = PermissionLookup(None, None)
+    entity_ids = [f"sensor.power_{idx}" for idx in range(200)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0")
+    messages = 0
+
+    @core.callback
+    def send_message(message):
+        """Count the messages."""
+        nonlocal messages
+        messages += 1
+
+    total = 0.0
+    for clients in (10, 40, 160):
+        connections = []
+        for idx in range(clients):
+            # Half of the clients are restricted users, for example wall tablets
+            user = User(f"user {idx % 4}", perm_lookup, is_active=True)
+            if idx % 2:
+                user.is_owner = True
+            else:
+                user.groups = []
+                user.permissions = PolicyPermissions(
+                    {"entities": {"entity_ids": dict.fromkeys(entity_ids[::2], True)}},
+                    perm_lookup,
+                )
+            connection = ActiveConnection(
+                logging.getLogger(__name__),
+                hass,
+                send_message,
+                user,
+                SimpleNamespace(id=f"token {idx}"),
+            )
+            msg = {"id": 1, "type": "subscribe_entities"}
+            if idx % 3 == 0:
+                msg["entity_ids"] = entity_ids[:100]
+            handle_subscribe_entities(
+                hass,
+                connection,
+                handle_subscribe_entities._ws_schema(msg),  # noqa: SLF001
+            )
+            connections.append(connection)
+
+        start = timer()
+
+        for idx in range(10**4):
+            hass.states.async_set(entity_ids[idx % 200], str(idx))
+        await hass.async_block_till_done()
+
+        runtime = timer() - start
+        print(f"{clients} clients: {runtime}s, {messages} messages")
+        total += runtime
+        messages = 0
+        for connection in connections:
+            connection.async_handle_close()
+
+    return total
+
+
+@benchmark
+async def compile_templates(hass):
+    """Compile 2k templates from 500 sources and compile them again on reload."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import template
+
+    template.CACHED_COMPILED_TEMPLATE_LRU.clear()
+    sources = [
+        "{% set value = states('sensor.power_" + str(idx) + "') | float(0) %}"
+        "{% if value > 100 %}{{ (value / 1000) | round(2) }} kW"
+        "{% else %}{{ value | round(1) }} W{% endif %}"
+        for idx in range(500)
+    ]
+
+    start = timer()
+
+    for _ in range(2):
+        # The templates of the previous load are released on reload
+        templates = [template.Template(source, hass) for source in sources * 4]
+        for tpl in templates:
+            tpl.ensure_valid()
+        del templates
+
+    return timer() - start
+
+
+@benchmark
+async def render_trivial_templates(hass):
+    """Render 500 trivial templates 200 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import template
+
+    sources = []
+    for idx in range(100):
+        entity_id = f"sensor.power_{idx}"
+        hass.states.async_set(entity_id, str(idx), {"unit_of_measurement": "W"})
+        sources.extend(
+            (
+                f"{{{{ states('{entity_id}') }}}}",
+                f"{{{{ states('{entity_id}') | float(0) }}}}",
+                f"{{{{ states('{entity_id}') | float(0) > 50 }}}}",
+                f"{{{{ state_attr('{entity_id}', 'unit_of_measurement') }}}}",
+                f"{{{{ is_state('{entity_id}', '50') }}}}",
+            )
+        )
+    templates = [template.Template(source, hass) for source in sources]
+
+    start = timer()
+
+    for _ in range(200):
+        for tpl in templates:
+            tpl.async_render_to_info()
+
+    return timer() - start
+
+
+@benchmark
+async def state_machine_memory(hass):
+    """Report the memory used by the states of 20k entities."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util.memory import states_memory_usage
+
+    domains = ("sensor", "binary_sensor", "light", "switch")
+    for new_state in ("on", "off"):
+        for idx in range(20000):
+            domain = domains[idx % len(domains)]
+            hass.states.async_set(
+                f"{domain}.entity_{idx}",
+                new_state,
+                {
+                    "friendly_name": f"Entity {idx}",
+                    "device_class": "power",
+                    "unit_of_measurement": "W",
+                },
+            )
+    await hass.async_block_till_done()
+
+    start = timer()
+    usage = states_memory_usage(hass.states.async_all())
+    runtime = timer() - start
+
+    for domain, (states, size) in usage.items():
+        print(f"{domain}: {states} states, {size / states:.0f} bytes per state")
+    total = sum(domain_usage.size for domain_usage in usage.values())
+    print(f"Total: {total / 2**20:.1f} MiB")
+    return runtime
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
@@ -308,3 +599,293 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def json_serialize_state_changed_events(hass):
+    """Serialize 100k state changed events where only the state changes."""
+    attributes = {
+        "friendly_name": "Living room temperature",
+        "unit_of_measurement": "°C",
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "icon": "mdi:thermometer",
+        "options": [f"option {idx}" for idx in range(200)],
+    }
+    runtime = 0.0
+
+    @core.callback
+    def listener(event):
+        """Serialize the event."""
+        nonlocal runtime
+        start = timer()
+        event.json_fragment  # noqa: B018
+        runtime += timer() - start
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+
+    for idx in range(10**5):
+        hass.states.async_set("sensor.temperature", str(idx), attributes)
+        await asyncio.sleep(0)
+
+    return runtime
+
+
+@benchmark
+async def save_entity_registry_changes(hass):
+    """Save 200 single entity changes of a registry of 10k entities."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.json import json_bytes, json_fragment
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
+
+    def entry_fragment(idx, name):
+        return json_fragment(
+            json_bytes(
+                {
+                    "entity_id": f"sensor.entity_{idx}",
+                    "id": f"{idx:032x}",
+                    "name": name,
+                    "platform": "benchmark",
+                    "unique_id": f"unique_{idx}",
+                    "capabilities": {"state_class": "measurement"},
+                    "options": {"sensor": {"suggested_display_precision": 1}},
+                }
+            )
+        )
+
+    entries = [entry_fragment(idx, None) for idx in range(10000)]
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        store = Store(hass, 1, "core.entity_registry", atomic_writes=True, journal=True)
+        await store.async_save({"entities": list(entries)})
+
+        start = timer()
+        for idx in range(200):
+            entries[idx] = entry_fragment(idx, f"Renamed {idx}")
+            await store.async_save({"entities": list(entries)})
+        return timer() - start
+
+
+@benchmark
+async def dump_restore_states(hass):
+    """Dump 5k restore states with extra data 20 times, 1% changing each time."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.json import json_bytes
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.restore_state import RestoredExtraData, RestoreStateData
+
+    class Entity:
+        """A restore entity with extra data."""
+
+        def __init__(self, value):
+            self.value = value
+
+        @property
+        def extra_restore_state_data(self):
+            return RestoredExtraData(
+                {"native_value": self.value, "native_unit_of_measurement": "W"}
+            )
+
+    data = RestoreStateData(hass)
+    attributes = {"friendly_name": "Power", "unit_of_measurement": "W"}
+    for idx in range(5000):
+        entity_id = f"sensor.power_{idx}"
+        hass.states.async_set(entity_id, "0", attributes)
+        data.entities[entity_id] = Entity(idx)
+
+    async def async_save(stored_states):
+        json_bytes(stored_states)
+
+    data.store.async_save = async_save
+
+    start = timer()
+    for dump in range(20):
+        for idx in range(dump, 5000, 100):
+            hass.states.async_set(f"sensor.power_{idx}", str(dump), attributes)
+            data.entities[f"sensor.power_{idx}"].value = dump
+        await data.async_dump_states()
+    return timer() - start
+
+
+@benchmark
+async def load_registries(hass):
+    """Load an entity registry of 50k entries and a device registry of 5k entries."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.json import json_bytes
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util.memory import deep_getsizeof
+
+    created_at = "2024-01-01T00:00:00+00:00"
+    entities = [
+        {
+            "aliases": [],
+            "area_id": f"area_{idx % 50}" if idx % 3 else None,
+            "categories": {},
+            "capabilities": {"state_class": "measurement"},
+            "config_entry_id": f"{idx % 100:032x}",
+            "created_at": created_at,
+            "device_class": None,
+            "device_id": f"{idx // 10:032x}",
+            "disabled_by": None,
+            "entity_category": None,
+            "entity_id": f"sensor.entity_{idx}",
+            "hidden_by": None,
+            "icon": None,
+            "id": f"{idx:032x}",
+            "has_entity_name": True,
+            "labels": [],
+            "modified_at": created_at,
+            "name": None,
+            "options": {"sensor": {"suggested_display_precision": 1}},
+            "original_device_class": "power",
+            "original_icon": None,
+            "original_name": "Power",
+            "platform": f"platform_{idx % 20}",
+            "supported_features": 0,
+            "translation_key": "power",
+            "unique_id": f"unique_{idx}",
+            "previous_unique_id": None,
+            "unit_of_measurement": "W",
+        }
+        for idx in range(50000)
+    ]
+    deleted_entities = [
+        {
+            "config_entry_id": f"{idx % 100:032x}",
+            "created_at": created_at,
+            "entity_id": f"sensor.deleted_{idx}",
+            "id": f"{idx + 10**6:032x}",
+            "modified_at": created_at,
+            "orphaned_timestamp": None,
+            "platform": f"platform_{idx % 20}",
+            "unique_id": f"deleted_{idx}",
+        }
+        for idx in range(10000)
+    ]
+    devices = [
+        {
+            "area_id": f"area_{idx % 50}",
+            "config_entries": [f"{idx % 100:032x}"],
+            "configuration_url": None,
+            "connections": [["mac", f"00:00:00:00:{idx // 256:02x}:{idx % 256:02x}"]],
+            "created_at": created_at,
+            "disabled_by": None,
+            "entry_type": None,
+            "hw_version": None,
+            "id": f"{idx:032x}",
+            "identifiers": [[f"platform_{idx % 20}", f"device_{idx}"]],
+            "labels": [],
+            "manufacturer": "Manufacturer",
+            "model": "Model",
+            "model_id": None,
+            "modified_at": created_at,
+            "name_by_user": None,
+            "name": f"Device {idx}",
+            "primary_config_entry": f"{idx % 100:032x}",
+            "serial_number": None,
+            "sw_version": "1.0",
+            "via_device_id": None,
+        }
+        for idx in range(5000)
+    ]
+    deleted_devices = [
+        {
+            "config_entries": [f"{idx % 100:032x}"],
+            "connections": [],
+            "created_at": created_at,
+            "identifiers": [[f"platform_{idx % 20}", f"deleted_{idx}"]],
+            "id": f"{idx + 10**6:032x}",
+            "orphaned_timestamp": None,
+            "modified_at": created_at,
+        }
+        for idx in range(1000)
+    ]
+
+    def write(key, version, minor_version, data):
+        with open(os.path.join(storage_dir, key), "wb") as fdesc:
+            fdesc.write(
+                json_bytes(
+                    {
+                        "version": version,
+                        "minor_version": minor_version,
+                        "key": key,
+                        "data": data,
+                    }
+                )
+            )
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        storage_dir = os.path.join(config_dir, ".storage")
+        os.makedirs(storage_dir)
+        write(
+            dr.STORAGE_KEY,
+            dr.STORAGE_VERSION_MAJOR,
+            dr.STORAGE_VERSION_MINOR,
+            {"devices": devices, "deleted_devices": deleted_devices},
+        )
+        write(
+            er.STORAGE_KEY,
+            er.STORAGE_VERSION_MAJOR,
+            er.STORAGE_VERSION_MINOR,
+            {"entities": entities, "deleted_entities": deleted_entities},
+        )
+        del entities, deleted_entities, devices, deleted_devices
+
+        start = timer()
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        runtime = timer() - start
+
+    for name, registry in (
+        ("Device registry", dr.async_get(hass)),
+        ("Entity registry", er.async_get(hass)),
+    ):
+        data = [
+            value
+            for key, value in vars(registry).items()
+            if key not in ("hass", "_store")
+        ]
+        print(f"{name}: {deep_getsizeof(data) / 2**20:.1f} MiB")
+    return runtime
+
+
+@benchmark
+async def run_scripts(hass):
+    """Run a script with a condition and two service calls 50k times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv, script
+
+    count = 0
+
+    @core.callback
+    def service_handler(call):
+        """Handle service call."""
+        nonlocal count
+        count += 1
+
+    hass.services.async_register("test", "script", service_handler)
+    hass.states.async_set("input_boolean.test", "on")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"condition": "state", "entity_id": "input_boolean.test", "state": "on"},
+            {"action": "test.script", "data": {"brightness": 255}},
+            {"action": "test.script", "data": {"color_name": "red"}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Benchmark", "benchmark")
+
+    start = timer()
+
+    for _ in range(50000):
+        await script_obj.async_run(context=core.Context())
+
+    assert count == 100000
+    return timer() - start
@@ -31,6 +31,13 @@ from .core import (
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers import issue_registry as ir, singleton, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.startup_timeline import (
+    CATEGORY_CONFIG_ENTRY,
+    CATEGORY_INTEGRATION,
+    CATEGORY_PLATFORM,
+    CATEGORY_WAIT,
+    async_get_timeline,
+)
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
@@ -679,6 +686,13 @@ class SetupPhases(StrEnum):
     """Wait time for the packages to import."""
 
 
+# The startup timeline categories of the setup phases
+_PHASE_TIMELINE_CATEGORIES = {
+    SetupPhases.SETUP: CATEGORY_INTEGRATION,
+    SetupPhases.CONFIG_ENTRY_SETUP: CATEGORY_CONFIG_ENTRY,
+}
+
+
 @singleton.singleton(DATA_SETUP_STARTED)
 def _setup_started(
     hass: core.HomeAssistant,
@@ -713,6 +727,14 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
         integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
+        if (timeline := async_get_timeline(hass)) is not None:
+            timeline.add_span(
+                f"{phase} {integration}",
+                CATEGORY_WAIT,
+                started,
+                time_taken,
+                {"integration": integration, "group": group},
+            )
         _LOGGER.debug(
             "Adding wait for %s for %s (%s) of %.2f",
             phase,
@@ -776,6 +798,14 @@ def async_start_setup(
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
         group_setup_times[phase] = max(group_setup_times[phase], time_taken)
+        if (timeline := async_get_timeline(hass)) is not None:
+            timeline.add_span(
+                integration if group is None else f"{integration} ({group})",
+                _PHASE_TIMELINE_CATEGORIES.get(phase, CATEGORY_PLATFORM),
+                started,
+                time_taken,
+                {"integration": integration, "group": group, "phase": phase},
+            )
         if group is None:
             _LOGGER.info(
                 "Setup of domain %s took %.2f seconds", integration, time_taken
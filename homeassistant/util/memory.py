@@ -0,0 +1,76 @@
+"""Helpers to measure memory usage."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import gc
+import sys
+from types import FunctionType, ModuleType
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from homeassistant.core import State
+
+# Objects of these types are shared by the whole process
+# and are not counted as memory used by an object.
+_SKIP_TYPES = (type, ModuleType, FunctionType)
+
+
+class DomainMemoryUsage(NamedTuple):
+    """Memory used by the states of a domain."""
+
+    states: int
+    size: int
+
+
+def deep_getsizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """Return the size in bytes of an object and the objects it references.
+
+    Objects with an id in seen are not counted and the ids of the counted
+    objects are added to it. Passing the same set to multiple calls counts
+    objects that are shared between them only once.
+    """
+    if seen is None:
+        seen = set()
+    size = 0
+    objects = [obj]
+    while objects:
+        counted = []
+        # The garbage collector does not visit string keys of dicts
+        # and instance dicts may not report their values as referents
+        keys: list[Any] = []
+        for referent in objects:
+            if isinstance(referent, _SKIP_TYPES) or (obj_id := id(referent)) in seen:
+                continue
+            seen.add(obj_id)
+            size += sys.getsizeof(referent)
+            counted.append(referent)
+            if isinstance(referent, dict):
+                keys.extend(referent)
+                keys.extend(referent.values())
+        objects = gc.get_referents(*counted)
+        objects.extend(keys)
+    return size
+
+
+def states_memory_usage(states: Iterable[State]) -> dict[str, DomainMemoryUsage]:
+    """Return the memory used by states per domain, largest first.
+
+    The size includes everything a state keeps alive, like its attributes,
+    context and the previous state referenced by the event that created it.
+    Objects that are shared by states of multiple domains are counted for
+    the first domain that references them.
+    """
+    seen: set[int] = set()
+    usage: dict[str, list[int]] = {}
+    for state in states:
+        if (domain_usage := usage.get(state.domain)) is None:
+            domain_usage = usage[state.domain] = [0, 0]
+        domain_usage[0] += 1
+        domain_usage[1] += deep_getsizeof(state, seen)
+    return {
+        domain: DomainMemoryUsage(count, size)
+        for domain, (count, size) in sorted(
+            usage.items(), key=lambda item: item[1][1], reverse=True
+        )
+    }
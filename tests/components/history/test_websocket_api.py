@@ -2,7 +2,9 @@
 
 import asyncio
 from datetime import timedelta
-from unittest.mock import ANY, patch
+import threading
+from typing import Any
+from unittest.mock import ANY, MagicMock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -173,6 +175,254 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_stream(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period streamed in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "changed"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.other", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test", "sensor.other"],
+            "significant_changes_only": False,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test", "sensor.other"],
+            "significant_changes_only": False,
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 2
+    assert response["result"] is None
+
+    streamed: dict[str, list[dict[str, Any]]] = {}
+    while not (response := await client.receive_json())["event"].get("complete"):
+        assert response["id"] == 2
+        assert response["type"] == "event"
+        for entity_id, entity_states in response["event"]["states"].items():
+            streamed.setdefault(entity_id, []).extend(entity_states)
+    assert response["event"] == {"states": {}, "complete": True}
+    assert streamed == expected
+    assert len(streamed["sensor.test"]) == 3
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": (now + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {}
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}, "complete": True}
+
+
+async def test_history_during_period_stream_slow_client(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test streaming history waits for a slow client before the next chunk."""
+    now = dt_util.utcnow()
+    sent: list[bytes] = []
+    received = 0
+    fetched = 0
+
+    def _stream_significant_states(*args: Any) -> Any:
+        nonlocal fetched
+        for idx in range(10):
+            fetched += 1
+            yield {"sensor.test": [{"s": str(idx)}]}
+
+    connection = MagicMock(
+        send_message=sent.append, pending_messages=lambda: len(sent) - received
+    )
+    cancel = threading.Event()
+    with (
+        patch(
+            "homeassistant.components.recorder.history.stream_significant_states",
+            _stream_significant_states,
+        ),
+        patch.object(websocket_api, "STREAM_MAX_PENDING_MESSAGES", 2),
+        patch.object(websocket_api, "STREAM_PENDING_CHECK_INTERVAL", 0.01),
+    ):
+        task = hass.async_add_executor_job(
+            websocket_api._ws_stream_significant_states,
+            hass,
+            connection,
+            1,
+            cancel,
+            now,
+            None,
+            ["sensor.test"],
+            True,
+            False,
+            False,
+            False,
+        )
+        while len(sent) < 2:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        # Nothing more is fetched until the client reads a message
+        assert len(sent) == 2
+        assert fetched == 2
+
+        received = 1
+        while len(sent) < 3:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        assert len(sent) == 3
+        assert fetched == 3
+
+        # Unsubscribing stops the stream while it waits
+        cancel.set()
+        await task
+
+    assert fetched == 3
+
+
+async def test_history_during_period_stream_error(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test an error while streaming history_during_period ends the stream."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.recorder.history.stream_significant_states",
+        side_effect=ValueError("Database went away"),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+
+    assert response["id"] == 1
+    assert not response["success"]
+    assert response["error"]["code"] == "unknown_error"
+    assert "Error streaming the history of ['sensor.test']" in caplog.text
+
+    # The subscription was removed, so unsubscribing fails
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert not response["success"]
+
+
+async def test_history_during_period_downsampled(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period reduced to buckets."""
+    start = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(start) as freezer:
+        for offset, power in ((-1, "1"), (10, "3"), (40, "10"), (50, "20")):
+            freezer.move_to(start + timedelta(seconds=offset))
+            hass.states.async_set("sensor.power", power)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    start_ts = start.timestamp()
+    # The mean is weighted by how long each state was held in the bucket
+    expected = [
+        {
+            "s": "3",
+            "lu": start_ts,
+            "min": 1,
+            "max": 3,
+            "mean": pytest.approx((1 * 10 + 3 * 20) / 30),
+        },
+        {
+            "s": "20",
+            "lu": start_ts + 30,
+            "min": 3,
+            "max": 20,
+            "mean": pytest.approx((3 * 10 + 10 * 10 + 20 * 10) / 30),
+        },
+    ]
+    for msg_id, options in (
+        (1, {"buckets": 2}),
+        (2, {"resolution": 30}),
+        (3, {"buckets": 2, "stream": False}),
+    ):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "history/history_during_period",
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(seconds=60)).isoformat(),
+                "entity_ids": ["sensor.power"],
+                **options,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == {"sensor.power": expected}
+
+    for msg_id, options in (
+        (4, {"buckets": 2, "resolution": 30}),
+        (5, {"buckets": 2, "stream": True}),
+        (6, {"resolution": 30, "stream": True}),
+    ):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "history/history_during_period",
+                "start_time": start.isoformat(),
+                "entity_ids": ["sensor.power"],
+                **options,
+            }
+        )
+        response = await client.receive_json()
+        assert not response["success"]
+        assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
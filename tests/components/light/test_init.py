@@ -1,7 +1,8 @@
 """The tests for the Light component."""
 
 from types import ModuleType
-from unittest.mock import MagicMock, mock_open, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
 import pytest
 import voluptuous as vol
@@ -879,6 +880,50 @@ async def test_light_context(
     assert state2.context.user_id == hass_admin_user.id
 
 
+async def test_light_turn_off_batch_handler(
+    hass: HomeAssistant,
+    mock_light_profiles,
+    mock_light_entities: list[MockLight],
+) -> None:
+    """Test turning off lights with equal parameters calls the batch handler."""
+    setup_test_component_platform(hass, light.DOMAIN, mock_light_entities)
+
+    assert await async_setup_component(
+        hass, light.DOMAIN, {light.DOMAIN: {CONF_PLATFORM: "test"}}
+    )
+    await hass.async_block_till_done()
+
+    ent1, ent2, ent3 = mock_light_entities
+    ent1.supported_features = light.LightEntityFeature.TRANSITION
+    ent2.supported_features = light.LightEntityFeature.TRANSITION
+    for ent in mock_light_entities:
+        ent.async_turn_off = AsyncMock()
+
+    batches = []
+
+    async def handle_batch(
+        entities: list[light.LightEntity], data: dict[str, Any]
+    ) -> None:
+        batches.append((entities, data))
+
+    ent1.platform.async_register_entity_service_batch_handler(
+        SERVICE_TURN_OFF, handle_batch
+    )
+
+    await hass.services.async_call(
+        light.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL, light.ATTR_TRANSITION: 2},
+        blocking=True,
+    )
+
+    # The light without transition support is turned off on its own
+    assert batches == [([ent1, ent2], {light.ATTR_TRANSITION: 2})]
+    ent1.async_turn_off.assert_not_called()
+    ent2.async_turn_off.assert_not_called()
+    ent3.async_turn_off.assert_called_once_with()
+
+
 async def test_light_turn_on_auth(
     hass: HomeAssistant,
     hass_read_only_user: MockUser,
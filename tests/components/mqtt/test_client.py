@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, Mock, call, patch
 
 import certifi
 import paho.mqtt.client as paho_mqtt
+from paho.mqtt.matcher import MQTTMatcher
 import pytest
 
 from homeassistant.components import mqtt
@@ -23,7 +24,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -633,6 +640,91 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+@pytest.mark.parametrize(
+    "topic",
+    [
+        "a",
+        "a/b",
+        "a/b/c",
+        "a//c",
+        "/a",
+        "$SYS/a",
+        "$SYS/a/b",
+        "x/y/z",
+    ],
+)
+def test_subscription_trie_matches_paho_matcher(topic: str) -> None:
+    """Test the subscription trie matches the same filters as paho."""
+    filters = [
+        "a",
+        "a/b",
+        "a/+",
+        "a/+/c",
+        "+/b",
+        "+/+/+",
+        "+",
+        "#",
+        "a/#",
+        "a/b/#",
+        "/#",
+        "/+",
+        "+//c",
+        "$SYS/#",
+        "$SYS/+",
+        "+/a",
+        "x/#/z",
+    ]
+    trie = mqtt.client.SubscriptionTrie()
+    matcher = MQTTMatcher()
+    subscriptions: dict[str, mqtt.client.Subscription] = {}
+    for topic_filter in filters:
+        subscription = mqtt.client.Subscription(
+            topic_filter, False, HassJob(lambda msg: None)
+        )
+        subscriptions[topic_filter] = subscription
+        trie.add(subscription)
+        matcher[topic_filter] = topic_filter
+
+    expected = [subscriptions[topic_filter] for topic_filter in filters]
+    expected = [
+        subscription
+        for subscription in expected
+        if subscription.topic in set(matcher.iter_match(topic))
+    ]
+    assert trie.matches(topic) == expected
+
+
+def test_subscription_trie_add_remove() -> None:
+    """Test adding and removing subscriptions from the subscription trie."""
+    trie = mqtt.client.SubscriptionTrie()
+    sub_1 = mqtt.client.Subscription("a/+/c", False, HassJob(lambda msg: None))
+    sub_2 = mqtt.client.Subscription("a/#", False, HassJob(lambda msg: None))
+    sub_3 = mqtt.client.Subscription("a/+/c", False, HassJob(lambda msg: None))
+    trie.add(sub_1)
+    trie.add(sub_2)
+    trie.add(sub_3)
+    assert len(trie) == 3
+    assert list(trie) == [sub_1, sub_2, sub_3]
+    assert trie.matches("a/b/c") == [sub_1, sub_2, sub_3]
+    assert trie.has_topic_filter("a/+/c")
+    assert not trie.has_topic_filter("a/+")
+
+    trie.remove(sub_1)
+    assert trie.matches("a/b/c") == [sub_2, sub_3]
+    assert trie.has_topic_filter("a/+/c")
+    trie.remove(sub_3)
+    assert trie.matches("a/b/c") == [sub_2]
+    assert not trie.has_topic_filter("a/+/c")
+    with pytest.raises(KeyError):
+        trie.remove(sub_3)
+
+    trie.remove(sub_2)
+    assert not trie
+    assert trie.matches("a/b/c") == []
+    # All levels are pruned when the last subscription is removed
+    assert not trie._root.children
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -0,0 +1,118 @@
+"""The tests for the recorder bulk state writes."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.engine.default import DefaultDialect
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.db_schema import (
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def _recorded_states(
+    instance: recorder.Recorder,
+) -> list[tuple[str, str | None, int | None, str | None, bool]]:
+    """Return the recorded states with old states as row indexes."""
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        rows = (
+            session.query(States, StatesMeta.entity_id, StateAttributes.shared_attrs)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+            .all()
+        )
+    index_by_state_id = {
+        db_state.state_id: idx for idx, (db_state, _, _) in enumerate(rows)
+    }
+    return [
+        (
+            entity_id,
+            db_state.state,
+            index_by_state_id.get(db_state.old_state_id),
+            shared_attrs,
+            db_state.last_reported_ts is not None,
+        )
+        for db_state, entity_id, shared_attrs in rows
+    ]
+
+
+@pytest.mark.parametrize(
+    ("bulk_state_writes", "returning"),
+    [(False, True), (True, True), (True, False)],
+)
+async def test_bulk_state_writes_match_orm(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    bulk_state_writes: bool,
+    returning: bool,
+) -> None:
+    """Test bulk state writes record the same rows as the ORM path."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_BULK_STATE_WRITES: bulk_state_writes}
+    )
+    with patch.object(
+        DefaultDialect,
+        "insert_executemany_returning_sort_by_parameter_order",
+        returning,
+    ):
+        hass.states.async_set("light.kitchen", "on", {"brightness": 1})
+        hass.states.async_set("light.kitchen", "on", {"brightness": 1})
+        hass.states.async_set("light.kitchen", "off", {"brightness": 1})
+        hass.states.async_set("light.living_room", "on")
+        hass.states.async_remove("light.never_recorded")
+        await async_wait_recording_done(hass)
+        assert len(instance.bulk_states_manager) == 0
+
+        hass.states.async_set("light.kitchen", "on", {"brightness": 2})
+        hass.states.async_remove("light.living_room")
+        await async_wait_recording_done(hass)
+
+    assert await instance.async_add_executor_job(_recorded_states, instance) == [
+        ("light.kitchen", "on", None, '{"brightness":1}', True),
+        ("light.kitchen", "off", 0, '{"brightness":1}', True),
+        ("light.living_room", "on", None, "{}", True),
+        ("light.kitchen", "on", 1, '{"brightness":2}', False),
+        ("light.living_room", None, 2, "{}", False),
+    ]
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_bulk_state_writes_serialization_error(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a state that cannot be serialized is not linked as an old state."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_BULK_STATE_WRITES: True}
+    )
+    hass.states.async_set("light.kitchen", "on")
+    await async_wait_recording_done(hass)
+    hass.states.async_set("light.kitchen", "off", {"fail": object()})
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hallway", "on")
+    hass.states.async_set("light.hallway", "off", {"fail": object()})
+    hass.states.async_set("light.hallway", "on")
+    await async_wait_recording_done(hass)
+
+    assert await instance.async_add_executor_job(_recorded_states, instance) == [
+        ("light.kitchen", "on", None, "{}", False),
+        ("light.kitchen", "on", None, "{}", False),
+        ("light.hallway", "on", None, "{}", False),
+        ("light.hallway", "on", None, "{}", False),
+    ]
+    assert "State is not JSON serializable" in caplog.text
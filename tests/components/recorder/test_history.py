@@ -5,6 +5,7 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
+from typing import Any
 from unittest.mock import sentinel
 
 from freezegun import freeze_time
@@ -512,6 +513,105 @@ async def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 3, 5000])
+async def test_stream_significant_states(
+    hass: HomeAssistant,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> None:
+    """Test streamed significant states match the compressed states."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids=list(states),
+        minimal_response=minimal_response,
+        no_attributes=no_attributes,
+        compressed_state_format=True,
+    )
+    chunks = list(
+        history.stream_significant_states(
+            hass,
+            zero,
+            four,
+            entity_ids=list(states),
+            minimal_response=minimal_response,
+            no_attributes=no_attributes,
+            chunk_size=chunk_size,
+        )
+    )
+    assert all(
+        sum(len(entity_states) for entity_states in chunk.values()) <= chunk_size
+        for chunk in chunks
+    )
+    streamed: dict[str, list[dict[str, Any]]] = {}
+    for chunk in chunks:
+        for entity_id, entity_states in chunk.items():
+            streamed.setdefault(entity_id, []).extend(entity_states)
+    assert streamed == {
+        entity_id: entity_states
+        for entity_id, entity_states in hist.items()
+        if entity_states
+    }
+
+
+async def test_get_downsampled_states(hass: HomeAssistant) -> None:
+    """Test states are reduced to one state per bucket."""
+    start = dt_util.utcnow()
+    with freeze_time(start - timedelta(seconds=5)) as freezer:
+        hass.states.async_set("sensor.power", "100")
+        hass.states.async_set("sensor.mode", "eco")
+        for offset, power in ((10, "1"), (20, "3"), (40, "10"), (50, "20")):
+            freezer.move_to(start + timedelta(seconds=offset))
+            hass.states.async_set("sensor.power", power)
+        freezer.move_to(start + timedelta(seconds=45))
+        hass.states.async_set("sensor.mode", "boost")
+        freezer.move_to(start + timedelta(seconds=65))
+        hass.states.async_set("sensor.power", "unavailable")
+    await async_wait_recording_done(hass)
+
+    start_ts = start.timestamp()
+    hist = history.get_downsampled_states(
+        hass,
+        start,
+        start + timedelta(seconds=90),
+        ["sensor.power", "sensor.mode", "sensor.missing"],
+        30,
+        significant_changes_only=False,
+    )
+    # The mean is weighted by how long each state was held in the bucket
+    assert hist == {
+        "sensor.power": [
+            {
+                "s": "3",
+                "lu": start_ts,
+                "min": 1,
+                "max": 100,
+                "mean": pytest.approx((100 * 10 + 1 * 10 + 3 * 10) / 30),
+            },
+            {
+                "s": "20",
+                "lu": start_ts + 30,
+                "min": 3,
+                "max": 20,
+                "mean": pytest.approx((3 * 10 + 10 * 10 + 20 * 10) / 30),
+            },
+            # The time it was unavailable is not counted
+            {"s": "unavailable", "lu": start_ts + 60, "min": 20, "max": 20, "mean": 20},
+        ],
+        "sensor.mode": [
+            {"s": "eco", "lu": start_ts},
+            {"s": "boost", "lu": start_ts + 30},
+        ],
+    }
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 async def test_get_significant_states_with_initial(
     time_zone, hass: HomeAssistant
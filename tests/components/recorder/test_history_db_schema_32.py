@@ -581,6 +581,28 @@ async def test_get_significant_states_only(
         )
 
 
+async def test_get_downsampled_states(hass: HomeAssistant) -> None:
+    """Test states are reduced to one state per bucket."""
+    start = dt_util.utcnow()
+    with freeze_time(start - timedelta(seconds=5)) as freezer:
+        hass.states.async_set("sensor.power", "100")
+        for offset, power in ((10, "1"), (20, "3"), (40, "10"), (50, "20")):
+            freezer.move_to(start + timedelta(seconds=offset))
+            hass.states.async_set("sensor.power", power)
+    await async_wait_recording_done(hass)
+
+    start_ts = start.timestamp()
+    hist = history.get_downsampled_states(
+        hass, start, start + timedelta(seconds=60), ["sensor.power"], 30
+    )
+    assert hist == {
+        "sensor.power": [
+            {"s": "3", "lu": start_ts, "min": 1, "max": 100, "mean": 104 / 3},
+            {"s": "20", "lu": start_ts + 30, "min": 10, "max": 20, "mean": 15},
+        ],
+    }
+
+
 def record_states(
     hass: HomeAssistant,
 ) -> tuple[datetime, datetime, dict[str, list[State]]]:
@@ -0,0 +1,266 @@
+"""Test managing partitions of recorder tables."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, Mock
+
+from freezegun import freeze_time
+import pytest
+from sqlalchemy.exc import ProgrammingError
+
+from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.migration import partition_tables
+from homeassistant.components.recorder.partition import (
+    Partition,
+    create_partitions,
+    drop_partitions,
+    get_partitions,
+    is_partitioned,
+)
+
+DAY_1 = datetime(2024, 3, 1, tzinfo=UTC).timestamp()
+DAY_2 = datetime(2024, 3, 2, tzinfo=UTC).timestamp()
+DAY_3 = datetime(2024, 3, 3, tzinfo=UTC).timestamp()
+DAY_4 = datetime(2024, 3, 4, tzinfo=UTC).timestamp()
+
+
+def _mock_instance(dialect_name: SupportedDialect) -> Mock:
+    """Return a recorder instance using a database of the dialect."""
+    instance = Mock(dialect_name=dialect_name)
+    instance.engine.dialect.name = dialect_name
+    return instance
+
+
+def _mock_session(partitions: list[tuple[str, str]]) -> MagicMock:
+    """Return a session that finds the partitions."""
+    session = MagicMock()
+    session.execute.return_value.all.return_value = partitions
+    session.execute.return_value.scalar_one.return_value = 10
+    return session
+
+
+def _executed_sql(session: MagicMock) -> list[str]:
+    """Return the sql executed by the session after finding the partitions."""
+    return [str(call.args[0]) for call in session.execute.call_args_list[1:]]
+
+
+def test_get_partitions() -> None:
+    """Test finding the range partitions of a table."""
+    session = _mock_session(
+        [
+            ("stats_p2", f"FOR VALUES FROM ('{DAY_2}') TO ('{DAY_3}')"),
+            ("stats_default", "DEFAULT"),
+            ("stats_p1", f"FOR VALUES FROM (MINVALUE) TO ({DAY_2})"),
+            ("stats_p3", f"FOR VALUES FROM ('{DAY_3}') TO (MAXVALUE)"),
+        ]
+    )
+    assert get_partitions(session, "stats") == [
+        Partition("stats_p1", float("-inf"), DAY_2),
+        Partition("stats_p2", DAY_2, DAY_3),
+        Partition("stats_p3", DAY_3, float("inf")),
+    ]
+    assert session.execute.call_args.args[1] == {"table": "stats"}
+
+    assert get_partitions(_mock_session([]), "stats") == []
+
+
+def test_create_partitions() -> None:
+    """Test creating daily partitions ahead of time."""
+    instance = _mock_instance(SupportedDialect.POSTGRESQL)
+    session = _mock_session(
+        [("stats_p1", f"FOR VALUES FROM ('{DAY_1}') TO ('{DAY_2}')")]
+    )
+    until = datetime(2024, 3, 3, 12, tzinfo=UTC)
+    assert create_partitions(instance, session, "stats", until) == 2
+    assert _executed_sql(session) == [
+        'CREATE TABLE "stats_p202403020000" PARTITION OF "stats" '
+        f"FOR VALUES FROM ({DAY_2!r}) TO ({DAY_3!r})",
+        'CREATE TABLE "stats_p202403030000" PARTITION OF "stats" '
+        f"FOR VALUES FROM ({DAY_3!r}) TO ({DAY_4!r})",
+    ]
+
+    # Partitions that already cover until are kept
+    session = _mock_session(
+        [("stats_p1", f"FOR VALUES FROM ('{DAY_1}') TO ('{DAY_4}')")]
+    )
+    assert create_partitions(instance, session, "stats", until) == 0
+    assert _executed_sql(session) == []
+
+
+@pytest.mark.parametrize(
+    ("dialect_name", "partitions"),
+    [
+        (SupportedDialect.SQLITE, [("p", f"FOR VALUES FROM ({DAY_1}) TO ({DAY_2})")]),
+        (SupportedDialect.MYSQL, [("p", f"FOR VALUES FROM ({DAY_1}) TO ({DAY_2})")]),
+        (SupportedDialect.POSTGRESQL, []),
+    ],
+)
+def test_create_partitions_not_partitioned(
+    dialect_name: SupportedDialect, partitions: list[tuple[str, str]]
+) -> None:
+    """Test no partitions are created for tables that are not partitioned."""
+    instance = _mock_instance(dialect_name)
+    session = _mock_session(partitions)
+    until = datetime(2024, 3, 3, tzinfo=UTC)
+    assert create_partitions(instance, session, "stats", until) == 0
+    assert session.execute.call_count <= 1
+
+
+def test_create_partitions_error(caplog: pytest.LogCaptureFixture) -> None:
+    """Test creating partitions stops at the first error."""
+    instance = _mock_instance(SupportedDialect.POSTGRESQL)
+    session = _mock_session(
+        [("stats_p1", f"FOR VALUES FROM ('{DAY_1}') TO ('{DAY_2}')")]
+    )
+    session.execute.side_effect = [
+        session.execute.return_value,
+        ProgrammingError("CREATE", {}, Exception("overlaps default partition")),
+    ]
+    until = datetime(2024, 3, 4, tzinfo=UTC)
+    assert create_partitions(instance, session, "stats", until) == 0
+    assert session.execute.call_count == 2
+    assert "Error creating partition stats_p202403020000 of stats" in caplog.text
+
+
+def test_drop_partitions() -> None:
+    """Test dropping the partitions before the purge time."""
+    instance = _mock_instance(SupportedDialect.POSTGRESQL)
+    session = _mock_session(
+        [
+            ("stats_p1", f"FOR VALUES FROM ('{DAY_1}') TO ('{DAY_2}')"),
+            ("stats_p2", f"FOR VALUES FROM ('{DAY_2}') TO ('{DAY_3}')"),
+            ("stats_p3", f"FOR VALUES FROM ('{DAY_3}') TO ('{DAY_4}')"),
+        ]
+    )
+    purge_before = datetime(2024, 3, 3, 12, tzinfo=UTC)
+    assert drop_partitions(instance, session, "stats", purge_before) == 20
+    assert _executed_sql(session) == [
+        'SELECT COUNT(*) FROM "stats_p1"',
+        'DROP TABLE "stats_p1"',
+        'SELECT COUNT(*) FROM "stats_p2"',
+        'DROP TABLE "stats_p2"',
+    ]
+
+    instance = _mock_instance(SupportedDialect.SQLITE)
+    session = _mock_session([])
+    assert drop_partitions(instance, session, "stats", purge_before) == 0
+    session.execute.assert_not_called()
+
+
+def test_drop_partitions_error(caplog: pytest.LogCaptureFixture) -> None:
+    """Test errors dropping partitions are logged and stop the drop."""
+    instance = _mock_instance(SupportedDialect.POSTGRESQL)
+    session = _mock_session(
+        [
+            ("stats_p1", f"FOR VALUES FROM ('{DAY_1}') TO ('{DAY_2}')"),
+            ("stats_p2", f"FOR VALUES FROM ('{DAY_2}') TO ('{DAY_3}')"),
+            ("stats_p3", f"FOR VALUES FROM ('{DAY_3}') TO ('{DAY_4}')"),
+        ]
+    )
+    result = session.execute.return_value
+    session.execute.side_effect = [
+        result,
+        result,
+        result,
+        result,
+        ProgrammingError("DROP", {}, Exception("must be owner of table stats_p2")),
+    ]
+    purge_before = datetime(2024, 3, 4, tzinfo=UTC)
+    assert drop_partitions(instance, session, "stats", purge_before) == 10
+    assert session.execute.call_count == 5
+    assert "Error dropping partition stats_p2 of stats" in caplog.text
+
+    session = _mock_session([])
+    session.execute.side_effect = ProgrammingError(
+        "SELECT", {}, Exception("permission denied for table pg_inherits")
+    )
+    assert drop_partitions(instance, session, "stats", purge_before) == 0
+    assert "Error finding the partitions of stats" in caplog.text
+
+
+def test_is_partitioned() -> None:
+    """Test checking if a table is partitioned."""
+    session = MagicMock()
+    session.execute.return_value.scalar.return_value = True
+    assert is_partitioned(session, "stats") is True
+    assert session.execute.call_args.args[1] == {"table": "stats"}
+
+    session.execute.return_value.scalar.return_value = None
+    assert is_partitioned(session, "stats") is False
+
+
+@freeze_time(datetime(2024, 3, 1, 12, tzinfo=UTC))
+def test_partition_tables(caplog: pytest.LogCaptureFixture) -> None:
+    """Test partitioning statistics_short_term on PostgreSQL."""
+    instance = _mock_instance(SupportedDialect.POSTGRESQL)
+    session = _mock_session([])
+    session.execute.return_value.scalar.return_value = False
+    partition_tables(instance, lambda: session)
+
+    executed = [str(call.args[0]) for call in session.execute.call_args_list]
+    # The table is checked first and the upcoming partitions are found last
+    assert len(executed) == 15
+    assert executed[1:14] == [
+        'ALTER TABLE "statistics_short_term" '
+        'RENAME TO "statistics_short_term_unpartitioned"',
+        'ALTER INDEX "statistics_short_term_pkey" '
+        'RENAME TO "statistics_short_term_unpartitioned_pkey"',
+        'CREATE SEQUENCE "statistics_short_term_partitioned_id_seq" AS bigint',
+        'CREATE TABLE "statistics_short_term" '
+        '(LIKE "statistics_short_term_unpartitioned" INCLUDING DEFAULTS, '
+        "PRIMARY KEY (id, start_ts)) PARTITION BY RANGE (start_ts)",
+        'ALTER TABLE "statistics_short_term" ALTER COLUMN id '
+        "SET DEFAULT nextval('statistics_short_term_partitioned_id_seq')",
+        'ALTER SEQUENCE "statistics_short_term_partitioned_id_seq" '
+        'OWNED BY "statistics_short_term".id',
+        'CREATE TABLE "statistics_short_term_initial" '
+        'PARTITION OF "statistics_short_term" '
+        f"FOR VALUES FROM (MINVALUE) TO ({DAY_2!r})",
+        'INSERT INTO "statistics_short_term" '
+        'SELECT * FROM "statistics_short_term_unpartitioned"',
+        "SELECT setval('statistics_short_term_partitioned_id_seq', "
+        '(SELECT COALESCE(MAX(id), 0) + 1 FROM "statistics_short_term"), false)',
+        'DROP TABLE "statistics_short_term_unpartitioned"',
+        'CREATE INDEX "ix_statistics_short_term_start_ts" '
+        'ON "statistics_short_term" (start_ts)',
+        'CREATE UNIQUE INDEX "ix_statistics_short_term_statistic_id_start_ts" '
+        'ON "statistics_short_term" (metadata_id, start_ts)',
+        'ALTER TABLE "statistics_short_term" ADD FOREIGN KEY (metadata_id) '
+        'REFERENCES "statistics_meta" (id) ON DELETE CASCADE',
+    ]
+    assert "Partitioning table statistics_short_term done" in caplog.text
+
+
+def test_partition_tables_already_partitioned() -> None:
+    """Test tables that are already partitioned are left alone."""
+    instance = _mock_instance(SupportedDialect.POSTGRESQL)
+    session = _mock_session([])
+    session.execute.return_value.scalar.return_value = True
+    partition_tables(instance, lambda: session)
+    assert session.execute.call_count == 2
+
+
+def test_partition_tables_error(caplog: pytest.LogCaptureFixture) -> None:
+    """Test a table is left as it was if partitioning it fails."""
+    instance = _mock_instance(SupportedDialect.POSTGRESQL)
+    session = _mock_session([])
+    result = session.execute.return_value
+    result.scalar.return_value = False
+    session.execute.side_effect = [
+        result,
+        result,
+        ProgrammingError("ALTER INDEX", {}, Exception("index does not exist")),
+        result,
+    ]
+    partition_tables(instance, lambda: session)
+    # Only the session finding the upcoming partitions is committed
+    assert session.commit.call_count == 1
+    assert "Error partitioning table statistics_short_term" in caplog.text
+    assert "Partitioning table statistics_short_term done" not in caplog.text
+
+
+def test_partition_tables_not_supported(caplog: pytest.LogCaptureFixture) -> None:
+    """Test tables are only partitioned on PostgreSQL."""
+    session_maker = Mock()
+    partition_tables(_mock_instance(SupportedDialect.SQLITE), session_maker)
+    session_maker.assert_not_called()
+    assert "Partitioning tables is only supported with PostgreSQL" in caplog.text
@@ -45,6 +45,7 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
+from tests.common import async_fire_time_changed
 from tests.typing import RecorderInstanceGenerator
 
 TEST_EVENT_TYPES = (
@@ -223,6 +224,122 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert state_attributes.count() == 3
 
 
+async def test_purge_old_states_time_budget(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test purging stops starting new batches once the time budget is used."""
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = recorder_mock.purge_progress
+
+    with patch.object(recorder_mock, "max_bind_vars", 1):
+        finished = purge_old_data(
+            recorder_mock, purge_before, repack=False, time_budget=0
+        )
+    assert not finished
+    assert progress.rows["states"] == 1
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 5
+
+    # A batch was cut short so there may be more to purge
+    finished = purge_old_data(recorder_mock, purge_before, repack=False, time_budget=0)
+    assert not finished
+    finished = purge_old_data(recorder_mock, purge_before, repack=False, time_budget=0)
+    assert finished
+    assert progress.rows["states"] == 4
+    assert progress.rows["state_attributes"] == 2
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+
+
+async def test_purge_old_events_time_budget(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test events are not purged once the states used up the time budget."""
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = recorder_mock.purge_progress
+
+    finished = purge_old_data(recorder_mock, purge_before, repack=False, time_budget=0)
+    assert not finished
+    assert progress.rows["states"] == 4
+    assert "events" not in progress.rows
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        assert events.count() == 6
+
+    # Once the states are purged the events get a batch in every slice
+    finished = purge_old_data(recorder_mock, purge_before, repack=False, time_budget=0)
+    assert not finished
+    assert progress.rows["events"] == 4
+    finished = purge_old_data(recorder_mock, purge_before, repack=False, time_budget=0)
+    assert finished
+
+    with session_scope(hass=hass) as session:
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        assert events.count() == 2
+
+
+async def test_purge_progress(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test the progress of a purge is tracked per slice."""
+    await _add_test_states(hass)
+    progress = recorder_mock.purge_progress
+    assert progress.started is None
+    assert progress.rows_per_second is None
+    assert progress.lag == 0
+
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 1),
+        patch.object(recorder_mock, "purge_max_slice_latency", 0),
+    ):
+        await hass.services.async_call(RECORDER_DOMAIN, SERVICE_PURGE, {"keep_days": 4})
+        await hass.async_block_till_done()
+        await async_wait_purge_done(hass, 10)
+
+    assert progress.started is None
+    assert progress.last_finished is not None
+    assert progress.slices > 1
+    assert progress.rows["states"] == 4
+    assert progress.rows_per_second > 0
+    assert progress.lag == 0
+
+
+async def test_purge_slices_are_spaced(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the next purge slice is queued after a slice used up its latency."""
+    with (
+        patch.object(recorder_mock, "purge_max_slice_latency", 1),
+        patch(
+            "homeassistant.components.recorder.purge.purge_old_data",
+            side_effect=[False, True],
+        ) as purge_mock,
+        patch("homeassistant.components.recorder.tasks.time") as time_mock,
+    ):
+        time_mock.monotonic.side_effect = [0, 1, 10, 10.5]
+        await hass.services.async_call(RECORDER_DOMAIN, SERVICE_PURGE, {"keep_days": 4})
+        await hass.async_block_till_done()
+        await async_wait_purge_done(hass)
+        assert len(purge_mock.mock_calls) == 1
+        assert purge_mock.mock_calls[0].kwargs["time_budget"] == 1
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await async_wait_purge_done(hass)
+        assert len(purge_mock.mock_calls) == 2
+
+    assert recorder_mock.purge_progress.slices == 2
+    assert recorder_mock.purge_progress.started is None
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("recorder_mock", "skip_by_db_engine")
 async def test_purge_old_states_encouters_database_corruption(
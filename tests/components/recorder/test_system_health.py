@@ -38,6 +38,30 @@ async def test_recorder_system_health(
     }
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_recorder_system_health_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health includes the purge progress."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    progress = get_instance(hass).purge_progress
+    progress.start_slice()
+    progress.add_rows("states", 100)
+    progress.finish_slice(0.5, False)
+    with patch("homeassistant.components.recorder.purge.time.time") as mock_time:
+        mock_time.return_value = progress.started + 30
+        info = await get_system_health_info(hass, "recorder")
+    assert info["purge_rows_per_second"] == 200
+    assert info["purge_lag"] == 30
+
+    progress.finish_slice(0.5, True)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["purge_rows_per_second"] == 100
+    assert info["purge_lag"] == 0
+
+
 @pytest.mark.parametrize(
     "db_engine", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
@@ -645,6 +645,122 @@ async def test_compile_hourly_statistics_only_state_is_and_end_of_period(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_accumulated(hass: HomeAssistant) -> None:
+    """Test statistics of measurement sensors are accumulated from state changes."""
+    period0 = get_start_time(dt_util.utcnow())
+    period1 = period0 + timedelta(minutes=5)
+    period2 = period0 + timedelta(minutes=10)
+    period3 = period0 + timedelta(minutes=15)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {"state_class": "measurement", "unit_of_measurement": "W"}
+
+    def set_state(entity_id: str, state: str, **kwargs: Any) -> None:
+        hass.states.async_set(entity_id, state, attributes | kwargs)
+
+    with freeze_time(period0 + timedelta(seconds=10)) as freezer:
+        set_state("sensor.test1", "10")
+        set_state("sensor.test2", "10")
+        # The first compile starts tracking the sensors
+        do_adhoc_statistics(hass, start=period0)
+        await async_wait_recording_done(hass)
+
+        for time, entity_id, state, kwargs in (
+            (period1 + timedelta(seconds=60), "sensor.test1", "20", {}),
+            (period1 + timedelta(seconds=60), "sensor.test2", "20", {}),
+            (period1 + timedelta(seconds=120), "sensor.test1", STATE_UNAVAILABLE, {}),
+            (period1 + timedelta(seconds=180), "sensor.test1", "30", {}),
+            (
+                period1 + timedelta(seconds=180),
+                "sensor.test2",
+                "0.03",
+                {"unit_of_measurement": "kW"},
+            ),
+            (period1 + timedelta(seconds=240), "sensor.test1", "30", {"any": "attr"}),
+            (period2 + timedelta(seconds=150), "sensor.test1", STATE_UNAVAILABLE, {}),
+            (period3 + timedelta(seconds=100), "sensor.test1", "40", {}),
+        ):
+            freezer.move_to(time)
+            set_state(entity_id, state, **kwargs)
+        await async_wait_recording_done(hass)
+
+        freezer.move_to(period3 + timedelta(minutes=5, seconds=10))
+        with patch(
+            "homeassistant.components.sensor.recorder.history.get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        ) as history_mock:
+            for start in (period1, period2, period3):
+                do_adhoc_statistics(hass, start=start)
+            await async_wait_recording_done(hass)
+    # Only sensor.test2 is compiled from history since its unit changed
+    assert {
+        entity_id
+        for call in history_mock.mock_calls
+        for entity_id in call.kwargs["entity_ids"]
+    } == {"sensor.test2"}
+
+    stats = statistics_during_period(
+        hass, period1, period="5minute", statistic_ids={"sensor.test1"}
+    )
+    assert [
+        (stat["mean"], stat["min"], stat["max"]) for stat in stats["sensor.test1"]
+    ] == [
+        (pytest.approx(22), 10, 30),
+        (pytest.approx(30), 30, 30),
+        (pytest.approx(40), 40, 40),
+    ]
+
+
+async def test_compile_statistics_accumulated_new_sensor(
+    hass: HomeAssistant,
+) -> None:
+    """Test a sensor without statistics metadata is compiled from history."""
+    period0 = get_start_time(dt_util.utcnow())
+    period1 = period0 + timedelta(minutes=5)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {"state_class": "measurement"}
+
+    with freeze_time(period0 + timedelta(seconds=10)) as freezer:
+        hass.states.async_set("sensor.test1", STATE_UNAVAILABLE, attributes)
+        # The first compile starts tracking the sensor, but there are no
+        # statistics for it yet
+        do_adhoc_statistics(hass, start=period0)
+        await async_wait_recording_done(hass)
+        assert get_metadata(hass, statistic_ids={"sensor.test1"}) == {}
+
+        freezer.move_to(period1 + timedelta(seconds=60))
+        hass.states.async_set(
+            "sensor.test1", "10", attributes | {"unit_of_measurement": "W"}
+        )
+        await async_wait_recording_done(hass)
+
+        freezer.move_to(period1 + timedelta(minutes=5, seconds=10))
+        with patch(
+            "homeassistant.components.sensor.recorder.history.get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        ) as history_mock:
+            do_adhoc_statistics(hass, start=period1)
+            await async_wait_recording_done(hass)
+    # The unit of the new sensor is validated on the history path
+    assert {
+        entity_id
+        for call in history_mock.mock_calls
+        for entity_id in call.kwargs["entity_ids"]
+    } == {"sensor.test1"}
+
+    stats = statistics_during_period(
+        hass, period1, period="5minute", statistic_ids={"sensor.test1"}
+    )
+    assert [
+        (stat["mean"], stat["min"], stat["max"]) for stat in stats["sensor.test1"]
+    ] == [(pytest.approx(10), 10, 10)]
+    metadata = get_metadata(hass, statistic_ids={"sensor.test1"})
+    assert metadata["sensor.test1"][1]["unit_of_measurement"] == "W"
+
+
 @pytest.mark.parametrize(
     ("device_class", "state_unit", "display_unit", "statistics_unit", "unit_class"),
     [
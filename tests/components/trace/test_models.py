@@ -0,0 +1,31 @@
+"""Test the script and automation trace containers."""
+
+from homeassistant.components.trace.models import decode_trace, encode_trace
+
+
+def test_encode_trace() -> None:
+    """Test variables assigned in several steps are encoded once."""
+    response = {"text": "answer " * 100}
+    extended_dict = {
+        "run_id": "abc",
+        "trace": {
+            "trigger": [
+                {
+                    "path": "trigger",
+                    "changed_variables": {"this": None, "trigger": {"id": "0"}},
+                }
+            ],
+            "action/0": [
+                {"path": "action/0", "changed_variables": {"response": response}}
+            ],
+            "action/1": [
+                {"path": "action/1", "changed_variables": {"copy": response}},
+                {"path": "action/1", "result": {"done": True}},
+            ],
+        },
+    }
+
+    data = encode_trace(extended_dict)
+
+    assert data.count(response["text"].encode()) == 1
+    assert decode_trace(data) == extended_dict
@@ -3,13 +3,20 @@
 import asyncio
 from collections import defaultdict
 import json
+from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 from pytest_unordered import unordered
 
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import (
+    DATA_TRACE,
+    DATA_TRACE_BUDGET,
+    DEFAULT_STORED_TRACES,
+    SPILLED_TRACES_DIR,
+)
+from homeassistant.components.trace.models import CompactTrace, SpilledTrace
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.helpers.typing import UNDEFINED
@@ -44,6 +51,7 @@ async def _setup_automation_or_script(
     configs: list[dict[str, Any]],
     script_config: dict[str, Any] | None = None,
     stored_traces: int | None = None,
+    trace_config: dict[str, Any] | None = None,
 ) -> None:
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -67,6 +75,10 @@ async def _setup_automation_or_script(
                 config["trace"] = {}
                 config["trace"]["stored_traces"] = stored_traces
 
+    if trace_config is not None:
+        for config in configs.values() if domain == "script" else configs:
+            config["trace"] = trace_config
+
     assert await async_setup_component(hass, domain, {domain: configs})
 
 
@@ -788,6 +800,250 @@ async def test_trace_no_traces(
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "num_traces"),
+    [
+        ({"policy": "full"}, 4),
+        ({"policy": "sampled", "sample_rate": 2}, 2),
+        ({"policy": "sampled", "sample_rate": 3}, 2),
+        ({"policy": "errors"}, 0),
+        ({"policy": "off"}, 0),
+    ],
+)
+async def test_trace_policy(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    trace_config: dict[str, Any],
+    num_traces: int,
+) -> None:
+    """Test the trace policy selects the runs which are traced."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config=trace_config
+    )
+
+    client = await hass_ws_client()
+
+    for _ in range(4):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], domain, "sun")
+    assert len(traces) == num_traces
+    for trace in traces:
+        assert trace["last_step"] is not None
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "traced"),
+    [({"policy": "errors"}, True), ({"policy": "off"}, False)],
+)
+async def test_trace_policy_errors(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    trace_config: dict[str, Any],
+    traced: bool,
+) -> None:
+    """Test the traces of failed runs are stored if runs are not traced."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"action": "test.automation"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config=trace_config
+    )
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    run_id = _find_run_id(response["result"], domain, "sun")
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trace = response["result"]
+    assert trace["error"] == "Action test.automation not found"
+    assert trace["state"] == "stopped"
+    assert bool(trace["trace"]) is traced
+
+
+@pytest.mark.parametrize(
+    ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
+)
+async def test_trace_spilled_to_disk(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    tmp_path: Path,
+    domain: str,
+    prefix: str,
+) -> None:
+    """Test older traces are spilled to disk when over the memory budget."""
+    msg_id = 0
+
+    def next_id():
+        nonlocal msg_id
+        msg_id += 1
+        return msg_id
+
+    hass.config.config_dir = str(tmp_path)
+    answer = "answer " * 100
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": [{"variables": {"answer": answer}}, {"event": "some_event"}],
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config])
+    spill_dir = tmp_path / ".storage" / SPILLED_TRACES_DIR
+
+    client = await hass_ws_client()
+
+    async def _list_traces() -> list[dict[str, Any]]:
+        await client.send_json(
+            {"id": next_id(), "type": "trace/list", "domain": domain}
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return _find_traces(response["result"], domain, "sun")
+
+    with (
+        patch("homeassistant.components.trace.budget.RECENT_TRACES", 1),
+        patch("homeassistant.components.trace.budget.MAX_TRACE_MEMORY", 0),
+    ):
+        for _ in range(4):
+            await _run_automation_or_script(hass, domain, sun_config, "test_event")
+            await hass.async_block_till_done(wait_background_tasks=True)
+
+    traces = await _list_traces()
+    assert len(traces) == 4
+    run_ids = [trace["run_id"] for trace in traces]
+    assert {path.name for path in spill_dir.iterdir()} == {
+        f"{run_id}.json" for run_id in run_ids[:3]
+    }
+    stored_traces = hass.data[DATA_TRACE][f"{domain}.sun"]
+    assert isinstance(stored_traces[run_ids[0]], SpilledTrace)
+    assert not isinstance(stored_traces[run_ids[3]], SpilledTrace)
+
+    # Spilled traces are read back from disk
+    await client.send_json(
+        {
+            "id": next_id(),
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": run_ids[0],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trace = response["result"]
+    assert trace["run_id"] == run_ids[0]
+    assert trace["state"] == "stopped"
+    assert trace["trace"][f"{prefix}/0"][0]["changed_variables"]["answer"] == answer
+
+    # The oldest spilled traces are removed when over the disk budget
+    with (
+        patch("homeassistant.components.trace.budget.RECENT_TRACES", 1),
+        patch("homeassistant.components.trace.budget.MAX_TRACE_MEMORY", 0),
+        patch("homeassistant.components.trace.budget.MAX_SPILLED_TRACES_SIZE", 0),
+    ):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    traces = await _list_traces()
+    assert len(traces) == 1
+    assert list(spill_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_budget_evicted_traces(hass: HomeAssistant, domain: str) -> None:
+    """Test traces evicted by the stored traces limit are removed from the budget."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config], stored_traces=2)
+
+    with patch("homeassistant.components.trace.budget.RECENT_TRACES", 1):
+        for _ in range(4):
+            await _run_automation_or_script(hass, domain, sun_config, "test_event")
+            await hass.async_block_till_done()
+
+    stored_traces = list(hass.data[DATA_TRACE][f"{domain}.sun"].values())
+    assert len(stored_traces) == 2
+    assert isinstance(stored_traces[0], CompactTrace)
+    assert hass.data[DATA_TRACE_BUDGET].memory_size == len(stored_traces[0].data)
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_budget_restored_traces(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+) -> None:
+    """Test restored traces are added to the budget as the oldest traces."""
+    saved_traces = json.loads(load_fixture(f"trace/{domain}_saved_traces.json"))
+    hass_storage["trace.saved_traces"] = saved_traces
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config])
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], domain, "sun")
+    assert len(traces) == 2
+    restored_run_id, run_id = (trace["run_id"] for trace in traces)
+
+    # The restored trace is compacted, the trace of this run is kept as it is
+    stored_traces = hass.data[DATA_TRACE][f"{domain}.sun"]
+    assert isinstance(stored_traces[restored_run_id], CompactTrace)
+    assert not isinstance(stored_traces[run_id], CompactTrace)
+
+    # Only the restored traces are compacted, so they are the first spilled
+    restored_run_ids = {
+        json_trace["short_dict"]["run_id"]
+        for key_traces in saved_traces["data"].values()
+        for json_trace in key_traces
+    }
+    budget = hass.data[DATA_TRACE_BUDGET]
+    assert (f"{domain}.sun", restored_run_id) in budget._compact
+    assert {run_id for _, run_id in budget._compact} == restored_run_ids
+    assert list(budget._recent) == [(f"{domain}.sun", run_id)]
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix", "trigger", "last_step", "script_execution"),
     [
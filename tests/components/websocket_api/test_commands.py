@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
@@ -19,7 +20,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -34,6 +35,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1310,6 +1312,125 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_shared_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities subscriptions share one state changed listener."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.not_permitted", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    for msg_id, entity_ids in (
+        (7, ["light.permitted", "light.not_permitted"]),
+        (8, ["light.not_permitted", "light.permitted"]),
+        (9, ["light.not_permitted"]),
+    ):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "subscribe_entities", "entity_ids": entity_ids}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on")
+    for msg_id in (7, 8):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["event"] == {
+            "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+        }
+
+    # Permission changes apply to the existing subscriptions
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"light.not_permitted": True}}}
+    )
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.not_permitted", "off")
+    for msg_id in (7, 8, 9):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["event"] == {
+            "c": {"light.not_permitted": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+        }
+
+    for msg_id, unsub_id in ((7, 10), (8, 11), (9, 12)):
+        await websocket_client.send_json(
+            {"id": unsub_id, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == unsub_id
+        assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+
+async def test_subscribe_entities_coalesce_states(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test state diffs are merged per entity while the client is behind."""
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_states": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"].keys() == {"light.changed", "light.removed"}
+
+    with patch(
+        "homeassistant.components.websocket_api.const.PENDING_MSG_COALESCE_STATES",
+        0,
+    ):
+        hass.states.async_set("light.changed", "on", {"color": "blue"})
+        hass.states.async_set("light.changed", "on", {"color": "green"})
+        hass.states.async_set("light.changed", "on", {})
+        hass.states.async_set("light.added", "on")
+        hass.states.async_set("light.added", "off")
+        hass.states.async_remove("light.removed")
+        hass.states.async_set("light.temporary", "on")
+        hass.states.async_remove("light.temporary")
+        await hass.async_block_till_done()
+
+    freezer.tick(const.COALESCE_STATES_INTERVAL)
+    async_fire_time_changed(hass)
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}},
+        "c": {
+            "light.changed": {
+                "+": {"c": ANY, "s": "on"},
+                "-": {"a": ["color"]},
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+    # Diffs are sent as they happen again once the client caught up
+    hass.states.async_set("light.changed", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {"light.changed": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
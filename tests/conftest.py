@@ -1454,6 +1454,9 @@ async def _async_init_recorder_component(
         config[recorder.CONF_DB_URL] = db_url
         if recorder.CONF_COMMIT_INTERVAL not in config:
             config[recorder.CONF_COMMIT_INTERVAL] = 0
+        if recorder.CONF_PURGE_MAX_SLICE_LATENCY not in config:
+            # Don't space out purge slices on a busy test machine
+            config[recorder.CONF_PURGE_MAX_SLICE_LATENCY] = 60
 
     with patch("homeassistant.components.recorder.ALLOW_IN_MEMORY_DB", True):
         if recorder.DOMAIN not in hass.data:
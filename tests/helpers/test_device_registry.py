@@ -2262,6 +2262,48 @@ async def test_cleanup_device_registry_removes_expired_orphaned_devices(
     assert len(device_registry.deleted_devices) == 0
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_purge_keeps_stored_deleted_devices(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test purging does not load the deleted devices when none expired."""
+    orphaned_timestamp = time.time()
+    deleted_device = {
+        "config_entries": [],
+        "connections": [],
+        "created_at": "2024-02-14T12:00:00.900075+00:00",
+        "identifiers": [["serial", "123456ABCDEF"]],
+        "modified_at": "2024-02-14T12:00:00.900075+00:00",
+    }
+    hass_storage[dr.STORAGE_KEY] = {
+        "version": dr.STORAGE_VERSION_MAJOR,
+        "minor_version": dr.STORAGE_VERSION_MINOR,
+        "data": {
+            "devices": [],
+            "deleted_devices": [
+                {**deleted_device, "id": "1", "orphaned_timestamp": None},
+                {
+                    **deleted_device,
+                    "id": "2",
+                    "orphaned_timestamp": orphaned_timestamp,
+                },
+            ],
+        },
+    }
+
+    await dr.async_load(hass)
+    registry = dr.async_get(hass)
+
+    registry.async_purge_expired_orphaned_devices()
+    assert registry._stored_deleted_devices is not None
+
+    future_time = orphaned_timestamp + dr.ORPHANED_DEVICE_KEEP_SECONDS + 1
+    with patch("time.time", return_value=future_time):
+        registry.async_purge_expired_orphaned_devices()
+    assert registry._stored_deleted_devices is None
+    assert list(registry.deleted_devices) == ["1"]
+
+
 async def test_cleanup_startup(hass: HomeAssistant) -> None:
     """Test we run a cleanup on startup."""
     hass.set_state(CoreState.not_running)
@@ -588,6 +588,37 @@ async def test_async_remove_no_platform(hass: HomeAssistant) -> None:
     assert len(hass.states.async_entity_ids()) == 0
 
 
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the states of multiple entities in one batch."""
+    platform = MockEntityPlatform(hass, domain="test")
+    ent_1, ent_2, ent_3 = entity.Entity(), entity.Entity(), entity.Entity()
+    ent_1.entity_id = "test.one"
+    ent_2.entity_id = "test.two"
+    ent_3.entity_id = "test.three"
+    await platform.async_add_entities([ent_1, ent_2, ent_3])
+
+    ent_1._attr_state = "off"
+    ent_2._attr_state = "x" * 256
+    ent_3._attr_state = "on"
+    with patch.object(
+        ent_2,
+        "_async_prepare_state_update",
+        wraps=ent_2._async_prepare_state_update,
+    ) as mock_prepare:
+        entity.async_write_ha_states(hass, [ent_1, ent_2, ent_3])
+
+    # The state of the entity is only calculated once
+    assert mock_prepare.call_count == 1
+
+    one = hass.states.get("test.one")
+    three = hass.states.get("test.three")
+    assert one.state == "off"
+    assert three.state == "on"
+    assert one.last_updated == three.last_updated
+    # States that are too long fall back to unknown
+    assert hass.states.get("test.two").state == STATE_UNKNOWN
+
+
 async def test_async_remove_runs_callbacks(hass: HomeAssistant) -> None:
     """Test async_remove runs on_remove callback."""
     result = []
@@ -8,6 +8,7 @@ from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
+from pytest_unordered import unordered
 from syrupy.assertion import SnapshotAssertion
 import voluptuous as vol
 
@@ -15,6 +16,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE, EntityCategory
 from homeassistant.core import (
     CoreState,
+    EntityServiceResponse,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
@@ -1580,6 +1582,158 @@ async def test_platforms_sharing_services(hass: HomeAssistant) -> None:
     assert entity2 in entities
 
 
+async def test_entity_service_batch_handler(hass: HomeAssistant) -> None:
+    """Test a batch handler receives the targeted entities of its platform."""
+    entities = []
+    batches = []
+
+    class HelloEntity(MockEntity):
+        """Mock entity with a hello method."""
+
+        async def async_hello(self, **kwargs: Any) -> ServiceResponse:
+            """Say hello."""
+            assert kwargs == {"some": "data"}
+            entities.append(self)
+            return {"batched": False}
+
+    entity_platform1 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity1 = HelloEntity(entity_id="mock_integration.entity_1")
+    entity2 = HelloEntity(entity_id="mock_integration.entity_2")
+    await entity_platform1.async_add_entities([entity1, entity2])
+
+    entity_platform2 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity3 = HelloEntity(entity_id="mock_integration.entity_3")
+    entity4 = HelloEntity(entity_id="mock_integration.entity_4")
+    await entity_platform2.async_add_entities([entity3, entity4])
+
+    async def handle_batch(
+        batch: list[MockEntity], data: dict[str, Any]
+    ) -> EntityServiceResponse:
+        assert data == {"some": "data"}
+        batches.append(batch)
+        return {entity.entity_id: {"batched": True} for entity in batch}
+
+    entity_platform1.async_register_entity_service(
+        "hello",
+        {vol.Required("some"): str},
+        "async_hello",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    entity_platform1.async_register_entity_service_batch_handler(
+        "hello", handle_batch, domain="mock_platform"
+    )
+
+    response = await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        {"entity_id": "all", "some": "data"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert batches == [[entity1, entity2]]
+    assert entities == unordered([entity3, entity4])
+    assert response == {
+        "mock_integration.entity_1": {"batched": True},
+        "mock_integration.entity_2": {"batched": True},
+        "mock_integration.entity_3": {"batched": False},
+        "mock_integration.entity_4": {"batched": False},
+    }
+
+    # A single entity of the platform is called on its own
+    batches.clear()
+    entities.clear()
+    await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        {
+            "entity_id": ["mock_integration.entity_1", "mock_integration.entity_3"],
+            "some": "data",
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert batches == []
+    assert entities == unordered([entity1, entity3])
+
+
+async def test_entity_service_batch_handler_service_func(
+    hass: HomeAssistant,
+) -> None:
+    """Test a service registered with a function is not batched."""
+    entity_platform = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity1 = MockEntity(entity_id="mock_integration.entity_1")
+    entity2 = MockEntity(entity_id="mock_integration.entity_2")
+    await entity_platform.async_add_entities([entity1, entity2])
+
+    entities = []
+    handle_batch = AsyncMock()
+
+    async def handle_service(entity: MockEntity, call: ServiceCall) -> None:
+        entities.append(entity)
+
+    entity_platform.async_register_entity_service("hello", None, handle_service)
+    entity_platform.async_register_entity_service_batch_handler(
+        "hello", handle_batch, domain="mock_platform"
+    )
+
+    await hass.services.async_call(
+        "mock_platform", "hello", {"entity_id": "all"}, blocking=True
+    )
+
+    handle_batch.assert_not_called()
+    assert entities == unordered([entity1, entity2])
+
+
+async def test_entity_service_batch_handler_entity_params(
+    hass: HomeAssistant,
+) -> None:
+    """Test a service function with entity_params is batched by equal params."""
+    entity_platform = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity1 = MockEntity(entity_id="mock_integration.entity_1")
+    entity2 = MockEntity(entity_id="mock_integration.entity_2")
+    entity3 = MockEntity(entity_id="mock_integration.entity_3")
+    await entity_platform.async_add_entities([entity1, entity2, entity3])
+
+    entities = []
+    batches = []
+
+    def entity_params(entity: MockEntity, call: ServiceCall) -> dict[str, Any]:
+        return {"some": call.data["some"], "first": entity is entity1}
+
+    async def handle_service(entity: MockEntity, call: ServiceCall) -> None:
+        assert entity_params(entity, call) == {"some": "data", "first": True}
+        entities.append(entity)
+
+    async def handle_batch(batch: list[MockEntity], data: dict[str, Any]) -> None:
+        batches.append((batch, data))
+
+    entity_platform.async_register_entity_service(
+        "hello",
+        {vol.Required("some"): str},
+        handle_service,
+        entity_params=entity_params,
+    )
+    entity_platform.async_register_entity_service_batch_handler(
+        "hello", handle_batch, domain="mock_platform"
+    )
+
+    await hass.services.async_call(
+        "mock_platform", "hello", {"entity_id": "all", "some": "data"}, blocking=True
+    )
+
+    assert entities == [entity1]
+    assert batches == [([entity2, entity3], {"some": "data", "first": False})]
+
+
 async def test_register_entity_service_response_data(hass: HomeAssistant) -> None:
     """Test an entity service that does supports response data."""
 
@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 from functools import partial
+import time
 from typing import Any
 from unittest.mock import patch
 
@@ -458,6 +459,163 @@ async def test_filter_on_load(
     assert entry_disabled_user.disabled_by is er.RegistryEntryDisabler.USER
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_load_deleted_entities_when_used(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test deleted entities are kept as stored until they are used."""
+    deleted_entity = {
+        "config_entry_id": None,
+        "created_at": "2024-02-14T12:00:00.900075+00:00",
+        "entity_id": "test.deleted",
+        "id": "00003",
+        "modified_at": "2024-02-14T12:00:00.900075+00:00",
+        "orphaned_timestamp": None,
+        "platform": "super_platform",
+        "unique_id": "deleted",
+    }
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {"entities": [], "deleted_entities": [deleted_entity]},
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+
+    registry.async_schedule_save()
+    await flush_store(registry._store)
+    assert hass_storage[er.STORAGE_KEY]["data"]["deleted_entities"] == [deleted_entity]
+    assert registry._stored_deleted_entities is not None
+
+    assert registry.deleted_entities == {
+        ("test", "super_platform", "deleted"): er.DeletedRegistryEntry(
+            config_entry_id=None,
+            created_at=datetime.fromisoformat(deleted_entity["created_at"]),
+            entity_id="test.deleted",
+            id="00003",
+            modified_at=datetime.fromisoformat(deleted_entity["modified_at"]),
+            orphaned_timestamp=None,
+            platform="super_platform",
+            unique_id="deleted",
+        )
+    }
+    assert registry._stored_deleted_entities is None
+
+    entry = registry.async_get_or_create("test", "super_platform", "deleted")
+    assert entry.id == "00003"
+    assert registry.deleted_entities == {}
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_purge_keeps_stored_deleted_entities(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test purging does not load the deleted entities when none expired."""
+    orphaned_timestamp = time.time()
+    deleted_entity = {
+        "config_entry_id": None,
+        "created_at": "2024-02-14T12:00:00.900075+00:00",
+        "modified_at": "2024-02-14T12:00:00.900075+00:00",
+        "platform": "super_platform",
+    }
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {
+            "entities": [],
+            "deleted_entities": [
+                {
+                    **deleted_entity,
+                    "entity_id": "test.one",
+                    "id": "1",
+                    "orphaned_timestamp": None,
+                    "unique_id": "1",
+                },
+                {
+                    **deleted_entity,
+                    "entity_id": "test.two",
+                    "id": "2",
+                    "orphaned_timestamp": orphaned_timestamp,
+                    "unique_id": "2",
+                },
+            ],
+        },
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+
+    registry.async_purge_expired_orphaned_entities()
+    assert registry._stored_deleted_entities is not None
+
+    future_time = orphaned_timestamp + er.ORPHANED_ENTITY_KEEP_SECONDS + 1
+    with patch("time.time", return_value=future_time):
+        registry.async_purge_expired_orphaned_entities()
+    assert registry._stored_deleted_entities is None
+    assert list(registry.deleted_entities) == [("test", "super_platform", "1")]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_load_shares_equal_values(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test equal values of the loaded entries are shared."""
+    entity = {
+        "aliases": [],
+        "area_id": None,
+        "capabilities": {"state_class": "measurement"},
+        "categories": {},
+        "config_entry_id": None,
+        "created_at": "2024-02-14T12:00:00.900075+00:00",
+        "device_class": None,
+        "device_id": None,
+        "disabled_by": None,
+        "entity_category": None,
+        "has_entity_name": False,
+        "hidden_by": None,
+        "icon": None,
+        "labels": [],
+        "modified_at": "2024-02-14T12:00:00.900075+00:00",
+        "name": None,
+        "options": {"sensor": {"display_precision": 1}},
+        "original_device_class": None,
+        "original_icon": None,
+        "original_name": None,
+        "platform": "super_platform",
+        "previous_unique_id": None,
+        "supported_features": 0,
+        "translation_key": None,
+        "unit_of_measurement": None,
+    }
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {
+            "entities": [
+                {**entity, "entity_id": "sensor.one", "id": "1", "unique_id": "1"},
+                {**entity, "entity_id": "sensor.two", "id": "2", "unique_id": "2"},
+            ],
+            "deleted_entities": [],
+        },
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+
+    one = registry.entities["sensor.one"]
+    two = registry.entities["sensor.two"]
+    assert one.options == {"sensor": {"display_precision": 1}}
+    assert one.options is two.options
+    assert one.capabilities is two.capabilities
+    assert one.created_at is two.created_at
+
+    # Updated options are not shared
+    registry.async_update_entity_options("sensor.one", "sensor", {})
+    assert registry.entities["sensor.one"].options == {"sensor": {}}
+    assert two.options == {"sensor": {"display_precision": 1}}
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_load_bad_data(
     hass: HomeAssistant,
@@ -1,5 +1,7 @@
 """Tests for the registry."""
 
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from typing import Any
 
 from freezegun.api import FrozenDateTimeFactory
@@ -7,7 +9,13 @@ import pytest
 
 from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers import storage
-from homeassistant.helpers.registry import SAVE_DELAY, SAVE_DELAY_LONG, BaseRegistry
+from homeassistant.helpers.registry import (
+    SAVE_DELAY,
+    SAVE_DELAY_LONG,
+    BaseRegistry,
+    BaseRegistryItems,
+    SharedValues,
+)
 
 from tests.common import async_fire_time_changed
 
@@ -27,6 +35,26 @@ class SampleRegistry(BaseRegistry):
         return {}
 
 
+@dataclass
+class SampleEntry:
+    """Entry of a registry of X."""
+
+    area_id: str | None = None
+    labels: set[str] = field(default_factory=set)
+
+
+class SampleRegistryItems(BaseRegistryItems[SampleEntry]):
+    """Container for entries of a registry of X."""
+
+    def _index_entry(self, key: str, entry: SampleEntry) -> None:
+        """Index an entry."""
+
+    def _unindex_entry(
+        self, key: str, replacement_entry: SampleEntry | None = None
+    ) -> None:
+        """Unindex an entry."""
+
+
 @pytest.mark.parametrize(
     "long_delay_state",
     [
@@ -69,3 +97,64 @@ async def test_async_schedule_save(
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
     assert registry.save_calls == 2
+
+
+def test_lazy_index() -> None:
+    """Test indexes are built on first use and then kept up to date."""
+    items = SampleRegistryItems()
+    items["a"] = SampleEntry("kitchen", {"lamp"})
+    items["b"] = SampleEntry("kitchen")
+    items["c"] = SampleEntry(labels={"lamp", "fan"})
+    assert items._lazy_indexes == {}
+
+    assert items._get_lazy_index("area_id") == {"kitchen": {"a": True, "b": True}}
+    assert items._get_lazy_index("labels") == {
+        "lamp": {"a": True, "c": True},
+        "fan": {"c": True},
+    }
+
+    items["b"] = SampleEntry("bedroom", {"fan"})
+    del items["c"]
+    items["d"] = SampleEntry("bedroom")
+    assert items._get_lazy_index("area_id") == {
+        "kitchen": {"a": True},
+        "bedroom": {"b": True, "d": True},
+    }
+    assert items._get_lazy_index("labels") == {"lamp": {"a": True}, "fan": {"b": True}}
+
+
+def test_shared_values() -> None:
+    """Test equal values are shared."""
+    shared = SharedValues()
+
+    assert shared.string(None) is None
+    platform = "".join(["platform", "_1"])  # noqa: FLY002
+    assert shared.string(platform) is shared.string("platform_1")
+
+    created_at = shared.datetime("2024-02-14T12:00:00+00:00")
+    assert created_at == datetime(2024, 2, 14, 12, tzinfo=UTC)
+    assert shared.datetime("2024-02-14T12:00:00+00:00") is created_at
+
+    capabilities = shared.value({"state_class": "measurement"})
+    assert shared.value({"state_class": "measurement"}) is capabilities
+    assert shared.value({"state_class": "total"}) is not capabilities
+    assert shared.value(None) is None
+
+    # Values converted by different functions are not shared
+    assert shared.value({"state_class": "measurement"}, tuple) == ("state_class",)
+
+
+def test_version() -> None:
+    """Test the version changes when the entries change."""
+    items = SampleRegistryItems()
+    other_items = SampleRegistryItems()
+    assert items.version != other_items.version
+
+    versions = {items.version}
+    items["a"] = SampleEntry("kitchen")
+    versions.add(items.version)
+    items["a"] = SampleEntry("bedroom")
+    versions.add(items.version)
+    del items["a"]
+    versions.add(items.version)
+    assert len(versions) == 4
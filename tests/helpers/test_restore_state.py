@@ -6,6 +6,8 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+import pytest
+
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
@@ -16,6 +18,7 @@ from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    ExtraStoredData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -51,7 +54,9 @@ async def test_caching_data(hass: HomeAssistant) -> None:
 
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(
+        {"last_dump": now, "states": [state.as_dict() for state in stored_states]}
+    )
 
     # Emulate a fresh load
     hass.data.pop(DATA_RESTORE_STATE)
@@ -96,7 +101,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     """Test that we write periodiclly but not after stop."""
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([])
+    await data.store.async_save({"last_dump": dt_util.utcnow(), "states": []})
 
     # Emulate a fresh load
     with patch(
@@ -144,7 +149,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     """Test that we cancel the currently running job, save the data, and verify the perdiodic job continues."""
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([])
+    await data.store.async_save({"last_dump": dt_util.utcnow(), "states": []})
 
     # Emulate a fresh load
     with patch(
@@ -211,7 +216,9 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
 
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(
+        {"last_dump": now, "states": [state.as_dict() for state in stored_states]}
+    )
 
     # Emulate a fresh load
     hass.set_state(CoreState.not_running)
@@ -298,7 +305,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = args[0]["states"]
 
     for state in states:
         hass.states.async_remove(state.entity_id)
@@ -314,8 +321,11 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     state2 = json_round_trip(written_states[2])
     assert state0["state"]["entity_id"] == "input_boolean.b1"
     assert state0["state"]["state"] == "on"
+    # Only the states that are no longer present keep their last_seen
+    assert "last_seen" not in state0
     assert state1["state"]["entity_id"] == "input_boolean.b3"
     assert state1["state"]["state"] == "off"
+    assert state1["last_seen"] == now.isoformat()
     assert state2["state"]["entity_id"] == "input_boolean.b5"
     assert state2["state"]["state"] == "off"
 
@@ -332,7 +342,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = args[0]["states"]
     assert len(written_states) == 2
     state0 = json_round_trip(written_states[0])
     state1 = json_round_trip(written_states[1])
@@ -375,6 +385,87 @@ async def test_dump_error(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_dump_reuses_unchanged_json(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test only states and extra data that changed are encoded again."""
+
+    class MockExtraStoredData(ExtraStoredData):
+        """Mock extra stored data."""
+
+        def __init__(self, value: Any) -> None:
+            """Initialize the extra stored data."""
+            self.value = value
+
+        def as_dict(self) -> dict[str, Any]:
+            """Return a dict representation of the extra data."""
+            return {"value": self.value}
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity with extra data."""
+
+        value: Any = 1
+
+        @property
+        def extra_restore_state_data(self) -> ExtraStoredData:
+            """Return the extra data."""
+            return MockExtraStoredData(self.value)
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = [MockRestoreEntity(), MockRestoreEntity()]
+    for idx, entity in enumerate(entities):
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+    await platform.async_add_entities(entities)
+    data = async_get(hass)
+
+    async def dump() -> list[dict[str, Any]]:
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        return mock_write_data.mock_calls[0][1][0]["states"]
+
+    first = await dump()
+    assert data.last_dump_stats.states == 2
+    assert data.last_dump_stats.encoded == 2
+    assert data.last_dump_stats.json_size > 0
+    assert data.last_dump_stats.cache_size > 0
+
+    second = await dump()
+    assert data.last_dump_stats.encoded == 0
+    assert [item["state"] for item in second] == [item["state"] for item in first]
+    assert [item["extra_data"] for item in second] == [
+        item["extra_data"] for item in first
+    ]
+
+    hass.states.async_set("input_boolean.b0", "on")
+    entities[1].value = 2
+    third = await dump()
+    assert data.last_dump_stats.encoded == 2
+    assert third[1]["extra_data"] is not first[1]["extra_data"]
+    assert json_round_trip(third) == [
+        {
+            "state": json_round_trip(hass.states.get("input_boolean.b0")),
+            "extra_data": {"value": 1},
+        },
+        {
+            "state": json_round_trip(hass.states.get("input_boolean.b1")),
+            "extra_data": {"value": 2},
+        },
+    ]
+
+    # States with extra data that can not be serialized are not saved
+    entities[1].value = object()
+    fourth = await dump()
+    assert len(fourth) == 1
+    assert data.last_dump_stats.states == 1
+    assert (
+        "Not saving the state of input_boolean.b1 as its extra data can not be"
+        " serialized" in caplog.text
+    )
+
+
 async def test_load_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     entity = RestoreEntity()
@@ -417,6 +508,56 @@ async def test_state_saved_on_remove(hass: HomeAssistant) -> None:
     assert set(state.attributes["complicated"]["value"]) == {1, 2, now.isoformat()}
 
 
+async def test_load_last_dump(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test states without last_seen were seen at the time of the dump."""
+    last_dump = datetime(2024, 1, 1, tzinfo=dt_util.UTC)
+    last_seen = datetime(2023, 12, 31, tzinfo=dt_util.UTC)
+    hass_storage[STORAGE_KEY] = {
+        "version": 2,
+        "key": STORAGE_KEY,
+        "data": {
+            "last_dump": last_dump.isoformat(),
+            "states": [
+                {"state": State("input_boolean.b0", "on").as_dict()},
+                {
+                    "state": State("input_boolean.b1", "off").as_dict(),
+                    "last_seen": last_seen.isoformat(),
+                },
+            ],
+        },
+    }
+    data = RestoreStateData(hass)
+    await data.async_load()
+
+    assert data.last_states["input_boolean.b0"].last_seen == last_dump
+    assert data.last_states["input_boolean.b1"].last_seen == last_seen
+
+
+async def test_load_version_1(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test loading the states stored by version 1."""
+    last_seen = datetime(2023, 12, 31, tzinfo=dt_util.UTC)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            {
+                "state": State("input_boolean.b0", "on").as_dict(),
+                "last_seen": last_seen.isoformat(),
+            },
+        ],
+    }
+    data = RestoreStateData(hass)
+    await data.async_load()
+
+    stored_state = data.last_states["input_boolean.b0"]
+    assert stored_state.state.state == "on"
+    assert stored_state.last_seen == last_seen
+
+
 async def test_restoring_invalid_entity_id(
     hass: HomeAssistant, hass_storage: dict[str, Any]
 ) -> None:
@@ -515,7 +656,7 @@ async def test_restore_entity_end_to_end(
     await data.async_dump_states()
     await hass.async_block_till_done()
 
-    storage_data = hass_storage[STORAGE_KEY]["data"]
+    storage_data = hass_storage[STORAGE_KEY]["data"]["states"]
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
@@ -530,7 +671,7 @@ async def test_restore_entity_end_to_end(
     await data.async_dump_states()
     await hass.async_block_till_done()
 
-    storage_data = hass_storage[STORAGE_KEY]["data"]
+    storage_data = hass_storage[STORAGE_KEY]["data"]["states"]
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
@@ -38,6 +38,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
     script,
+    service,
     template,
     trace,
 )
@@ -240,6 +241,34 @@ async def test_firing_event_template(hass: HomeAssistant) -> None:
     )
 
 
+async def test_run_not_traced(hass: HomeAssistant) -> None:
+    """Test the steps of a run are not traced when tracing is disabled."""
+    event = "test_event"
+    events = async_capture_events(hass, event)
+
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"event": event},
+            {"condition": "template", "value_template": "{{ true }}"},
+            {
+                "if": {"condition": "template", "value_template": "{{ true }}"},
+                "then": {"event": event},
+            },
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    trace.trace_set_enabled(False)
+    try:
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+    finally:
+        trace.trace_set_enabled(True)
+
+    assert len(events) == 2
+    assert_action_trace({})
+
+
 async def test_calling_service_basic(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -280,6 +309,60 @@ async def test_calling_service_basic(
     )
 
 
+async def test_calling_static_service_multiple_runs(hass: HomeAssistant) -> None:
+    """Test a service call without templates is prepared once for all runs."""
+    calls = async_mock_service(hass, "test", "script")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "action": "test.script",
+            "target": {"entity_id": ["light.kitchen"]},
+            "data": {"hello": "world", "list": [1, 2]},
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch(
+        "homeassistant.helpers.service.async_prepare_call_from_config",
+        wraps=service.async_prepare_call_from_config,
+    ) as mock_prepare:
+        await script_obj.async_run(context=Context())
+        calls[0].data["list"].append(3)
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    assert mock_prepare.call_count == 1
+    assert len(calls) == 2
+    for call in calls[1:]:
+        assert call.data == {
+            "hello": "world",
+            "list": [1, 2],
+            "entity_id": ["light.kitchen"],
+        }
+
+
+async def test_calling_service_registry_id_multiple_runs(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test a service call targeting a registry id follows a renamed entity."""
+    calls = async_mock_service(hass, "test", "script")
+    entry = entity_registry.async_get_or_create("light", "hue", "1234")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        {"action": "test.script", "target": {"entity_id": [entry.id]}}
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    await script_obj.async_run(context=Context())
+    entity_registry.async_update_entity(entry.entity_id, new_entity_id="light.renamed")
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert calls[0].data == {"entity_id": [entry.entity_id]}
+    assert calls[1].data == {"entity_id": ["light.renamed"]}
+
+
 async def test_calling_service_template(hass: HomeAssistant) -> None:
     """Test the calling of a service."""
     context = Context()
@@ -700,6 +700,36 @@ async def test_extract_entity_ids_from_area(
     )
 
 
+@pytest.mark.usefixtures("floor_area_mock")
+async def test_extract_entity_ids_after_registry_change(hass: HomeAssistant) -> None:
+    """Test resolved targets are discarded when the registries change."""
+    own_area = ServiceCall(hass, "light", "turn_on", {"area_id": "own-area"})
+    test_area = ServiceCall(hass, "light", "turn_on", {"area_id": "test-area"})
+    assert await service.async_extract_entity_ids(hass, own_area) == {
+        "light.in_own_area"
+    }
+
+    index = hass.data[service.TARGET_INDEX]
+    resolved = index.async_resolve("area_id", "own-area")
+    assert index.async_resolve("area_id", "own-area") is resolved
+
+    er.async_get(hass).async_update_entity("light.in_area", area_id="own-area")
+    assert await service.async_extract_entity_ids(hass, own_area) == {
+        "light.in_own_area",
+        "light.in_area",
+    }
+    assert await service.async_extract_entity_ids(hass, test_area) == {
+        "light.assigned_to_area",
+    }
+
+    dr.async_get(hass).async_update_device("device-no-area-id", area_id="own-area")
+    assert await service.async_extract_entity_ids(hass, own_area) == {
+        "light.in_own_area",
+        "light.in_area",
+        "light.no_area",
+    }
+
+
 async def test_extract_entity_ids_from_devices(
     hass: HomeAssistant, floor_area_mock
 ) -> None:
@@ -0,0 +1,154 @@
+"""Test the startup timeline."""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+from homeassistant import setup
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import startup_timeline
+from homeassistant.helpers.startup_timeline import (
+    CATEGORY_CONFIG_ENTRY,
+    CATEGORY_INTEGRATION,
+    CATEGORY_LOOP_BLOCKED,
+    CATEGORY_STORAGE,
+    CATEGORY_WAIT,
+    DATA_STARTUP_TIMELINE,
+    StartupTimeline,
+    async_get_timeline,
+    async_setup_timeline,
+    timeline_span,
+)
+
+
+async def test_trace_events() -> None:
+    """Test the spans are exported as Chrome trace events."""
+    timeline = StartupTimeline()
+
+    with timeline.span("outer", "stage", {"key": "value"}):
+        timeline.add_span("inner", "import", timeline.started + 0.5, 0.25)
+
+    events = timeline.as_trace_events()
+    assert [event["ph"] for event in events] == ["M", "M", "X", "X"]
+    assert events[1]["args"] == {"name": asyncio.current_task().get_name()}
+    outer, inner = events[2:]
+    assert outer["name"] == "outer"
+    assert outer["cat"] == "stage"
+    assert outer["args"] == {"key": "value"}
+    assert outer["tid"] == inner["tid"] == 1
+    assert inner == {
+        "name": "inner",
+        "cat": "import",
+        "ph": "X",
+        "ts": 500000,
+        "dur": 250000,
+        "pid": outer["pid"],
+        "tid": 1,
+        "args": {},
+    }
+
+
+async def test_spans_of_tasks_in_own_lanes() -> None:
+    """Test the spans of different tasks are placed in different lanes."""
+    timeline = StartupTimeline()
+
+    async def _record(name: str) -> None:
+        with timeline.span(name, "stage"):
+            await asyncio.sleep(0)
+
+    await asyncio.gather(_record("one"), _record("two"))
+
+    assert len({span.lane for span in timeline.spans}) == 2
+
+
+async def test_finished_task_lane_not_reused() -> None:
+    """Test a new task does not reuse the lane of a finished task."""
+    timeline = StartupTimeline()
+
+    async def _record(name: str) -> None:
+        with timeline.span(name, "stage"):
+            await asyncio.sleep(0)
+
+    for name in ("one", "two", "three"):
+        # Each task is garbage collected before the next one is created
+        await asyncio.create_task(_record(name), name=name)
+
+    assert [span.lane for span in timeline.spans] == [1, 2, 3]
+    assert [event["args"]["name"] for event in timeline.as_trace_events()[1:4]] == [
+        "one",
+        "two",
+        "three",
+    ]
+
+
+async def test_loop_blocked(hass: HomeAssistant) -> None:
+    """Test the intervals the event loop is blocked are recorded."""
+    timeline = StartupTimeline()
+    with patch.object(startup_timeline, "LOOP_CHECK_INTERVAL", 0):
+        timeline.async_start_loop_watch(hass.loop)
+        await asyncio.sleep(0)
+        # Block the event loop
+        blocked_until = time.monotonic() + 0.1
+        while time.monotonic() < blocked_until:
+            pass
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        timeline.async_stop_loop_watch()
+
+    assert [span.category for span in timeline.spans] == [CATEGORY_LOOP_BLOCKED]
+    assert timeline.spans[0].duration >= 0.1
+    assert timeline.spans[0].lane == 0
+
+
+async def test_timeline_span_not_profiling(hass: HomeAssistant) -> None:
+    """Test nothing is recorded when startup is not profiled."""
+    assert async_get_timeline(hass) is None
+    with timeline_span(hass, "load", CATEGORY_STORAGE):
+        pass
+    assert async_get_timeline(hass) is None
+
+
+async def test_setup_spans(hass: HomeAssistant) -> None:
+    """Test the setup of integrations and config entries is recorded."""
+    hass.set_state(CoreState.not_running)
+    timeline = hass.data[DATA_STARTUP_TIMELINE] = StartupTimeline()
+
+    with setup.async_start_setup(
+        hass, integration="august", phase=setup.SetupPhases.SETUP
+    ):
+        pass
+    with (
+        setup.async_start_setup(
+            hass,
+            integration="august",
+            group="entry_id",
+            phase=setup.SetupPhases.CONFIG_ENTRY_SETUP,
+        ),
+        setup.async_pause_setup(hass, setup.SetupPhases.WAIT_IMPORT_PLATFORMS),
+    ):
+        pass
+
+    assert [(span.name, span.category) for span in timeline.spans] == [
+        ("august", CATEGORY_INTEGRATION),
+        ("wait_import_platforms august", CATEGORY_WAIT),
+        ("august (entry_id)", CATEGORY_CONFIG_ENTRY),
+    ]
+
+
+async def test_write_timeline_when_started(hass: HomeAssistant, tmp_path) -> None:
+    """Test the timeline is written when startup is done."""
+    hass.config.config_dir = str(tmp_path)
+    async_setup_timeline(hass)
+    with timeline_span(hass, "load core.config", CATEGORY_STORAGE):
+        pass
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    assert async_get_timeline(hass) is None
+    data = json.loads((tmp_path / startup_timeline.TIMELINE_FILENAME).read_text())
+    assert [event["name"] for event in data["traceEvents"] if event["ph"] == "X"] == [
+        "load core.config"
+    ]
@@ -23,6 +23,7 @@ from homeassistant.helpers import issue_registry as ir, storage
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
+from homeassistant.util.json import load_json
 
 from tests.common import (
     async_fire_time_changed,
@@ -1180,3 +1181,239 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ({"a": 1, "b": [1, 2]}, {"a": 2, "b": [1, 2], "c": {"d": None}}),
+        ({"a": 1, "b": 2}, {"b": 2}),
+        ([1, 2, 3, 4], [1, 3, 4]),
+        ([1, 2, 3], [1, 2, 3, 4, 5]),
+        ([1, 2, 3], [0, 1, 2, 3]),
+        ([{"id": 1, "name": "a"}, {"id": 2}], [{"id": 1, "name": "b"}, {"id": 2}]),
+        ([1, [2, 3]], {"list": [1, [2, 3]]}),
+        ({"1": "a"}, {1: "b"}),
+        ([], []),
+    ],
+)
+def test_journal_diff_round_trip(old: Any, new: Any) -> None:
+    """Test the journal operations turn the old data into the new data."""
+    ops: list[list[Any]] = []
+    storage._json_diff(old, new, [], ops)
+    replayed = storage._json_apply(
+        json.loads(json_bytes(old)), json.loads(json_bytes(ops))
+    )
+    assert replayed == json.loads(json_bytes(new))
+
+
+def test_journal_diff_small_changes() -> None:
+    """Test small changes of large data are small journal operations."""
+    old = {"items": [{"id": idx, "name": f"item {idx}"} for idx in range(100)]}
+    new = {"items": [*old["items"][:50], *old["items"][51:]]}
+    new["items"][0] = {"id": 0, "name": "renamed"}
+    ops: list[list[Any]] = []
+    storage._json_diff(old, new, [], ops)
+    assert ops == [
+        ["s", ["items", 0, "name"], "renamed"],
+        ["r", ["items"], 50, 51, []],
+    ]
+
+    ops = []
+    storage._json_diff(old, old, [], ops)
+    assert ops == []
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ({"value": 1}, {"value": 1.0}),
+        ({"value": 0}, {"value": False}),
+        ([True, 2], [1, 2]),
+        ({"items": [{"value": 1.0}]}, {"items": [{"value": 1}]}),
+        ([1, 2, 3], [1.0, 2, 3, 4]),
+    ],
+)
+def test_journal_diff_type_changes(old: Any, new: Any) -> None:
+    """Test values that are equal but of another type are journaled."""
+    ops: list[list[Any]] = []
+    storage._json_diff(old, new, [], ops)
+    replayed = storage._json_apply(
+        json.loads(json_bytes(old)), json.loads(json_bytes(ops))
+    )
+    assert json_bytes(replayed) == json_bytes(new)
+
+
+def test_journal_apply_failure_keeps_data() -> None:
+    """Test a record that does not apply leaves the data unchanged."""
+    data = {"items": [{"id": 1}], "count": 1}
+    with pytest.raises(IndexError):
+        storage._json_apply(
+            data,
+            [
+                ["s", ["count"], 2],
+                ["s", ["items", 0, "id"], 2],
+                ["d", ["items", 5]],
+            ],
+        )
+    assert data == {"items": [{"id": 1}], "count": 1}
+
+
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the journal and replayed when loading."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": idx, "name": f"item {idx}"} for idx in range(10)]
+
+        def _read_files() -> tuple[str, str | None]:
+            with open(store.path, encoding="utf8") as fp:
+                main = fp.read()
+            if not os.path.exists(store.journal_path):
+                return main, None
+            with open(store.journal_path, encoding="utf8") as fp:
+                return main, fp.read()
+
+        await store.async_save({"items": items})
+        main, journal = await hass.async_add_executor_job(_read_files)
+        assert json.loads(main)["journal_generation"] == 1
+        assert journal is None
+
+        items = [{"id": 0, "name": "renamed"}, *items[1:], {"id": 10, "name": "new"}]
+        await store.async_save({"items": items})
+        # Saving unchanged data does not grow the journal
+        await store.async_save({"items": list(items)})
+        new_main, journal = await hass.async_add_executor_job(_read_files)
+        assert new_main == main
+        assert journal.splitlines() == [
+            json.dumps(
+                {
+                    "generation": 1,
+                    "ops": [
+                        ["s", ["items", 0, "name"], "renamed"],
+                        ["r", ["items"], 10, 10, [{"id": 10, "name": "new"}]],
+                    ],
+                },
+                separators=(",", ":"),
+            )
+        ]
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {"items": items}
+
+        # The first save after loading rewrites the main file
+        with patch.object(storage, "JOURNAL_COMPACT_RATIO", 0):
+            await store2.async_save({"items": items[1:]})
+            main, journal = await hass.async_add_executor_job(_read_files)
+            assert json.loads(main)["journal_generation"] == 2
+            assert journal is None
+
+            # The journal is compacted into the main file once it grows too large
+            await store2.async_save({"items": items[2:]})
+            main, journal = await hass.async_add_executor_job(_read_files)
+            assert json.loads(main)["journal_generation"] == 2
+            assert journal is not None
+
+            await store2.async_save({"items": items[3:]})
+            main, journal = await hass.async_add_executor_job(_read_files)
+            assert json.loads(main)["journal_generation"] == 3
+            assert journal is None
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == {"items": items[3:]}
+
+        await store2.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the main file at the final write."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"a": 1})
+        await store.async_save({"a": 2})
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        hass.set_state(CoreState.stopping)
+        # A save while stopping is written at the final write
+        store.async_delay_save(lambda: {"a": 3}, 5)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        data = await hass.async_add_executor_job(load_json, store.path)
+        assert data["data"] == {"a": 3}
+        assert data["journal_generation"] == 2
+
+        # Without a pending save the data of the journal is written
+        hass.set_state(CoreState.running)
+        await store.async_save({"a": 4})
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        data = await hass.async_add_executor_job(load_json, store.path)
+        assert data["data"] == {"a": 4}
+        assert data["journal_generation"] == 3
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_unserializable_changes(tmpdir: py.path.local) -> None:
+    """Test changes the journal can not encode are written to the main file."""
+
+    class _Custom:
+        """An object only the encoder of the store can encode."""
+
+    class _CustomEncoder(json.JSONEncoder):
+        """Encode _Custom objects."""
+
+        def default(self, o: Any) -> Any:
+            """Encode _Custom objects as a string."""
+            if isinstance(o, _Custom):
+                return "custom"
+            return super().default(o)
+
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, encoder=_CustomEncoder, journal=True
+        )
+        await store.async_save({"a": 1})
+        await store.async_save({"a": _Custom()})
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {"a": "custom"}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_replay_skips_stale_records(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test records of other generations and incomplete records are not replayed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"a": 1})
+
+        def _write_journal() -> None:
+            with open(store.journal_path, "w", encoding="utf8") as fp:
+                fp.write('{"generation":0,"ops":[["s",["a"],2]]}\n')
+                fp.write('{"generation":1,"ops":[["s",["b"],3]]}\n')
+                fp.write('{"generation":1,"ops":[["s",["a"],')
+
+        await hass.async_add_executor_job(_write_journal)
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {"a": 1, "b": 3}
+        assert f"Ignoring incomplete journal record of {MOCK_KEY}" in caplog.text
+
+        await hass.async_stop(force=True)
@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -5169,9 +5170,110 @@ async def test_cache_garbage_collection() -> None:
     del tpl
     assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
+    # The compiled code is still referenced by the LRU
+    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    template.CACHED_COMPILED_TEMPLATE_LRU.clear()
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_code_shared(hass: HomeAssistant) -> None:
+    """Test compiled code is shared by templates with the same source."""
+    template_string = "{{ states('sensor.compiled_code_shared') }}"
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    compiled_code = tpl._compiled_code
+    assert compiled_code is not None
+    del tpl
+
+    # Templates created after the first one was released, for example
+    # when reloading, reuse the compiled code
+    tpl = template.Template(template_string, hass)
+    with patch.object(jinja2.Environment, "compile", side_effect=AssertionError):
+        tpl.ensure_valid()
+    assert tpl._compiled_code is compiled_code
+    assert tpl.async_render() == "unknown"
+
+    # The limited and strict environments are cached separately
+    env = template.TemplateEnvironment(hass, limited=True)
+    assert env.compile(template_string) is not compiled_code
+    assert template.CACHED_COMPILED_TEMPLATE_LRU[
+        (template_string, True, False)
+    ] is env.compile(template_string)
+
+
+@pytest.mark.parametrize(
+    "template_string",
+    [
+        "{{ states('sensor.fast') }}",
+        '{{states("sensor.missing")}}',
+        "{{ states('sensor.fast') | float }}",
+        "{{ states('sensor.text') | float(0) }}",
+        "{{ states('sensor.missing') | float(-1.5) }}",
+        "{{ states('sensor.fast') | float > 20 }}",
+        "{{ states('sensor.fast') | float(0) <= 21.5 }}",
+        "{{ states('sensor.text') | float(0) == 0 }}",
+        "{{ state_attr('sensor.fast', 'unit') }}",
+        "{{ state_attr('sensor.fast', 'missing') }}",
+        "{{ state_attr('sensor.fast', 'options') }}",
+        "{{ is_state('sensor.text', 'on') }}",
+        "{{ is_state('sensor.fast', 'on') }}",
+    ],
+)
+async def test_fast_render(hass: HomeAssistant, template_string: str) -> None:
+    """Test trivial templates render the same with and without jinja."""
+    hass.states.async_set(
+        "sensor.fast", "21.5", {"unit": "°C", "options": {"a": [1, 2]}}
+    )
+    hass.states.async_set("sensor.text", "on")
+
+    tpl = template.Template(template_string, hass)
+    info = tpl.async_render_to_info()
+    assert tpl._fast_render is not None
+
+    with patch("homeassistant.helpers.template._fast_render_for", return_value=None):
+        jinja_tpl = template.Template(template_string, hass)
+        jinja_info = jinja_tpl.async_render_to_info()
+    assert jinja_tpl._fast_render is None
+
+    assert info.result() == jinja_info.result()
+    assert info.entities == jinja_info.entities
+    assert info.all_states == jinja_info.all_states
+    assert info.all_states_lifecycle == jinja_info.all_states_lifecycle
+    assert info.domains == jinja_info.domains
+
+
+async def test_fast_render_fallback(hass: HomeAssistant) -> None:
+    """Test trivial templates fall back to jinja when needed."""
+    hass.states.async_set("sensor.text", "on")
+
+    tpl = template.Template("{{ states('sensor.text') | float }}", hass)
+    with pytest.raises(TemplateError, match="float got invalid input 'on'"):
+        tpl.async_render()
+    assert tpl._fast_render is not None
+
+    # Variables shadowing the globals are rendered by jinja
+    tpl = template.Template("{{ states('sensor.text') }}", hass)
+    assert tpl.async_render({"states": lambda entity_id: entity_id}) == ("sensor.text")
+    assert tpl.async_render() == "on"
+
+    # Limited templates do not have the globals
+    tpl = template.Template("{{ states('sensor.text') }}", hass)
+    with pytest.raises(TemplateError):
+        tpl.async_render(limited=True)
+    assert tpl._fast_render is None
+
+    # Other templates are not handled
+    for template_string in (
+        "{{ states('sensor.text') | int(0) }}",
+        "{{ states('sensor.text') }} W",
+        "{{ states('sensor.te\\'xt') }}",
+        "{{ states.sensor.text.state }}",
+    ):
+        tpl = template.Template(template_string, hass)
+        tpl.async_render()
+        assert tpl._fast_render is None
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -12,7 +12,7 @@ import requests
 
 from homeassistant import config_entries
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import CoreState, HomeAssistant, StateMachine, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -21,7 +21,7 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import frame, update_coordinator
 from homeassistant.util.dt import utcnow
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import MockConfigEntry, MockEntityPlatform, async_fire_time_changed
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -453,6 +453,40 @@ async def test_coordinator_entity(
     assert len(crd._listeners) == 0
 
 
+async def test_coordinator_entities_write_states_in_batch(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test coordinator entities write their states in one batch."""
+    platform = MockEntityPlatform(hass, domain="test")
+    entities = [update_coordinator.CoordinatorEntity(crd) for _ in range(3)]
+    for idx, coordinator_entity in enumerate(entities):
+        coordinator_entity.entity_id = f"test.entity_{idx}"
+    await platform.async_add_entities(entities)
+
+    with patch.object(
+        StateMachine,
+        "async_set_many",
+        autospec=True,
+        side_effect=StateMachine.async_set_many,
+    ) as mock_set_many:
+        crd.async_set_updated_data(100)
+        assert mock_set_many.call_count == 1
+        updates = mock_set_many.call_args[0][1]
+        assert [update.entity_id for update in updates] == [
+            "test.entity_0",
+            "test.entity_1",
+            "test.entity_2",
+        ]
+
+        # States are written right away outside of a coordinator update
+        entities[0]._handle_coordinator_update()
+        assert mock_set_many.call_count == 1
+
+    # Remove the entities to avoid lingering timers
+    await platform.async_reset()
+
+
 async def test_async_set_updated_data(
     crd: update_coordinator.DataUpdateCoordinator[int],
 ) -> None:
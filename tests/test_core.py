@@ -1117,6 +1117,27 @@ def test_state_as_compressed_state_json() -> None:
     assert state.as_compressed_state_json is as_compressed_state
 
 
+async def test_state_attributes_json_fragment_shared(hass: HomeAssistant) -> None:
+    """Test the attributes JSON fragment is shared while the attributes are."""
+    hass.states.async_set("light.bowl", "on", {"pig": "dog"})
+    state1 = hass.states.get("light.bowl")
+    assert state1.as_compressed_state_json.startswith(
+        b'"light.bowl":{"s":"on","a":{"pig":"dog"},"c":'
+    )
+    fragment = state1.attributes_json_fragment
+
+    hass.states.async_set("light.bowl", "off", {"pig": "dog"})
+    state2 = hass.states.get("light.bowl")
+    assert state2.attributes is state1.attributes
+    assert state2.attributes_json_fragment is fragment
+    assert b'"state":"off","attributes":{"pig":"dog"}' in state2.as_dict_json
+
+    hass.states.async_set("light.bowl", "off", {"pig": "cat"})
+    state3 = hass.states.get("light.bowl")
+    assert state3.attributes_json_fragment is not fragment
+    assert b'"state":"off","attributes":{"pig":"cat"}' in state3.as_dict_json
+
+
 async def test_eventbus_add_remove_listener(hass: HomeAssistant) -> None:
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -1165,6 +1186,186 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can listen for events indexed by a key."""
+    calls: list[tuple[str, ha.Event]] = []
+
+    @ha.callback
+    def key_getter(event_data):
+        """Return the key of an event."""
+        return event_data.get("key")
+
+    @ha.callback
+    def listener_a(event):
+        """Mock listener for key a."""
+        calls.append(("a", event))
+
+    @ha.callback
+    def listener_ab(event):
+        """Mock listener for keys a and b."""
+        calls.append(("ab", event))
+
+    @ha.callback
+    def listener_all(event):
+        """Mock listener for all keys."""
+        calls.append(("all", event))
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub_a = hass.bus.async_listen_keyed("test", key_getter, "a", listener_a)
+    unsub_ab = hass.bus.async_listen_keyed("test", key_getter, ["a", "b"], listener_ab)
+    # All listeners sharing a key getter are counted as one index
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+
+    hass.bus.async_fire("test", {"key": "a"})
+    hass.bus.async_fire("test", {"key": "b"})
+    hass.bus.async_fire("test", {"key": "c"})
+    hass.bus.async_fire("test", {})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert [(name, event.data["key"]) for name, event in calls] == [
+        ("a", "a"),
+        ("ab", "a"),
+        ("ab", "b"),
+    ]
+
+    # MATCH_ALL is a plain key unless the index matches all keys
+    calls.clear()
+    unsub_key_all = hass.bus.async_listen_keyed(
+        "test", key_getter, ha.MATCH_ALL, listener_all
+    )
+    hass.bus.async_fire("test", {"key": "c"})
+    hass.bus.async_fire("test", {"key": ha.MATCH_ALL})
+    await hass.async_block_till_done()
+    assert [(name, event.data["key"]) for name, event in calls] == [
+        ("all", ha.MATCH_ALL)
+    ]
+    unsub_key_all()
+
+    calls.clear()
+    unsub_all = hass.bus.async_listen_keyed(
+        "test", key_getter, ha.MATCH_ALL, listener_all, match_all=True
+    )
+    unsub_a_all = hass.bus.async_listen_keyed(
+        "test", key_getter, "a", listener_a, match_all=True
+    )
+    hass.bus.async_fire("test", {"key": "c"})
+    hass.bus.async_fire("test", {"key": "a"})
+    hass.bus.async_fire("test", {})
+    await hass.async_block_till_done()
+    assert [(name, event.data["key"]) for name, event in calls] == [
+        ("all", "c"),
+        ("a", "a"),
+        ("ab", "a"),
+        ("a", "a"),
+        ("all", "a"),
+    ]
+
+    calls.clear()
+    unsub_a()
+    unsub_all()
+    unsub_a_all()
+    hass.bus.async_fire("test", {"key": "a"})
+    await hass.async_block_till_done()
+    assert [(name, event.data["key"]) for name, event in calls] == [("ab", "a")]
+
+    unsub_ab()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+
+async def test_eventbus_keyed_listener_order(hass: HomeAssistant) -> None:
+    """Test an index of keyed listeners runs in the order it was added."""
+    calls: list[str] = []
+
+    @ha.callback
+    def key_getter(event_data):
+        """Return the key of an event."""
+        return event_data["key"]
+
+    @ha.callback
+    def listener_before(event):
+        """Mock listener added before the index."""
+        calls.append("before")
+
+    @ha.callback
+    def listener_keyed(event):
+        """Mock keyed listener."""
+        calls.append("keyed")
+
+    @ha.callback
+    def listener_after(event):
+        """Mock listener added after the index."""
+        calls.append("after")
+
+    hass.bus.async_listen("test", listener_before)
+    hass.bus.async_listen_keyed("test", key_getter, "a", listener_keyed)
+    hass.bus.async_listen("test", listener_after)
+    # Another key of the index does not move it
+    hass.bus.async_listen_keyed("test", key_getter, "b", listener_keyed)
+
+    hass.bus.async_fire("test", {"key": "a"})
+    await hass.async_block_till_done()
+    assert calls == ["before", "keyed", "after"]
+
+
+async def test_eventbus_keyed_listener_dispatch_soon(hass: HomeAssistant) -> None:
+    """Test keyed listeners can be dispatched in the next loop iteration."""
+    calls = []
+
+    @ha.callback
+    def key_getter(event_data):
+        """Return the key of an event."""
+        return event_data["key"]
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", key_getter, "a", listener, dispatch_soon=True
+    )
+    hass.bus.async_fire("test", {"key": "a"})
+    assert len(calls) == 0
+    await asyncio.sleep(0)
+    assert len(calls) == 1
+    unsub()
+
+
+async def test_eventbus_keyed_listener_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test errors in keyed listeners and key getters are logged."""
+
+    @ha.callback
+    def bad_key_getter(event_data):
+        """Raise in the key getter."""
+        raise ValueError("bad key getter")
+
+    @ha.callback
+    def key_getter(event_data):
+        """Return the key of an event."""
+        return event_data["key"]
+
+    @ha.callback
+    def bad_listener(event):
+        """Raise in the listener."""
+        raise ValueError("bad listener")
+
+    def not_a_callback(event_data):
+        """Return the key of an event."""
+        return event_data["key"]
+
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_keyed("test", not_a_callback, "a", bad_listener)
+
+    hass.bus.async_listen_keyed("test", bad_key_getter, "a", bad_listener)
+    hass.bus.async_listen_keyed("test", key_getter, "a", bad_listener)
+    hass.bus.async_fire("test", {"key": "a"})
+    await hass.async_block_till_done()
+    assert "Error in event key getter" in caplog.text
+    assert "Error while dispatching event for a" in caplog.text
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1372,6 +1573,22 @@ def test_state_init() -> None:
         ha.State("domain.long_state", "t" * 256)
 
 
+def test_state_cache_allocated_when_used() -> None:
+    """Test the cache of a state is only allocated by a cached property."""
+    state = ha.State("light.kitchen", "on")
+    with pytest.raises(AttributeError):
+        object.__getattribute__(state, "_cache")
+    assert state.last_changed_timestamp == state.last_updated_timestamp
+    with pytest.raises(AttributeError):
+        object.__getattribute__(state, "_cache")
+
+    assert state.name == "kitchen"
+    assert object.__getattribute__(state, "_cache") == {"name": "kitchen"}
+
+    with pytest.raises(AttributeError, match="'State' object has no attribute 'x'"):
+        state.x  # noqa: B018
+
+
 def test_state_domain() -> None:
     """Test domain."""
     state = ha.State("some_domain.hello", "world")
@@ -1560,6 +1777,42 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states in one batch."""
+    hass.states.async_set("light.bowl", "off", {"brightness": 10})
+    hass.states.async_set("light.kitchen", "on")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    entity_context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ha.StateUpdate("light.bowl", "on", {"brightness": 10}),
+            ha.StateUpdate("light.kitchen", "on"),
+            ha.StateUpdate("light.new", "off"),
+            ha.StateUpdate("light.other", "off", context=entity_context),
+        ],
+        timestamp=1234.5,
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.new",
+        "light.other",
+    ]
+    bowl = hass.states.get("light.bowl")
+    new = hass.states.get("light.new")
+    assert bowl.state == "on"
+    assert bowl.attributes == {"brightness": 10}
+    assert bowl.last_updated_timestamp == 1234.5
+    assert new.last_updated == bowl.last_updated
+    # Unchanged states are reported with the timestamp of the batch
+    assert hass.states.get("light.kitchen").last_reported_timestamp == 1234.5
+    # Updates without a context share the context of the batch
+    assert bowl.context is new.context
+    assert hass.states.get("light.other").context is entity_context
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
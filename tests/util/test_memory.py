@@ -0,0 +1,71 @@
+"""Test memory usage helpers."""
+
+import sys
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.memory import (
+    DomainMemoryUsage,
+    deep_getsizeof,
+    states_memory_usage,
+)
+
+
+def test_deep_getsizeof() -> None:
+    """Test the size of an object and the objects it references."""
+    shared = "x" * 100
+    obj = {"shared": [shared, shared]}
+    size = (
+        sys.getsizeof(obj)
+        + sys.getsizeof("shared")
+        + sys.getsizeof(obj["shared"])
+        + sys.getsizeof(shared)
+    )
+    assert deep_getsizeof(obj) == size
+
+    # Objects counted before are not counted again
+    seen: set[int] = set()
+    assert deep_getsizeof(shared, seen) == sys.getsizeof(shared)
+    assert deep_getsizeof(obj, seen) == size - sys.getsizeof(shared)
+    assert deep_getsizeof(obj, seen) == 0
+
+    # Classes and functions are not counted
+    types = [str, test_deep_getsizeof]
+    assert deep_getsizeof(types) == sys.getsizeof(types)
+
+
+def test_deep_getsizeof_instance_dict() -> None:
+    """Test the values of an instance dict are counted."""
+
+    class Holder:
+        """Hold a value."""
+
+        def __init__(self, value: list[str]) -> None:
+            """Initialize the holder."""
+            self.value = value
+
+    value = ["x" * 100]
+    holder = Holder(value)
+    assert deep_getsizeof(holder.__dict__) == (
+        sys.getsizeof(holder.__dict__)
+        + sys.getsizeof("value")
+        + sys.getsizeof(value)
+        + sys.getsizeof(value[0])
+    )
+
+
+async def test_states_memory_usage(hass: HomeAssistant) -> None:
+    """Test the memory used by states per domain."""
+    for idx in range(3):
+        hass.states.async_set(f"light.light_{idx}", "on", {"brightness": 255})
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "20", {"unit_of_measurement": "W"})
+
+    usage = states_memory_usage(hass.states.async_all())
+    assert list(usage) == ["light", "sensor"]
+    assert usage["light"].states == 3
+    assert usage["sensor"].states == 1
+    # The sensor keeps the previous state alive through its context
+    assert usage["sensor"].size > usage["light"].size / 3
+
+    assert states_memory_usage([]) == {}
+    assert isinstance(usage["light"], DomainMemoryUsage)